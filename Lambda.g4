@@ -2,23 +2,73 @@ grammar Lambda;
 
 prog: expr EOF;
 
+// Program files hold independent expressions separated by ';'. Statements are
+// parsed one at a time from a single token stream, so a file can be consumed
+// lazily instead of as one tree.
+program: (statement | SEMI)* EOF;
+
+statement: expr (SEMI | EOF);
+
+// Precedence is spelled out as one rule per layer, loosest first. Lambda
+// bodies and `not` operands extend as far to the right as possible. At the
+// start of an expression they are parsed at their own layer; anywhere else
+// they can only be a trailing operand, the last thing in an application
+// chain or the right-hand side of an operator, after which only what binds
+// looser than them can follow. `if` and `let` may only close an application
+// chain. Only input with a trailing operand that is followed by an operator is
+// ambiguous (the operand takes it). Because trailing operands can be followed
+// by operators at all, SLL prediction cannot tell from a single token whether
+// an operator loop continues, so the plain LL front-end falls back to full
+// context there; the two-stage SLL front-end just takes the greedy choice.
 expr
-    : atom                                 # AtomExpr
-    | abstraction                          # AbstractionExpr
-    | expr expr                            # ApplicationExpr
-    | '(' expr ')'                         # ParenExpr
-    | 'if' expr 'then' expr 'else' expr    # IfExpr
-    | 'let' ID '=' expr 'in' expr          # LetExpr
-    | expr op=('*'|'/'|'%') expr           # MulDivExpr
-    | expr op=('+'|'-') expr               # AddSubExpr
-    | expr op=('<'|'>'|'<='|'>='|'=='|'!=') expr # ComparisonExpr
-    | op=('not'|'!') expr                  # NotExpr
-    | expr op=('and'|'&&') expr            # AndExpr
-    | expr op=('or'|'||') expr             # OrExpr
-    | '[' (expr (',' expr)*)? ']'          # ListExpr
-    | '[' expr ',' expr '..' expr ']'      # FullRangeExpr
-    | '[' expr '..' expr ']'               # SimpleRangeExpr
-    | '(' (expr (',' expr)+)? ')'          # TupleExpr
+    : abstraction                               # AbstractionExpr
+    | orExpr                                    # OperatorExpr
+    ;
+
+orExpr: andExpr (('or'|'||') (andExpr | abstraction))*;
+
+andExpr: unaryExpr (('and'|'&&') (unaryExpr | abstraction))*;
+
+unaryExpr
+    : notExpr
+    | comparisonExpr
+    ;
+
+notExpr: op=('not'|'!') (unaryExpr | abstraction);
+
+comparisonExpr
+    : addSubExpr (ops+=('<'|'>'|'<='|'>='|'=='|'!=') (addSubExpr | trailing))*
+    ;
+
+addSubExpr: mulDivExpr (ops+=('+'|'-') (mulDivExpr | trailing))*;
+
+mulDivExpr: applicationExpr (ops+=('*'|'/'|'%') (applicationExpr | trailing))*;
+
+applicationExpr
+    : primary+ (tail | trailing)?
+    | tail
+    ;
+
+tail
+    : 'if' expr 'then' expr 'else' (applicationExpr | trailing) # IfExpr
+    | 'let' ID '=' expr 'in' (applicationExpr | trailing)       # LetExpr
+    ;
+
+trailing
+    : abstraction
+    | notExpr
+    ;
+
+primary
+    : atom                                      # AtomExpr
+    | '(' (expr (',' expr)*)? ')'               # ParenExpr
+    | '[' bracketBody? ']'                      # BracketExpr
+    ;
+
+bracketBody
+    : expr ( dots='..' expr
+           | ',' expr ( dots='..' expr | (',' expr)* )
+           )?
     ;
 
 abstraction
@@ -32,8 +82,9 @@ atom
     | STRING
     ;
 
+SEMI: ';';
 BOOLEAN: 'true' | 'false';
 NUMBER: '-'? [0-9_]+ ('.' [0-9]+)? ([eE] [-+]? [0-9]+)?;
 STRING: '"' ( ~["\\] | '\\' ["\\] )* '"';
 ID: [a-zA-Z_] [a-zA-Z0-9_]*;
-WS: [ \t\n\r]+ -> skip;
\ No newline at end of file
+WS: [ \t\n\r]+ -> skip;
@@ -10,87 +10,88 @@ else:
 
 def serializedATN():
     return [
-        4,0,37,225,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,38,228,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
         26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
-        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,1,0,1,0,1,1,1,1,1,2,1,
-        2,1,2,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,
-        6,1,6,1,7,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,
-        1,13,1,13,1,14,1,14,1,15,1,15,1,15,1,16,1,16,1,16,1,17,1,17,1,17,
-        1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,20,1,20,1,21,1,21,1,21,1,21,
-        1,22,1,22,1,22,1,23,1,23,1,23,1,24,1,24,1,24,1,25,1,25,1,26,1,26,
-        1,27,1,27,1,28,1,28,1,28,1,29,1,29,1,29,1,30,1,30,1,31,1,31,1,32,
-        1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,172,8,32,1,33,3,33,
-        175,8,33,1,33,4,33,178,8,33,11,33,12,33,179,1,33,1,33,4,33,184,8,
-        33,11,33,12,33,185,3,33,188,8,33,1,33,1,33,3,33,192,8,33,1,33,4,
-        33,195,8,33,11,33,12,33,196,3,33,199,8,33,1,34,1,34,1,34,1,34,5,
-        34,205,8,34,10,34,12,34,208,9,34,1,34,1,34,1,35,1,35,5,35,214,8,
-        35,10,35,12,35,217,9,35,1,36,4,36,220,8,36,11,36,12,36,221,1,36,
-        1,36,0,0,37,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,
-        23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,
-        45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,
-        67,34,69,35,71,36,73,37,1,0,8,2,0,48,57,95,95,1,0,48,57,2,0,69,69,
-        101,101,2,0,43,43,45,45,2,0,34,34,92,92,3,0,65,90,95,95,97,122,4,
-        0,48,57,65,90,95,95,97,122,3,0,9,10,13,13,32,32,236,0,1,1,0,0,0,
-        0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,
-        1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,
-        1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,
-        1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,
-        1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,
-        1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,
-        1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,
-        1,0,0,0,1,75,1,0,0,0,3,77,1,0,0,0,5,79,1,0,0,0,7,82,1,0,0,0,9,87,
-        1,0,0,0,11,92,1,0,0,0,13,96,1,0,0,0,15,98,1,0,0,0,17,101,1,0,0,0,
-        19,103,1,0,0,0,21,105,1,0,0,0,23,107,1,0,0,0,25,109,1,0,0,0,27,111,
-        1,0,0,0,29,113,1,0,0,0,31,115,1,0,0,0,33,118,1,0,0,0,35,121,1,0,
-        0,0,37,124,1,0,0,0,39,127,1,0,0,0,41,131,1,0,0,0,43,133,1,0,0,0,
-        45,137,1,0,0,0,47,140,1,0,0,0,49,143,1,0,0,0,51,146,1,0,0,0,53,148,
-        1,0,0,0,55,150,1,0,0,0,57,152,1,0,0,0,59,155,1,0,0,0,61,158,1,0,
-        0,0,63,160,1,0,0,0,65,171,1,0,0,0,67,174,1,0,0,0,69,200,1,0,0,0,
-        71,211,1,0,0,0,73,219,1,0,0,0,75,76,5,40,0,0,76,2,1,0,0,0,77,78,
-        5,41,0,0,78,4,1,0,0,0,79,80,5,105,0,0,80,81,5,102,0,0,81,6,1,0,0,
-        0,82,83,5,116,0,0,83,84,5,104,0,0,84,85,5,101,0,0,85,86,5,110,0,
-        0,86,8,1,0,0,0,87,88,5,101,0,0,88,89,5,108,0,0,89,90,5,115,0,0,90,
-        91,5,101,0,0,91,10,1,0,0,0,92,93,5,108,0,0,93,94,5,101,0,0,94,95,
-        5,116,0,0,95,12,1,0,0,0,96,97,5,61,0,0,97,14,1,0,0,0,98,99,5,105,
-        0,0,99,100,5,110,0,0,100,16,1,0,0,0,101,102,5,42,0,0,102,18,1,0,
-        0,0,103,104,5,47,0,0,104,20,1,0,0,0,105,106,5,37,0,0,106,22,1,0,
-        0,0,107,108,5,43,0,0,108,24,1,0,0,0,109,110,5,45,0,0,110,26,1,0,
-        0,0,111,112,5,60,0,0,112,28,1,0,0,0,113,114,5,62,0,0,114,30,1,0,
-        0,0,115,116,5,60,0,0,116,117,5,61,0,0,117,32,1,0,0,0,118,119,5,62,
-        0,0,119,120,5,61,0,0,120,34,1,0,0,0,121,122,5,61,0,0,122,123,5,61,
-        0,0,123,36,1,0,0,0,124,125,5,33,0,0,125,126,5,61,0,0,126,38,1,0,
-        0,0,127,128,5,110,0,0,128,129,5,111,0,0,129,130,5,116,0,0,130,40,
-        1,0,0,0,131,132,5,33,0,0,132,42,1,0,0,0,133,134,5,97,0,0,134,135,
-        5,110,0,0,135,136,5,100,0,0,136,44,1,0,0,0,137,138,5,38,0,0,138,
-        139,5,38,0,0,139,46,1,0,0,0,140,141,5,111,0,0,141,142,5,114,0,0,
-        142,48,1,0,0,0,143,144,5,124,0,0,144,145,5,124,0,0,145,50,1,0,0,
-        0,146,147,5,91,0,0,147,52,1,0,0,0,148,149,5,44,0,0,149,54,1,0,0,
-        0,150,151,5,93,0,0,151,56,1,0,0,0,152,153,5,46,0,0,153,154,5,46,
-        0,0,154,58,1,0,0,0,155,156,5,1054,0,0,156,157,5,187,0,0,157,60,1,
-        0,0,0,158,159,5,92,0,0,159,62,1,0,0,0,160,161,5,46,0,0,161,64,1,
-        0,0,0,162,163,5,116,0,0,163,164,5,114,0,0,164,165,5,117,0,0,165,
-        172,5,101,0,0,166,167,5,102,0,0,167,168,5,97,0,0,168,169,5,108,0,
-        0,169,170,5,115,0,0,170,172,5,101,0,0,171,162,1,0,0,0,171,166,1,
-        0,0,0,172,66,1,0,0,0,173,175,5,45,0,0,174,173,1,0,0,0,174,175,1,
-        0,0,0,175,177,1,0,0,0,176,178,7,0,0,0,177,176,1,0,0,0,178,179,1,
-        0,0,0,179,177,1,0,0,0,179,180,1,0,0,0,180,187,1,0,0,0,181,183,5,
-        46,0,0,182,184,7,1,0,0,183,182,1,0,0,0,184,185,1,0,0,0,185,183,1,
-        0,0,0,185,186,1,0,0,0,186,188,1,0,0,0,187,181,1,0,0,0,187,188,1,
-        0,0,0,188,198,1,0,0,0,189,191,7,2,0,0,190,192,7,3,0,0,191,190,1,
-        0,0,0,191,192,1,0,0,0,192,194,1,0,0,0,193,195,7,1,0,0,194,193,1,
-        0,0,0,195,196,1,0,0,0,196,194,1,0,0,0,196,197,1,0,0,0,197,199,1,
-        0,0,0,198,189,1,0,0,0,198,199,1,0,0,0,199,68,1,0,0,0,200,206,5,34,
-        0,0,201,205,8,4,0,0,202,203,5,92,0,0,203,205,7,4,0,0,204,201,1,0,
-        0,0,204,202,1,0,0,0,205,208,1,0,0,0,206,204,1,0,0,0,206,207,1,0,
-        0,0,207,209,1,0,0,0,208,206,1,0,0,0,209,210,5,34,0,0,210,70,1,0,
-        0,0,211,215,7,5,0,0,212,214,7,6,0,0,213,212,1,0,0,0,214,217,1,0,
-        0,0,215,213,1,0,0,0,215,216,1,0,0,0,216,72,1,0,0,0,217,215,1,0,0,
-        0,218,220,7,7,0,0,219,218,1,0,0,0,220,221,1,0,0,0,221,219,1,0,0,
-        0,221,222,1,0,0,0,222,223,1,0,0,0,223,224,6,36,0,0,224,74,1,0,0,
-        0,13,0,171,174,179,185,187,191,196,198,204,206,215,221,1,6,0,0
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,1,0,1,0,1,0,
+        1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,5,1,5,
+        1,6,1,6,1,7,1,7,1,8,1,8,1,8,1,9,1,9,1,9,1,10,1,10,1,10,1,11,1,11,
+        1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,15,1,15,1,16,1,16,1,17,1,17,
+        1,17,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,20,1,20,
+        1,20,1,20,1,21,1,21,1,22,1,22,1,22,1,23,1,23,1,24,1,24,1,25,1,25,
+        1,26,1,26,1,27,1,27,1,28,1,28,1,28,1,29,1,29,1,30,1,30,1,31,1,31,
+        1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,3,33,175,
+        8,33,1,34,3,34,178,8,34,1,34,4,34,181,8,34,11,34,12,34,182,1,34,
+        1,34,4,34,187,8,34,11,34,12,34,188,3,34,191,8,34,1,34,1,34,3,34,
+        195,8,34,1,34,4,34,198,8,34,11,34,12,34,199,3,34,202,8,34,1,35,1,
+        35,1,35,1,35,5,35,208,8,35,10,35,12,35,211,9,35,1,35,1,35,1,36,1,
+        36,5,36,217,8,36,10,36,12,36,220,9,36,1,37,4,37,223,8,37,11,37,12,
+        37,224,1,37,1,37,0,0,38,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,
+        19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,
+        41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,
+        63,32,65,33,67,34,69,35,71,36,73,37,75,38,1,0,8,2,0,48,57,95,95,
+        1,0,48,57,2,0,69,69,101,101,2,0,43,43,45,45,2,0,34,34,92,92,3,0,
+        65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,3,0,9,10,13,13,32,
+        32,239,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,
+        0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,
+        0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,
+        0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,
+        0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,
+        0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,
+        0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,
+        0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,1,77,1,0,0,0,3,80,1,0,0,
+        0,5,83,1,0,0,0,7,87,1,0,0,0,9,90,1,0,0,0,11,94,1,0,0,0,13,96,1,0,
+        0,0,15,98,1,0,0,0,17,100,1,0,0,0,19,103,1,0,0,0,21,106,1,0,0,0,23,
+        109,1,0,0,0,25,112,1,0,0,0,27,114,1,0,0,0,29,116,1,0,0,0,31,118,
+        1,0,0,0,33,120,1,0,0,0,35,122,1,0,0,0,37,125,1,0,0,0,39,130,1,0,
+        0,0,41,135,1,0,0,0,43,139,1,0,0,0,45,141,1,0,0,0,47,144,1,0,0,0,
+        49,146,1,0,0,0,51,148,1,0,0,0,53,150,1,0,0,0,55,152,1,0,0,0,57,154,
+        1,0,0,0,59,157,1,0,0,0,61,159,1,0,0,0,63,161,1,0,0,0,65,163,1,0,
+        0,0,67,174,1,0,0,0,69,177,1,0,0,0,71,203,1,0,0,0,73,214,1,0,0,0,
+        75,222,1,0,0,0,77,78,5,111,0,0,78,79,5,114,0,0,79,2,1,0,0,0,80,81,
+        5,124,0,0,81,82,5,124,0,0,82,4,1,0,0,0,83,84,5,97,0,0,84,85,5,110,
+        0,0,85,86,5,100,0,0,86,6,1,0,0,0,87,88,5,38,0,0,88,89,5,38,0,0,89,
+        8,1,0,0,0,90,91,5,110,0,0,91,92,5,111,0,0,92,93,5,116,0,0,93,10,
+        1,0,0,0,94,95,5,33,0,0,95,12,1,0,0,0,96,97,5,60,0,0,97,14,1,0,0,
+        0,98,99,5,62,0,0,99,16,1,0,0,0,100,101,5,60,0,0,101,102,5,61,0,0,
+        102,18,1,0,0,0,103,104,5,62,0,0,104,105,5,61,0,0,105,20,1,0,0,0,
+        106,107,5,61,0,0,107,108,5,61,0,0,108,22,1,0,0,0,109,110,5,33,0,
+        0,110,111,5,61,0,0,111,24,1,0,0,0,112,113,5,43,0,0,113,26,1,0,0,
+        0,114,115,5,45,0,0,115,28,1,0,0,0,116,117,5,42,0,0,117,30,1,0,0,
+        0,118,119,5,47,0,0,119,32,1,0,0,0,120,121,5,37,0,0,121,34,1,0,0,
+        0,122,123,5,105,0,0,123,124,5,102,0,0,124,36,1,0,0,0,125,126,5,116,
+        0,0,126,127,5,104,0,0,127,128,5,101,0,0,128,129,5,110,0,0,129,38,
+        1,0,0,0,130,131,5,101,0,0,131,132,5,108,0,0,132,133,5,115,0,0,133,
+        134,5,101,0,0,134,40,1,0,0,0,135,136,5,108,0,0,136,137,5,101,0,0,
+        137,138,5,116,0,0,138,42,1,0,0,0,139,140,5,61,0,0,140,44,1,0,0,0,
+        141,142,5,105,0,0,142,143,5,110,0,0,143,46,1,0,0,0,144,145,5,40,
+        0,0,145,48,1,0,0,0,146,147,5,44,0,0,147,50,1,0,0,0,148,149,5,41,
+        0,0,149,52,1,0,0,0,150,151,5,91,0,0,151,54,1,0,0,0,152,153,5,93,
+        0,0,153,56,1,0,0,0,154,155,5,46,0,0,155,156,5,46,0,0,156,58,1,0,
+        0,0,157,158,5,955,0,0,158,60,1,0,0,0,159,160,5,92,0,0,160,62,1,0,
+        0,0,161,162,5,46,0,0,162,64,1,0,0,0,163,164,5,59,0,0,164,66,1,0,
+        0,0,165,166,5,116,0,0,166,167,5,114,0,0,167,168,5,117,0,0,168,175,
+        5,101,0,0,169,170,5,102,0,0,170,171,5,97,0,0,171,172,5,108,0,0,172,
+        173,5,115,0,0,173,175,5,101,0,0,174,165,1,0,0,0,174,169,1,0,0,0,
+        175,68,1,0,0,0,176,178,5,45,0,0,177,176,1,0,0,0,177,178,1,0,0,0,
+        178,180,1,0,0,0,179,181,7,0,0,0,180,179,1,0,0,0,181,182,1,0,0,0,
+        182,180,1,0,0,0,182,183,1,0,0,0,183,190,1,0,0,0,184,186,5,46,0,0,
+        185,187,7,1,0,0,186,185,1,0,0,0,187,188,1,0,0,0,188,186,1,0,0,0,
+        188,189,1,0,0,0,189,191,1,0,0,0,190,184,1,0,0,0,190,191,1,0,0,0,
+        191,201,1,0,0,0,192,194,7,2,0,0,193,195,7,3,0,0,194,193,1,0,0,0,
+        194,195,1,0,0,0,195,197,1,0,0,0,196,198,7,1,0,0,197,196,1,0,0,0,
+        198,199,1,0,0,0,199,197,1,0,0,0,199,200,1,0,0,0,200,202,1,0,0,0,
+        201,192,1,0,0,0,201,202,1,0,0,0,202,70,1,0,0,0,203,209,5,34,0,0,
+        204,208,8,4,0,0,205,206,5,92,0,0,206,208,7,4,0,0,207,204,1,0,0,0,
+        207,205,1,0,0,0,208,211,1,0,0,0,209,207,1,0,0,0,209,210,1,0,0,0,
+        210,212,1,0,0,0,211,209,1,0,0,0,212,213,5,34,0,0,213,72,1,0,0,0,
+        214,218,7,5,0,0,215,217,7,6,0,0,216,215,1,0,0,0,217,220,1,0,0,0,
+        218,216,1,0,0,0,218,219,1,0,0,0,219,74,1,0,0,0,220,218,1,0,0,0,221,
+        223,7,7,0,0,222,221,1,0,0,0,223,224,1,0,0,0,224,222,1,0,0,0,224,
+        225,1,0,0,0,225,226,1,0,0,0,226,227,6,37,0,0,227,76,1,0,0,0,13,0,
+        174,177,182,188,190,194,199,201,207,209,218,224,1,6,0,0
     ]
 
 class LambdaLexer(Lexer):
@@ -131,31 +132,33 @@ class LambdaLexer(Lexer):
     T__29 = 30
     T__30 = 31
     T__31 = 32
-    BOOLEAN = 33
-    NUMBER = 34
-    STRING = 35
-    ID = 36
-    WS = 37
+    SEMI = 33
+    BOOLEAN = 34
+    NUMBER = 35
+    STRING = 36
+    ID = 37
+    WS = 38
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
     modeNames = [ "DEFAULT_MODE" ]
 
     literalNames = [ "<INVALID>",
-            "'('", "')'", "'if'", "'then'", "'else'", "'let'", "'='", "'in'", 
-            "'*'", "'/'", "'%'", "'+'", "'-'", "'<'", "'>'", "'<='", "'>='", 
-            "'=='", "'!='", "'not'", "'!'", "'and'", "'&&'", "'or'", "'||'", 
-            "'['", "','", "']'", "'..'", "'\\u041E\\u00BB'", "'\\'", "'.'" ]
+            "'or'", "'||'", "'and'", "'&&'", "'not'", "'!'", "'<'", "'>'", 
+            "'<='", "'>='", "'=='", "'!='", "'+'", "'-'", "'*'", "'/'", 
+            "'%'", "'if'", "'then'", "'else'", "'let'", "'='", "'in'", "'('", 
+            "','", "')'", "'['", "']'", "'..'", "'\\u03BB'", "'\\'", "'.'", 
+            "';'" ]
 
     symbolicNames = [ "<INVALID>",
-            "BOOLEAN", "NUMBER", "STRING", "ID", "WS" ]
+            "SEMI", "BOOLEAN", "NUMBER", "STRING", "ID", "WS" ]
 
     ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
                   "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
                   "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
                   "T__20", "T__21", "T__22", "T__23", "T__24", "T__25", 
                   "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
-                  "BOOLEAN", "NUMBER", "STRING", "ID", "WS" ]
+                  "SEMI", "BOOLEAN", "NUMBER", "STRING", "ID", "WS" ]
 
     grammarFileName = "Lambda.g4"
 
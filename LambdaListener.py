@@ -17,129 +17,147 @@ class LambdaListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#AndExpr.
-    def enterAndExpr(self, ctx:LambdaParser.AndExprContext):
+    # Enter a parse tree produced by LambdaParser#program.
+    def enterProgram(self, ctx:LambdaParser.ProgramContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#AndExpr.
-    def exitAndExpr(self, ctx:LambdaParser.AndExprContext):
+    # Exit a parse tree produced by LambdaParser#program.
+    def exitProgram(self, ctx:LambdaParser.ProgramContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#IfExpr.
-    def enterIfExpr(self, ctx:LambdaParser.IfExprContext):
+    # Enter a parse tree produced by LambdaParser#statement.
+    def enterStatement(self, ctx:LambdaParser.StatementContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#IfExpr.
-    def exitIfExpr(self, ctx:LambdaParser.IfExprContext):
+    # Exit a parse tree produced by LambdaParser#statement.
+    def exitStatement(self, ctx:LambdaParser.StatementContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#ComparisonExpr.
-    def enterComparisonExpr(self, ctx:LambdaParser.ComparisonExprContext):
+    # Enter a parse tree produced by LambdaParser#AbstractionExpr.
+    def enterAbstractionExpr(self, ctx:LambdaParser.AbstractionExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#ComparisonExpr.
-    def exitComparisonExpr(self, ctx:LambdaParser.ComparisonExprContext):
+    # Exit a parse tree produced by LambdaParser#AbstractionExpr.
+    def exitAbstractionExpr(self, ctx:LambdaParser.AbstractionExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#LetExpr.
-    def enterLetExpr(self, ctx:LambdaParser.LetExprContext):
+    # Enter a parse tree produced by LambdaParser#OperatorExpr.
+    def enterOperatorExpr(self, ctx:LambdaParser.OperatorExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#LetExpr.
-    def exitLetExpr(self, ctx:LambdaParser.LetExprContext):
+    # Exit a parse tree produced by LambdaParser#OperatorExpr.
+    def exitOperatorExpr(self, ctx:LambdaParser.OperatorExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#AtomExpr.
-    def enterAtomExpr(self, ctx:LambdaParser.AtomExprContext):
+    # Enter a parse tree produced by LambdaParser#orExpr.
+    def enterOrExpr(self, ctx:LambdaParser.OrExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#AtomExpr.
-    def exitAtomExpr(self, ctx:LambdaParser.AtomExprContext):
+    # Exit a parse tree produced by LambdaParser#orExpr.
+    def exitOrExpr(self, ctx:LambdaParser.OrExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#TupleExpr.
-    def enterTupleExpr(self, ctx:LambdaParser.TupleExprContext):
+    # Enter a parse tree produced by LambdaParser#andExpr.
+    def enterAndExpr(self, ctx:LambdaParser.AndExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#TupleExpr.
-    def exitTupleExpr(self, ctx:LambdaParser.TupleExprContext):
+    # Exit a parse tree produced by LambdaParser#andExpr.
+    def exitAndExpr(self, ctx:LambdaParser.AndExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#OrExpr.
-    def enterOrExpr(self, ctx:LambdaParser.OrExprContext):
+    # Enter a parse tree produced by LambdaParser#unaryExpr.
+    def enterUnaryExpr(self, ctx:LambdaParser.UnaryExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#OrExpr.
-    def exitOrExpr(self, ctx:LambdaParser.OrExprContext):
+    # Exit a parse tree produced by LambdaParser#unaryExpr.
+    def exitUnaryExpr(self, ctx:LambdaParser.UnaryExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#SimpleRangeExpr.
-    def enterSimpleRangeExpr(self, ctx:LambdaParser.SimpleRangeExprContext):
+    # Enter a parse tree produced by LambdaParser#notExpr.
+    def enterNotExpr(self, ctx:LambdaParser.NotExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#SimpleRangeExpr.
-    def exitSimpleRangeExpr(self, ctx:LambdaParser.SimpleRangeExprContext):
+    # Exit a parse tree produced by LambdaParser#notExpr.
+    def exitNotExpr(self, ctx:LambdaParser.NotExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#AbstractionExpr.
-    def enterAbstractionExpr(self, ctx:LambdaParser.AbstractionExprContext):
+    # Enter a parse tree produced by LambdaParser#comparisonExpr.
+    def enterComparisonExpr(self, ctx:LambdaParser.ComparisonExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#AbstractionExpr.
-    def exitAbstractionExpr(self, ctx:LambdaParser.AbstractionExprContext):
+    # Exit a parse tree produced by LambdaParser#comparisonExpr.
+    def exitComparisonExpr(self, ctx:LambdaParser.ComparisonExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#ApplicationExpr.
-    def enterApplicationExpr(self, ctx:LambdaParser.ApplicationExprContext):
+    # Enter a parse tree produced by LambdaParser#addSubExpr.
+    def enterAddSubExpr(self, ctx:LambdaParser.AddSubExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#ApplicationExpr.
-    def exitApplicationExpr(self, ctx:LambdaParser.ApplicationExprContext):
+    # Exit a parse tree produced by LambdaParser#addSubExpr.
+    def exitAddSubExpr(self, ctx:LambdaParser.AddSubExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#MulDivExpr.
+    # Enter a parse tree produced by LambdaParser#mulDivExpr.
     def enterMulDivExpr(self, ctx:LambdaParser.MulDivExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#MulDivExpr.
+    # Exit a parse tree produced by LambdaParser#mulDivExpr.
     def exitMulDivExpr(self, ctx:LambdaParser.MulDivExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#FullRangeExpr.
-    def enterFullRangeExpr(self, ctx:LambdaParser.FullRangeExprContext):
+    # Enter a parse tree produced by LambdaParser#applicationExpr.
+    def enterApplicationExpr(self, ctx:LambdaParser.ApplicationExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#FullRangeExpr.
-    def exitFullRangeExpr(self, ctx:LambdaParser.FullRangeExprContext):
+    # Exit a parse tree produced by LambdaParser#applicationExpr.
+    def exitApplicationExpr(self, ctx:LambdaParser.ApplicationExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#NotExpr.
-    def enterNotExpr(self, ctx:LambdaParser.NotExprContext):
+    # Enter a parse tree produced by LambdaParser#IfExpr.
+    def enterIfExpr(self, ctx:LambdaParser.IfExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#NotExpr.
-    def exitNotExpr(self, ctx:LambdaParser.NotExprContext):
+    # Exit a parse tree produced by LambdaParser#IfExpr.
+    def exitIfExpr(self, ctx:LambdaParser.IfExprContext):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#ListExpr.
-    def enterListExpr(self, ctx:LambdaParser.ListExprContext):
+    # Enter a parse tree produced by LambdaParser#LetExpr.
+    def enterLetExpr(self, ctx:LambdaParser.LetExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#ListExpr.
-    def exitListExpr(self, ctx:LambdaParser.ListExprContext):
+    # Exit a parse tree produced by LambdaParser#LetExpr.
+    def exitLetExpr(self, ctx:LambdaParser.LetExprContext):
+        pass
+
+
+    # Enter a parse tree produced by LambdaParser#trailing.
+    def enterTrailing(self, ctx:LambdaParser.TrailingContext):
+        pass
+
+    # Exit a parse tree produced by LambdaParser#trailing.
+    def exitTrailing(self, ctx:LambdaParser.TrailingContext):
+        pass
+
+
+    # Enter a parse tree produced by LambdaParser#AtomExpr.
+    def enterAtomExpr(self, ctx:LambdaParser.AtomExprContext):
+        pass
+
+    # Exit a parse tree produced by LambdaParser#AtomExpr.
+    def exitAtomExpr(self, ctx:LambdaParser.AtomExprContext):
         pass
 
 
@@ -152,12 +170,21 @@ class LambdaListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by LambdaParser#AddSubExpr.
-    def enterAddSubExpr(self, ctx:LambdaParser.AddSubExprContext):
+    # Enter a parse tree produced by LambdaParser#BracketExpr.
+    def enterBracketExpr(self, ctx:LambdaParser.BracketExprContext):
         pass
 
-    # Exit a parse tree produced by LambdaParser#AddSubExpr.
-    def exitAddSubExpr(self, ctx:LambdaParser.AddSubExprContext):
+    # Exit a parse tree produced by LambdaParser#BracketExpr.
+    def exitBracketExpr(self, ctx:LambdaParser.BracketExprContext):
+        pass
+
+
+    # Enter a parse tree produced by LambdaParser#bracketBody.
+    def enterBracketBody(self, ctx:LambdaParser.BracketBodyContext):
+        pass
+
+    # Exit a parse tree produced by LambdaParser#bracketBody.
+    def exitBracketBody(self, ctx:LambdaParser.BracketBodyContext):
         pass
 
 
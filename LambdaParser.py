@@ -10,43 +10,80 @@ else:
 
 def serializedATN():
     return [
-        4,1,37,107,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,1,0,1,0,1,0,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,39,8,1,10,1,12,1,42,9,1,3,
-        1,44,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,4,1,65,8,1,11,1,12,1,66,3,1,69,8,1,1,1,3,1,72,
-        8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,5,1,91,8,1,10,1,12,1,94,9,1,1,2,1,2,4,2,98,8,2,11,2,12,2,
-        99,1,2,1,2,1,2,1,3,1,3,1,3,0,1,2,4,0,2,4,6,0,8,1,0,20,21,1,0,9,11,
-        1,0,12,13,1,0,14,19,1,0,22,23,1,0,24,25,1,0,30,31,1,0,33,36,122,
-        0,8,1,0,0,0,2,71,1,0,0,0,4,95,1,0,0,0,6,104,1,0,0,0,8,9,3,2,1,0,
-        9,10,5,0,0,1,10,1,1,0,0,0,11,12,6,1,-1,0,12,72,3,6,3,0,13,72,3,4,
-        2,0,14,15,5,1,0,0,15,16,3,2,1,0,16,17,5,2,0,0,17,72,1,0,0,0,18,19,
-        5,3,0,0,19,20,3,2,1,0,20,21,5,4,0,0,21,22,3,2,1,0,22,23,5,5,0,0,
-        23,24,3,2,1,12,24,72,1,0,0,0,25,26,5,6,0,0,26,27,5,36,0,0,27,28,
-        5,7,0,0,28,29,3,2,1,0,29,30,5,8,0,0,30,31,3,2,1,11,31,72,1,0,0,0,
-        32,33,7,0,0,0,33,72,3,2,1,7,34,43,5,26,0,0,35,40,3,2,1,0,36,37,5,
-        27,0,0,37,39,3,2,1,0,38,36,1,0,0,0,39,42,1,0,0,0,40,38,1,0,0,0,40,
-        41,1,0,0,0,41,44,1,0,0,0,42,40,1,0,0,0,43,35,1,0,0,0,43,44,1,0,0,
-        0,44,45,1,0,0,0,45,72,5,28,0,0,46,47,5,26,0,0,47,48,3,2,1,0,48,49,
-        5,27,0,0,49,50,3,2,1,0,50,51,5,29,0,0,51,52,3,2,1,0,52,53,5,28,0,
-        0,53,72,1,0,0,0,54,55,5,26,0,0,55,56,3,2,1,0,56,57,5,29,0,0,57,58,
-        3,2,1,0,58,59,5,28,0,0,59,72,1,0,0,0,60,68,5,1,0,0,61,64,3,2,1,0,
-        62,63,5,27,0,0,63,65,3,2,1,0,64,62,1,0,0,0,65,66,1,0,0,0,66,64,1,
-        0,0,0,66,67,1,0,0,0,67,69,1,0,0,0,68,61,1,0,0,0,68,69,1,0,0,0,69,
-        70,1,0,0,0,70,72,5,2,0,0,71,11,1,0,0,0,71,13,1,0,0,0,71,14,1,0,0,
-        0,71,18,1,0,0,0,71,25,1,0,0,0,71,32,1,0,0,0,71,34,1,0,0,0,71,46,
-        1,0,0,0,71,54,1,0,0,0,71,60,1,0,0,0,72,92,1,0,0,0,73,74,10,14,0,
-        0,74,91,3,2,1,15,75,76,10,10,0,0,76,77,7,1,0,0,77,91,3,2,1,11,78,
-        79,10,9,0,0,79,80,7,2,0,0,80,91,3,2,1,10,81,82,10,8,0,0,82,83,7,
-        3,0,0,83,91,3,2,1,9,84,85,10,6,0,0,85,86,7,4,0,0,86,91,3,2,1,7,87,
-        88,10,5,0,0,88,89,7,5,0,0,89,91,3,2,1,6,90,73,1,0,0,0,90,75,1,0,
-        0,0,90,78,1,0,0,0,90,81,1,0,0,0,90,84,1,0,0,0,90,87,1,0,0,0,91,94,
-        1,0,0,0,92,90,1,0,0,0,92,93,1,0,0,0,93,3,1,0,0,0,94,92,1,0,0,0,95,
-        97,7,6,0,0,96,98,5,36,0,0,97,96,1,0,0,0,98,99,1,0,0,0,99,97,1,0,
-        0,0,99,100,1,0,0,0,100,101,1,0,0,0,101,102,5,32,0,0,102,103,3,2,
-        1,0,103,5,1,0,0,0,104,105,7,7,0,0,105,7,1,0,0,0,8,40,43,66,68,71,
-        90,92,99
+        4,1,38,205,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,1,0,1,0,1,0,1,1,1,1,5,1,
+        42,8,1,10,1,12,1,45,9,1,1,1,1,1,1,2,1,2,1,2,1,3,1,3,3,3,54,8,3,1,
+        4,1,4,1,4,1,4,3,4,60,8,4,5,4,62,8,4,10,4,12,4,65,9,4,1,5,1,5,1,5,
+        1,5,3,5,71,8,5,5,5,73,8,5,10,5,12,5,76,9,5,1,6,1,6,3,6,80,8,6,1,
+        7,1,7,1,7,3,7,85,8,7,1,8,1,8,1,8,1,8,3,8,91,8,8,5,8,93,8,8,10,8,
+        12,8,96,9,8,1,9,1,9,1,9,1,9,3,9,102,8,9,5,9,104,8,9,10,9,12,9,107,
+        9,9,1,10,1,10,1,10,1,10,3,10,113,8,10,5,10,115,8,10,10,10,12,10,
+        118,9,10,1,11,4,11,121,8,11,11,11,12,11,122,1,11,1,11,3,11,127,8,
+        11,1,11,3,11,130,8,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,139,
+        8,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,148,8,12,3,12,150,8,
+        12,1,13,1,13,3,13,154,8,13,1,14,1,14,1,14,1,14,1,14,5,14,161,8,14,
+        10,14,12,14,164,9,14,3,14,166,8,14,1,14,1,14,1,14,3,14,171,8,14,
+        1,14,3,14,174,8,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,
+        5,15,185,8,15,10,15,12,15,188,9,15,3,15,190,8,15,3,15,192,8,15,1,
+        16,1,16,4,16,196,8,16,11,16,12,16,197,1,16,1,16,1,16,1,17,1,17,1,
+        17,0,0,18,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,0,9,1,
+        1,33,33,1,0,1,2,1,0,3,4,1,0,5,6,1,0,7,12,1,0,13,14,1,0,15,17,1,0,
+        30,31,1,0,34,37,219,0,36,1,0,0,0,2,43,1,0,0,0,4,48,1,0,0,0,6,53,
+        1,0,0,0,8,55,1,0,0,0,10,66,1,0,0,0,12,79,1,0,0,0,14,81,1,0,0,0,16,
+        86,1,0,0,0,18,97,1,0,0,0,20,108,1,0,0,0,22,129,1,0,0,0,24,149,1,
+        0,0,0,26,153,1,0,0,0,28,173,1,0,0,0,30,175,1,0,0,0,32,193,1,0,0,
+        0,34,202,1,0,0,0,36,37,3,6,3,0,37,38,5,0,0,1,38,1,1,0,0,0,39,42,
+        3,4,2,0,40,42,5,33,0,0,41,39,1,0,0,0,41,40,1,0,0,0,42,45,1,0,0,0,
+        43,41,1,0,0,0,43,44,1,0,0,0,44,46,1,0,0,0,45,43,1,0,0,0,46,47,5,
+        0,0,1,47,3,1,0,0,0,48,49,3,6,3,0,49,50,7,0,0,0,50,5,1,0,0,0,51,54,
+        3,32,16,0,52,54,3,8,4,0,53,51,1,0,0,0,53,52,1,0,0,0,54,7,1,0,0,0,
+        55,63,3,10,5,0,56,59,7,1,0,0,57,60,3,10,5,0,58,60,3,32,16,0,59,57,
+        1,0,0,0,59,58,1,0,0,0,60,62,1,0,0,0,61,56,1,0,0,0,62,65,1,0,0,0,
+        63,61,1,0,0,0,63,64,1,0,0,0,64,9,1,0,0,0,65,63,1,0,0,0,66,74,3,12,
+        6,0,67,70,7,2,0,0,68,71,3,12,6,0,69,71,3,32,16,0,70,68,1,0,0,0,70,
+        69,1,0,0,0,71,73,1,0,0,0,72,67,1,0,0,0,73,76,1,0,0,0,74,72,1,0,0,
+        0,74,75,1,0,0,0,75,11,1,0,0,0,76,74,1,0,0,0,77,80,3,14,7,0,78,80,
+        3,16,8,0,79,77,1,0,0,0,79,78,1,0,0,0,80,13,1,0,0,0,81,84,7,3,0,0,
+        82,85,3,12,6,0,83,85,3,32,16,0,84,82,1,0,0,0,84,83,1,0,0,0,85,15,
+        1,0,0,0,86,94,3,18,9,0,87,90,7,4,0,0,88,91,3,18,9,0,89,91,3,26,13,
+        0,90,88,1,0,0,0,90,89,1,0,0,0,91,93,1,0,0,0,92,87,1,0,0,0,93,96,
+        1,0,0,0,94,92,1,0,0,0,94,95,1,0,0,0,95,17,1,0,0,0,96,94,1,0,0,0,
+        97,105,3,20,10,0,98,101,7,5,0,0,99,102,3,20,10,0,100,102,3,26,13,
+        0,101,99,1,0,0,0,101,100,1,0,0,0,102,104,1,0,0,0,103,98,1,0,0,0,
+        104,107,1,0,0,0,105,103,1,0,0,0,105,106,1,0,0,0,106,19,1,0,0,0,107,
+        105,1,0,0,0,108,116,3,22,11,0,109,112,7,6,0,0,110,113,3,22,11,0,
+        111,113,3,26,13,0,112,110,1,0,0,0,112,111,1,0,0,0,113,115,1,0,0,
+        0,114,109,1,0,0,0,115,118,1,0,0,0,116,114,1,0,0,0,116,117,1,0,0,
+        0,117,21,1,0,0,0,118,116,1,0,0,0,119,121,3,28,14,0,120,119,1,0,0,
+        0,121,122,1,0,0,0,122,120,1,0,0,0,122,123,1,0,0,0,123,126,1,0,0,
+        0,124,127,3,24,12,0,125,127,3,26,13,0,126,124,1,0,0,0,126,125,1,
+        0,0,0,126,127,1,0,0,0,127,130,1,0,0,0,128,130,3,24,12,0,129,120,
+        1,0,0,0,129,128,1,0,0,0,130,23,1,0,0,0,131,132,5,18,0,0,132,133,
+        3,6,3,0,133,134,5,19,0,0,134,135,3,6,3,0,135,138,5,20,0,0,136,139,
+        3,22,11,0,137,139,3,26,13,0,138,136,1,0,0,0,138,137,1,0,0,0,139,
+        150,1,0,0,0,140,141,5,21,0,0,141,142,5,37,0,0,142,143,5,22,0,0,143,
+        144,3,6,3,0,144,147,5,23,0,0,145,148,3,22,11,0,146,148,3,26,13,0,
+        147,145,1,0,0,0,147,146,1,0,0,0,148,150,1,0,0,0,149,131,1,0,0,0,
+        149,140,1,0,0,0,150,25,1,0,0,0,151,154,3,32,16,0,152,154,3,14,7,
+        0,153,151,1,0,0,0,153,152,1,0,0,0,154,27,1,0,0,0,155,174,3,34,17,
+        0,156,165,5,24,0,0,157,162,3,6,3,0,158,159,5,25,0,0,159,161,3,6,
+        3,0,160,158,1,0,0,0,161,164,1,0,0,0,162,160,1,0,0,0,162,163,1,0,
+        0,0,163,166,1,0,0,0,164,162,1,0,0,0,165,157,1,0,0,0,165,166,1,0,
+        0,0,166,167,1,0,0,0,167,174,5,26,0,0,168,170,5,27,0,0,169,171,3,
+        30,15,0,170,169,1,0,0,0,170,171,1,0,0,0,171,172,1,0,0,0,172,174,
+        5,28,0,0,173,155,1,0,0,0,173,156,1,0,0,0,173,168,1,0,0,0,174,29,
+        1,0,0,0,175,191,3,6,3,0,176,177,5,29,0,0,177,192,3,6,3,0,178,179,
+        5,25,0,0,179,189,3,6,3,0,180,181,5,29,0,0,181,190,3,6,3,0,182,183,
+        5,25,0,0,183,185,3,6,3,0,184,182,1,0,0,0,185,188,1,0,0,0,186,184,
+        1,0,0,0,186,187,1,0,0,0,187,190,1,0,0,0,188,186,1,0,0,0,189,180,
+        1,0,0,0,189,186,1,0,0,0,190,192,1,0,0,0,191,176,1,0,0,0,191,178,
+        1,0,0,0,191,192,1,0,0,0,192,31,1,0,0,0,193,195,7,7,0,0,194,196,5,
+        37,0,0,195,194,1,0,0,0,196,197,1,0,0,0,197,195,1,0,0,0,197,198,1,
+        0,0,0,198,199,1,0,0,0,199,200,5,32,0,0,200,201,3,6,3,0,201,33,1,
+        0,0,0,202,203,7,8,0,0,203,35,1,0,0,0,30,41,43,53,59,63,70,74,79,
+        84,90,94,101,105,112,116,122,126,129,138,147,149,153,162,165,170,
+        173,186,189,191,197
     ]
 
 class LambdaParser ( Parser ):
@@ -59,11 +96,11 @@ class LambdaParser ( Parser ):
 
     sharedContextCache = PredictionContextCache()
 
-    literalNames = [ "<INVALID>", "'('", "')'", "'if'", "'then'", "'else'", 
-                     "'let'", "'='", "'in'", "'*'", "'/'", "'%'", "'+'", 
-                     "'-'", "'<'", "'>'", "'<='", "'>='", "'=='", "'!='", 
-                     "'not'", "'!'", "'and'", "'&&'", "'or'", "'||'", "'['", 
-                     "','", "']'", "'..'", "'\\u041E\\u00BB'", "'\\'", "'.'" ]
+    literalNames = [ "<INVALID>", "'or'", "'||'", "'and'", "'&&'", "'not'", 
+                     "'!'", "'<'", "'>'", "'<='", "'>='", "'=='", "'!='", 
+                     "'+'", "'-'", "'*'", "'/'", "'%'", "'if'", "'then'", 
+                     "'else'", "'let'", "'='", "'in'", "'('", "','", "')'", 
+                     "'['", "']'", "'..'", "'\\u03BB'", "'\\'", "'.'", "';'" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
@@ -73,15 +110,32 @@ class LambdaParser ( Parser ):
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "<INVALID>", "BOOLEAN", "NUMBER", "STRING", "ID", 
-                      "WS" ]
+                      "<INVALID>", "SEMI", "BOOLEAN", "NUMBER", "STRING", 
+                      "ID", "WS" ]
 
     RULE_prog = 0
-    RULE_expr = 1
-    RULE_abstraction = 2
-    RULE_atom = 3
-
-    ruleNames =  [ "prog", "expr", "abstraction", "atom" ]
+    RULE_program = 1
+    RULE_statement = 2
+    RULE_expr = 3
+    RULE_orExpr = 4
+    RULE_andExpr = 5
+    RULE_unaryExpr = 6
+    RULE_notExpr = 7
+    RULE_comparisonExpr = 8
+    RULE_addSubExpr = 9
+    RULE_mulDivExpr = 10
+    RULE_applicationExpr = 11
+    RULE_tail = 12
+    RULE_trailing = 13
+    RULE_primary = 14
+    RULE_bracketBody = 15
+    RULE_abstraction = 16
+    RULE_atom = 17
+
+    ruleNames =  [ "prog", "program", "statement", "expr", "orExpr", "andExpr", 
+                   "unaryExpr", "notExpr", "comparisonExpr", "addSubExpr", 
+                   "mulDivExpr", "applicationExpr", "tail", "trailing", 
+                   "primary", "bracketBody", "abstraction", "atom" ]
 
     EOF = Token.EOF
     T__0=1
@@ -116,11 +170,12 @@ class LambdaParser ( Parser ):
     T__29=30
     T__30=31
     T__31=32
-    BOOLEAN=33
-    NUMBER=34
-    STRING=35
-    ID=36
-    WS=37
+    SEMI=33
+    BOOLEAN=34
+    NUMBER=35
+    STRING=36
+    ID=37
+    WS=38
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -171,9 +226,9 @@ class LambdaParser ( Parser ):
         self.enterRule(localctx, 0, self.RULE_prog)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 8
-            self.expr(0)
-            self.state = 9
+            self.state = 36
+            self.expr()
+            self.state = 37
             self.match(LambdaParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -184,205 +239,275 @@ class LambdaParser ( Parser ):
         return localctx
 
 
-    class ExprContext(ParserRuleContext):
+    class ProgramContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
+        def EOF(self):
+            return self.getToken(LambdaParser.EOF, 0)
 
-        def getRuleIndex(self):
-            return LambdaParser.RULE_expr
-
-     
-        def copyFrom(self, ctx:ParserRuleContext):
-            super().copyFrom(ctx)
-
-
-    class AndExprContext(ExprContext):
+        def statement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.StatementContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.StatementContext,i)
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.op = None # Token
-            self.copyFrom(ctx)
 
-        def expr(self, i:int=None):
+        def SEMI(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
+                return self.getTokens(LambdaParser.SEMI)
             else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+                return self.getToken(LambdaParser.SEMI, i)
 
+        def getRuleIndex(self):
+            return LambdaParser.RULE_program
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAndExpr" ):
-                listener.enterAndExpr(self)
+            if hasattr( listener, "enterProgram" ):
+                listener.enterProgram(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAndExpr" ):
-                listener.exitAndExpr(self)
+            if hasattr( listener, "exitProgram" ):
+                listener.exitProgram(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAndExpr" ):
-                return visitor.visitAndExpr(self)
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class IfExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.copyFrom(ctx)
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
-            else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+    def program(self):
 
+        localctx = LambdaParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 43
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 269662552160) != 0):
+                self.state = 41
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [5, 6, 18, 21, 24, 27, 30, 31, 34, 35, 36, 37]:
+                    self.state = 39
+                    self.statement()
+                    pass
+                elif token in [33]:
+                    self.state = 40
+                    self.match(LambdaParser.SEMI)
+                    pass
+                else:
+                    raise NoViableAltException(self)
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterIfExpr" ):
-                listener.enterIfExpr(self)
+                self.state = 45
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitIfExpr" ):
-                listener.exitIfExpr(self)
+            self.state = 46
+            self.match(LambdaParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitIfExpr" ):
-                return visitor.visitIfExpr(self)
-            else:
-                return visitor.visitChildren(self)
 
+    class StatementContext(ParserRuleContext):
+        __slots__ = 'parser'
 
-    class ComparisonExprContext(ExprContext):
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.op = None # Token
-            self.copyFrom(ctx)
+        def expr(self):
+            return self.getTypedRuleContext(LambdaParser.ExprContext,0)
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
-            else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
 
+        def SEMI(self):
+            return self.getToken(LambdaParser.SEMI, 0)
+
+        def EOF(self):
+            return self.getToken(LambdaParser.EOF, 0)
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_statement
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterComparisonExpr" ):
-                listener.enterComparisonExpr(self)
+            if hasattr( listener, "enterStatement" ):
+                listener.enterStatement(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitComparisonExpr" ):
-                listener.exitComparisonExpr(self)
+            if hasattr( listener, "exitStatement" ):
+                listener.exitStatement(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitComparisonExpr" ):
-                return visitor.visitComparisonExpr(self)
+            if hasattr( visitor, "visitStatement" ):
+                return visitor.visitStatement(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class LetExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.copyFrom(ctx)
 
-        def ID(self):
-            return self.getToken(LambdaParser.ID, 0)
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
+    def statement(self):
+
+        localctx = LambdaParser.StatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_statement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 48
+            self.expr()
+            self.state = 49
+            _la = self._input.LA(1)
+            if not(_la==-1 or _la==33):
+                self._errHandler.recoverInline(self)
             else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLetExpr" ):
-                listener.enterLetExpr(self)
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLetExpr" ):
-                listener.exitLetExpr(self)
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLetExpr" ):
-                return visitor.visitLetExpr(self)
-            else:
-                return visitor.visitChildren(self)
 
 
-    class AtomExprContext(ExprContext):
+    class OperatorExprContext(ExprContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def atom(self):
-            return self.getTypedRuleContext(LambdaParser.AtomContext,0)
+        def orExpr(self):
+            return self.getTypedRuleContext(LambdaParser.OrExprContext,0)
 
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAtomExpr" ):
-                listener.enterAtomExpr(self)
+            if hasattr( listener, "enterOperatorExpr" ):
+                listener.enterOperatorExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAtomExpr" ):
-                listener.exitAtomExpr(self)
+            if hasattr( listener, "exitOperatorExpr" ):
+                listener.exitOperatorExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAtomExpr" ):
-                return visitor.visitAtomExpr(self)
+            if hasattr( visitor, "visitOperatorExpr" ):
+                return visitor.visitOperatorExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class TupleExprContext(ExprContext):
+    class AbstractionExprContext(ExprContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
-            else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+        def abstraction(self):
+            return self.getTypedRuleContext(LambdaParser.AbstractionContext,0)
 
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterTupleExpr" ):
-                listener.enterTupleExpr(self)
+            if hasattr( listener, "enterAbstractionExpr" ):
+                listener.enterAbstractionExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitTupleExpr" ):
-                listener.exitTupleExpr(self)
+            if hasattr( listener, "exitAbstractionExpr" ):
+                listener.exitAbstractionExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitTupleExpr" ):
-                return visitor.visitTupleExpr(self)
+            if hasattr( visitor, "visitAbstractionExpr" ):
+                return visitor.visitAbstractionExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class OrExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.op = None # Token
-            self.copyFrom(ctx)
+    def expr(self):
 
-        def expr(self, i:int=None):
+        localctx = LambdaParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_expr)
+        try:
+            self.state = 53
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [30, 31]:
+                localctx = LambdaParser.AbstractionExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 51
+                self.abstraction()
+                pass
+            elif token in [5, 6, 18, 21, 24, 27, 34, 35, 36, 37]:
+                localctx = LambdaParser.OperatorExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 52
+                self.orExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OrExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def andExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
+                return self.getTypedRuleContexts(LambdaParser.AndExprContext)
             else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+                return self.getTypedRuleContext(LambdaParser.AndExprContext,i)
+
+
+        def abstraction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.AbstractionContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.AbstractionContext,i)
 
 
+        def getRuleIndex(self):
+            return LambdaParser.RULE_orExpr
+
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterOrExpr" ):
                 listener.enterOrExpr(self)
@@ -398,62 +523,692 @@ class LambdaParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
-    class SimpleRangeExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.copyFrom(ctx)
 
-        def expr(self, i:int=None):
+    def orExpr(self):
+
+        localctx = LambdaParser.OrExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_orExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 55
+            self.andExpr()
+            self.state = 63
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,4,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 56
+                    _la = self._input.LA(1)
+                    if not(_la==1 or _la==2):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 59
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [5, 6, 18, 21, 24, 27, 34, 35, 36, 37]:
+                        self.state = 57
+                        self.andExpr()
+                        pass
+                    elif token in [30, 31]:
+                        self.state = 58
+                        self.abstraction()
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+             
+                self.state = 65
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,4,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AndExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def unaryExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
+                return self.getTypedRuleContexts(LambdaParser.UnaryExprContext)
             else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+                return self.getTypedRuleContext(LambdaParser.UnaryExprContext,i)
+
+
+        def abstraction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.AbstractionContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.AbstractionContext,i)
+
 
+        def getRuleIndex(self):
+            return LambdaParser.RULE_andExpr
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterSimpleRangeExpr" ):
-                listener.enterSimpleRangeExpr(self)
+            if hasattr( listener, "enterAndExpr" ):
+                listener.enterAndExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitSimpleRangeExpr" ):
-                listener.exitSimpleRangeExpr(self)
+            if hasattr( listener, "exitAndExpr" ):
+                listener.exitAndExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitSimpleRangeExpr" ):
-                return visitor.visitSimpleRangeExpr(self)
+            if hasattr( visitor, "visitAndExpr" ):
+                return visitor.visitAndExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class AbstractionExprContext(ExprContext):
-
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.copyFrom(ctx)
 
-        def abstraction(self):
-            return self.getTypedRuleContext(LambdaParser.AbstractionContext,0)
 
+    def andExpr(self):
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAbstractionExpr" ):
-                listener.enterAbstractionExpr(self)
+        localctx = LambdaParser.AndExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_andExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 66
+            self.unaryExpr()
+            self.state = 74
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,6,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 67
+                    _la = self._input.LA(1)
+                    if not(_la==3 or _la==4):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 70
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [5, 6, 18, 21, 24, 27, 34, 35, 36, 37]:
+                        self.state = 68
+                        self.unaryExpr()
+                        pass
+                    elif token in [30, 31]:
+                        self.state = 69
+                        self.abstraction()
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+             
+                self.state = 76
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,6,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UnaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def notExpr(self):
+            return self.getTypedRuleContext(LambdaParser.NotExprContext,0)
+
+
+        def comparisonExpr(self):
+            return self.getTypedRuleContext(LambdaParser.ComparisonExprContext,0)
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_unaryExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUnaryExpr" ):
+                listener.enterUnaryExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAbstractionExpr" ):
-                listener.exitAbstractionExpr(self)
+            if hasattr( listener, "exitUnaryExpr" ):
+                listener.exitUnaryExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAbstractionExpr" ):
-                return visitor.visitAbstractionExpr(self)
+            if hasattr( visitor, "visitUnaryExpr" ):
+                return visitor.visitUnaryExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class ApplicationExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
+
+    def unaryExpr(self):
+
+        localctx = LambdaParser.UnaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_unaryExpr)
+        try:
+            self.state = 79
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 77
+                self.notExpr()
+                pass
+            elif token in [18, 21, 24, 27, 34, 35, 36, 37]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 78
+                self.comparisonExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class NotExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.op = None # Token
+
+        def unaryExpr(self):
+            return self.getTypedRuleContext(LambdaParser.UnaryExprContext,0)
+
+
+        def abstraction(self):
+            return self.getTypedRuleContext(LambdaParser.AbstractionContext,0)
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_notExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterNotExpr" ):
+                listener.enterNotExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitNotExpr" ):
+                listener.exitNotExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNotExpr" ):
+                return visitor.visitNotExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def notExpr(self):
+
+        localctx = LambdaParser.NotExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_notExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 81
+            localctx.op = self._input.LT(1)
+            _la = self._input.LA(1)
+            if not(_la==5 or _la==6):
+                localctx.op = self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 84
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 18, 21, 24, 27, 34, 35, 36, 37]:
+                self.state = 82
+                self.unaryExpr()
+                pass
+            elif token in [30, 31]:
+                self.state = 83
+                self.abstraction()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ComparisonExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.s7 = None # Token
+            self.ops = list() # of Tokens
+            self.s8 = None # Token
+            self.s9 = None # Token
+            self.s10 = None # Token
+            self.s11 = None # Token
+            self.s12 = None # Token
+            self._tset173 = None # Token
+
+        def addSubExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.AddSubExprContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.AddSubExprContext,i)
+
+
+        def trailing(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.TrailingContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.TrailingContext,i)
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_comparisonExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterComparisonExpr" ):
+                listener.enterComparisonExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitComparisonExpr" ):
+                listener.exitComparisonExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitComparisonExpr" ):
+                return visitor.visitComparisonExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def comparisonExpr(self):
+
+        localctx = LambdaParser.ComparisonExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_comparisonExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 86
+            self.addSubExpr()
+            self.state = 94
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,10,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 87
+                    localctx._tset173 = self._input.LT(1)
+                    _la = self._input.LA(1)
+                    if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 8064) != 0)):
+                        localctx._tset173 = self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    localctx.ops.append(localctx._tset173)
+                    self.state = 90
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [18, 21, 24, 27, 34, 35, 36, 37]:
+                        self.state = 88
+                        self.addSubExpr()
+                        pass
+                    elif token in [5, 6, 30, 31]:
+                        self.state = 89
+                        self.trailing()
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+             
+                self.state = 96
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,10,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AddSubExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.s13 = None # Token
+            self.ops = list() # of Tokens
+            self.s14 = None # Token
+            self._tset207 = None # Token
+
+        def mulDivExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.MulDivExprContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.MulDivExprContext,i)
+
+
+        def trailing(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.TrailingContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.TrailingContext,i)
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_addSubExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAddSubExpr" ):
+                listener.enterAddSubExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAddSubExpr" ):
+                listener.exitAddSubExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAddSubExpr" ):
+                return visitor.visitAddSubExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def addSubExpr(self):
+
+        localctx = LambdaParser.AddSubExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_addSubExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 97
+            self.mulDivExpr()
+            self.state = 105
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,12,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 98
+                    localctx._tset207 = self._input.LT(1)
+                    _la = self._input.LA(1)
+                    if not(_la==13 or _la==14):
+                        localctx._tset207 = self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    localctx.ops.append(localctx._tset207)
+                    self.state = 101
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [18, 21, 24, 27, 34, 35, 36, 37]:
+                        self.state = 99
+                        self.mulDivExpr()
+                        pass
+                    elif token in [5, 6, 30, 31]:
+                        self.state = 100
+                        self.trailing()
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+             
+                self.state = 107
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,12,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MulDivExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.s15 = None # Token
+            self.ops = list() # of Tokens
+            self.s16 = None # Token
+            self.s17 = None # Token
+            self._tset232 = None # Token
+
+        def applicationExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.ApplicationExprContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.ApplicationExprContext,i)
+
+
+        def trailing(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.TrailingContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.TrailingContext,i)
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_mulDivExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMulDivExpr" ):
+                listener.enterMulDivExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMulDivExpr" ):
+                listener.exitMulDivExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMulDivExpr" ):
+                return visitor.visitMulDivExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def mulDivExpr(self):
+
+        localctx = LambdaParser.MulDivExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_mulDivExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 108
+            self.applicationExpr()
+            self.state = 116
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,14,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 109
+                    localctx._tset232 = self._input.LT(1)
+                    _la = self._input.LA(1)
+                    if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 229376) != 0)):
+                        localctx._tset232 = self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    localctx.ops.append(localctx._tset232)
+                    self.state = 112
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [18, 21, 24, 27, 34, 35, 36, 37]:
+                        self.state = 110
+                        self.applicationExpr()
+                        pass
+                    elif token in [5, 6, 30, 31]:
+                        self.state = 111
+                        self.trailing()
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+             
+                self.state = 118
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,14,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ApplicationExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primary(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.PrimaryContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.PrimaryContext,i)
+
+
+        def tail(self):
+            return self.getTypedRuleContext(LambdaParser.TailContext,0)
+
+
+        def trailing(self):
+            return self.getTypedRuleContext(LambdaParser.TrailingContext,0)
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_applicationExpr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterApplicationExpr" ):
+                listener.enterApplicationExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitApplicationExpr" ):
+                listener.exitApplicationExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitApplicationExpr" ):
+                return visitor.visitApplicationExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def applicationExpr(self):
+
+        localctx = LambdaParser.ApplicationExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_applicationExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 129
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [24, 27, 34, 35, 36, 37]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 120 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while True:
+                    self.state = 119
+                    self.primary()
+                    self.state = 122 
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 257849032704) != 0)):
+                        break
+
+                self.state = 126
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [18, 21]:
+                    self.state = 124
+                    self.tail()
+                    pass
+                elif token in [5, 6, 30, 31]:
+                    self.state = 125
+                    self.trailing()
+                    pass
+                elif token in [-1, 1, 2, 3, 4, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 19, 20, 23, 25, 26, 28, 29, 33]:
+                    pass
+                else:
+                    pass
+                pass
+            elif token in [18, 21]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 128
+                self.tail()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TailContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return LambdaParser.RULE_tail
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class IfExprContext(TailContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.TailContext
             super().__init__(parser)
             self.copyFrom(ctx)
 
@@ -463,163 +1218,274 @@ class LambdaParser ( Parser ):
             else:
                 return self.getTypedRuleContext(LambdaParser.ExprContext,i)
 
+        def applicationExpr(self):
+            return self.getTypedRuleContext(LambdaParser.ApplicationExprContext,0)
+
+        def trailing(self):
+            return self.getTypedRuleContext(LambdaParser.TrailingContext,0)
+
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterApplicationExpr" ):
-                listener.enterApplicationExpr(self)
+            if hasattr( listener, "enterIfExpr" ):
+                listener.enterIfExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitApplicationExpr" ):
-                listener.exitApplicationExpr(self)
+            if hasattr( listener, "exitIfExpr" ):
+                listener.exitIfExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfExpr" ):
+                return visitor.visitIfExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LetExprContext(TailContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.TailContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def ID(self):
+            return self.getToken(LambdaParser.ID, 0)
+        def expr(self):
+            return self.getTypedRuleContext(LambdaParser.ExprContext,0)
+
+        def applicationExpr(self):
+            return self.getTypedRuleContext(LambdaParser.ApplicationExprContext,0)
+
+        def trailing(self):
+            return self.getTypedRuleContext(LambdaParser.TrailingContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLetExpr" ):
+                listener.enterLetExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLetExpr" ):
+                listener.exitLetExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitApplicationExpr" ):
-                return visitor.visitApplicationExpr(self)
+            if hasattr( visitor, "visitLetExpr" ):
+                return visitor.visitLetExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class MulDivExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.op = None # Token
-            self.copyFrom(ctx)
+    def tail(self):
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
+        localctx = LambdaParser.TailContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_tail)
+        try:
+            self.state = 149
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [18]:
+                localctx = LambdaParser.IfExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 131
+                self.match(LambdaParser.T__17)
+                self.state = 132
+                self.expr()
+                self.state = 133
+                self.match(LambdaParser.T__18)
+                self.state = 134
+                self.expr()
+                self.state = 135
+                self.match(LambdaParser.T__19)
+                self.state = 138
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [18, 21, 24, 27, 34, 35, 36, 37]:
+                    self.state = 136
+                    self.applicationExpr()
+                    pass
+                elif token in [5, 6, 30, 31]:
+                    self.state = 137
+                    self.trailing()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+            elif token in [21]:
+                localctx = LambdaParser.LetExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 140
+                self.match(LambdaParser.T__20)
+                self.state = 141
+                self.match(LambdaParser.ID)
+                self.state = 142
+                self.match(LambdaParser.T__21)
+                self.state = 143
+                self.expr()
+                self.state = 144
+                self.match(LambdaParser.T__22)
+                self.state = 147
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [18, 21, 24, 27, 34, 35, 36, 37]:
+                    self.state = 145
+                    self.applicationExpr()
+                    pass
+                elif token in [5, 6, 30, 31]:
+                    self.state = 146
+                    self.trailing()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
             else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+                raise NoViableAltException(self)
 
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterMulDivExpr" ):
-                listener.enterMulDivExpr(self)
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitMulDivExpr" ):
-                listener.exitMulDivExpr(self)
+    class TrailingContext(ParserRuleContext):
+        __slots__ = 'parser'
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitMulDivExpr" ):
-                return visitor.visitMulDivExpr(self)
-            else:
-                return visitor.visitChildren(self)
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
 
+        def abstraction(self):
+            return self.getTypedRuleContext(LambdaParser.AbstractionContext,0)
 
-    class FullRangeExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.copyFrom(ctx)
+        def notExpr(self):
+            return self.getTypedRuleContext(LambdaParser.NotExprContext,0)
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
-            else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
 
+        def getRuleIndex(self):
+            return LambdaParser.RULE_trailing
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterFullRangeExpr" ):
-                listener.enterFullRangeExpr(self)
+            if hasattr( listener, "enterTrailing" ):
+                listener.enterTrailing(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitFullRangeExpr" ):
-                listener.exitFullRangeExpr(self)
+            if hasattr( listener, "exitTrailing" ):
+                listener.exitTrailing(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitFullRangeExpr" ):
-                return visitor.visitFullRangeExpr(self)
+            if hasattr( visitor, "visitTrailing" ):
+                return visitor.visitTrailing(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class NotExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
-            super().__init__(parser)
-            self.op = None # Token
-            self.copyFrom(ctx)
 
-        def expr(self):
-            return self.getTypedRuleContext(LambdaParser.ExprContext,0)
+    def trailing(self):
 
+        localctx = LambdaParser.TrailingContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_trailing)
+        try:
+            self.state = 153
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [30, 31]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 151
+                self.abstraction()
+                pass
+            elif token in [5, 6]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 152
+                self.notExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterNotExpr" ):
-                listener.enterNotExpr(self)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitNotExpr" ):
-                listener.exitNotExpr(self)
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitNotExpr" ):
-                return visitor.visitNotExpr(self)
-            else:
-                return visitor.visitChildren(self)
+    class PrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
 
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
 
-    class ListExprContext(ExprContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
+        def getRuleIndex(self):
+            return LambdaParser.RULE_primary
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class BracketExprContext(PrimaryContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.PrimaryContext
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(LambdaParser.ExprContext)
-            else:
-                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
+        def bracketBody(self):
+            return self.getTypedRuleContext(LambdaParser.BracketBodyContext,0)
 
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterListExpr" ):
-                listener.enterListExpr(self)
+            if hasattr( listener, "enterBracketExpr" ):
+                listener.enterBracketExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitListExpr" ):
-                listener.exitListExpr(self)
+            if hasattr( listener, "exitBracketExpr" ):
+                listener.exitBracketExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitListExpr" ):
-                return visitor.visitListExpr(self)
+            if hasattr( visitor, "visitBracketExpr" ):
+                return visitor.visitBracketExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class ParenExprContext(ExprContext):
+    class AtomExprContext(PrimaryContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.PrimaryContext
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def expr(self):
-            return self.getTypedRuleContext(LambdaParser.ExprContext,0)
+        def atom(self):
+            return self.getTypedRuleContext(LambdaParser.AtomContext,0)
 
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterParenExpr" ):
-                listener.enterParenExpr(self)
+            if hasattr( listener, "enterAtomExpr" ):
+                listener.enterAtomExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitParenExpr" ):
-                listener.exitParenExpr(self)
+            if hasattr( listener, "exitAtomExpr" ):
+                listener.exitAtomExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitParenExpr" ):
-                return visitor.visitParenExpr(self)
+            if hasattr( visitor, "visitAtomExpr" ):
+                return visitor.visitAtomExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
-    class AddSubExprContext(ExprContext):
+    class ParenExprContext(PrimaryContext):
 
-        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.ExprContext
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a LambdaParser.PrimaryContext
             super().__init__(parser)
-            self.op = None # Token
             self.copyFrom(ctx)
 
         def expr(self, i:int=None):
@@ -630,343 +1496,187 @@ class LambdaParser ( Parser ):
 
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAddSubExpr" ):
-                listener.enterAddSubExpr(self)
+            if hasattr( listener, "enterParenExpr" ):
+                listener.enterParenExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAddSubExpr" ):
-                listener.exitAddSubExpr(self)
+            if hasattr( listener, "exitParenExpr" ):
+                listener.exitParenExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAddSubExpr" ):
-                return visitor.visitAddSubExpr(self)
+            if hasattr( visitor, "visitParenExpr" ):
+                return visitor.visitParenExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
-    def expr(self, _p:int=0):
-        _parentctx = self._ctx
-        _parentState = self.state
-        localctx = LambdaParser.ExprContext(self, self._ctx, _parentState)
-        _prevctx = localctx
-        _startState = 2
-        self.enterRecursionRule(localctx, 2, self.RULE_expr, _p)
+    def primary(self):
+
+        localctx = LambdaParser.PrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_primary)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 71
+            self.state = 173
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
-            if la_ == 1:
+            token = self._input.LA(1)
+            if token in [34, 35, 36, 37]:
                 localctx = LambdaParser.AtomExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-
-                self.state = 12
+                self.enterOuterAlt(localctx, 1)
+                self.state = 155
                 self.atom()
                 pass
-
-            elif la_ == 2:
-                localctx = LambdaParser.AbstractionExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 13
-                self.abstraction()
-                pass
-
-            elif la_ == 3:
+            elif token in [24]:
                 localctx = LambdaParser.ParenExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 14
-                self.match(LambdaParser.T__0)
-                self.state = 15
-                self.expr(0)
-                self.state = 16
-                self.match(LambdaParser.T__1)
-                pass
-
-            elif la_ == 4:
-                localctx = LambdaParser.IfExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 18
-                self.match(LambdaParser.T__2)
-                self.state = 19
-                self.expr(0)
-                self.state = 20
-                self.match(LambdaParser.T__3)
-                self.state = 21
-                self.expr(0)
-                self.state = 22
-                self.match(LambdaParser.T__4)
-                self.state = 23
-                self.expr(12)
-                pass
-
-            elif la_ == 5:
-                localctx = LambdaParser.LetExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 25
-                self.match(LambdaParser.T__5)
-                self.state = 26
-                self.match(LambdaParser.ID)
-                self.state = 27
-                self.match(LambdaParser.T__6)
-                self.state = 28
-                self.expr(0)
-                self.state = 29
-                self.match(LambdaParser.T__7)
-                self.state = 30
-                self.expr(11)
-                pass
-
-            elif la_ == 6:
-                localctx = LambdaParser.NotExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 32
-                localctx.op = self._input.LT(1)
-                _la = self._input.LA(1)
-                if not(_la==20 or _la==21):
-                    localctx.op = self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 33
-                self.expr(7)
-                pass
-
-            elif la_ == 7:
-                localctx = LambdaParser.ListExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 34
-                self.match(LambdaParser.T__25)
-                self.state = 43
+                self.enterOuterAlt(localctx, 2)
+                self.state = 156
+                self.match(LambdaParser.T__23)
+                self.state = 165
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 132140499018) != 0):
-                    self.state = 35
-                    self.expr(0)
-                    self.state = 40
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 261072617568) != 0):
+                    self.state = 157
+                    self.expr()
+                    self.state = 162
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    while _la==27:
-                        self.state = 36
-                        self.match(LambdaParser.T__26)
-                        self.state = 37
-                        self.expr(0)
-                        self.state = 42
+                    while _la==25:
+                        self.state = 158
+                        self.match(LambdaParser.T__24)
+                        self.state = 159
+                        self.expr()
+                        self.state = 164
                         self._errHandler.sync(self)
                         _la = self._input.LA(1)
 
 
 
-                self.state = 45
-                self.match(LambdaParser.T__27)
-                pass
-
-            elif la_ == 8:
-                localctx = LambdaParser.FullRangeExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 46
+                self.state = 167
                 self.match(LambdaParser.T__25)
-                self.state = 47
-                self.expr(0)
-                self.state = 48
-                self.match(LambdaParser.T__26)
-                self.state = 49
-                self.expr(0)
-                self.state = 50
-                self.match(LambdaParser.T__28)
-                self.state = 51
-                self.expr(0)
-                self.state = 52
-                self.match(LambdaParser.T__27)
                 pass
+            elif token in [27]:
+                localctx = LambdaParser.BracketExprContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 168
+                self.match(LambdaParser.T__26)
+                self.state = 170
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 261072617568) != 0):
+                    self.state = 169
+                    self.bracketBody()
 
-            elif la_ == 9:
-                localctx = LambdaParser.SimpleRangeExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 54
-                self.match(LambdaParser.T__25)
-                self.state = 55
-                self.expr(0)
-                self.state = 56
-                self.match(LambdaParser.T__28)
-                self.state = 57
-                self.expr(0)
-                self.state = 58
+
+                self.state = 172
                 self.match(LambdaParser.T__27)
                 pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
-            elif la_ == 10:
-                localctx = LambdaParser.TupleExprContext(self, localctx)
-                self._ctx = localctx
-                _prevctx = localctx
-                self.state = 60
-                self.match(LambdaParser.T__0)
-                self.state = 68
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 132140499018) != 0):
-                    self.state = 61
-                    self.expr(0)
-                    self.state = 64 
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-                    while True:
-                        self.state = 62
-                        self.match(LambdaParser.T__26)
-                        self.state = 63
-                        self.expr(0)
-                        self.state = 66 
-                        self._errHandler.sync(self)
-                        _la = self._input.LA(1)
-                        if not (_la==27):
-                            break
 
+    class BracketBodyContext(ParserRuleContext):
+        __slots__ = 'parser'
 
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.dots = None # Token
 
-                self.state = 70
-                self.match(LambdaParser.T__1)
-                pass
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(LambdaParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(LambdaParser.ExprContext,i)
 
 
-            self._ctx.stop = self._input.LT(-1)
-            self.state = 92
-            self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,6,self._ctx)
-            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
-                if _alt==1:
-                    if self._parseListeners is not None:
-                        self.triggerExitRuleEvent()
-                    _prevctx = localctx
-                    self.state = 90
-                    self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
-                    if la_ == 1:
-                        localctx = LambdaParser.ApplicationExprContext(self, LambdaParser.ExprContext(self, _parentctx, _parentState))
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
-                        self.state = 73
-                        if not self.precpred(self._ctx, 14):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 14)")
-                        self.state = 74
-                        self.expr(15)
-                        pass
+        def getRuleIndex(self):
+            return LambdaParser.RULE_bracketBody
 
-                    elif la_ == 2:
-                        localctx = LambdaParser.MulDivExprContext(self, LambdaParser.ExprContext(self, _parentctx, _parentState))
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
-                        self.state = 75
-                        if not self.precpred(self._ctx, 10):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
-                        self.state = 76
-                        localctx.op = self._input.LT(1)
-                        _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3584) != 0)):
-                            localctx.op = self._errHandler.recoverInline(self)
-                        else:
-                            self._errHandler.reportMatch(self)
-                            self.consume()
-                        self.state = 77
-                        self.expr(11)
-                        pass
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBracketBody" ):
+                listener.enterBracketBody(self)
 
-                    elif la_ == 3:
-                        localctx = LambdaParser.AddSubExprContext(self, LambdaParser.ExprContext(self, _parentctx, _parentState))
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
-                        self.state = 78
-                        if not self.precpred(self._ctx, 9):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
-                        self.state = 79
-                        localctx.op = self._input.LT(1)
-                        _la = self._input.LA(1)
-                        if not(_la==12 or _la==13):
-                            localctx.op = self._errHandler.recoverInline(self)
-                        else:
-                            self._errHandler.reportMatch(self)
-                            self.consume()
-                        self.state = 80
-                        self.expr(10)
-                        pass
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBracketBody" ):
+                listener.exitBracketBody(self)
 
-                    elif la_ == 4:
-                        localctx = LambdaParser.ComparisonExprContext(self, LambdaParser.ExprContext(self, _parentctx, _parentState))
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
-                        self.state = 81
-                        if not self.precpred(self._ctx, 8):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
-                        self.state = 82
-                        localctx.op = self._input.LT(1)
-                        _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1032192) != 0)):
-                            localctx.op = self._errHandler.recoverInline(self)
-                        else:
-                            self._errHandler.reportMatch(self)
-                            self.consume()
-                        self.state = 83
-                        self.expr(9)
-                        pass
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBracketBody" ):
+                return visitor.visitBracketBody(self)
+            else:
+                return visitor.visitChildren(self)
 
-                    elif la_ == 5:
-                        localctx = LambdaParser.AndExprContext(self, LambdaParser.ExprContext(self, _parentctx, _parentState))
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
-                        self.state = 84
-                        if not self.precpred(self._ctx, 6):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
-                        self.state = 85
-                        localctx.op = self._input.LT(1)
-                        _la = self._input.LA(1)
-                        if not(_la==22 or _la==23):
-                            localctx.op = self._errHandler.recoverInline(self)
-                        else:
-                            self._errHandler.reportMatch(self)
-                            self.consume()
-                        self.state = 86
-                        self.expr(7)
-                        pass
 
-                    elif la_ == 6:
-                        localctx = LambdaParser.OrExprContext(self, LambdaParser.ExprContext(self, _parentctx, _parentState))
-                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
-                        self.state = 87
-                        if not self.precpred(self._ctx, 5):
-                            from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
-                        self.state = 88
-                        localctx.op = self._input.LT(1)
-                        _la = self._input.LA(1)
-                        if not(_la==24 or _la==25):
-                            localctx.op = self._errHandler.recoverInline(self)
-                        else:
-                            self._errHandler.reportMatch(self)
-                            self.consume()
-                        self.state = 89
-                        self.expr(6)
-                        pass
 
-             
-                self.state = 94
+
+    def bracketBody(self):
+
+        localctx = LambdaParser.BracketBodyContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_bracketBody)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 175
+            self.expr()
+            self.state = 191
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [29]:
+                self.state = 176
+                localctx.dots = self.match(LambdaParser.T__28)
+                self.state = 177
+                self.expr()
+                pass
+            elif token in [25]:
+                self.state = 178
+                self.match(LambdaParser.T__24)
+                self.state = 179
+                self.expr()
+                self.state = 189
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,6,self._ctx)
+                token = self._input.LA(1)
+                if token in [29]:
+                    self.state = 180
+                    localctx.dots = self.match(LambdaParser.T__28)
+                    self.state = 181
+                    self.expr()
+                    pass
+                elif token in [25, 28]:
+                    self.state = 186
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==25:
+                        self.state = 182
+                        self.match(LambdaParser.T__24)
+                        self.state = 183
+                        self.expr()
+                        self.state = 188
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
 
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+            elif token in [28]:
+                pass
+            else:
+                pass
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
             self._errHandler.recover(self, re)
         finally:
-            self.unrollRecursionContexts(_parentctx)
+            self.exitRule()
         return localctx
 
 
@@ -1010,33 +1720,33 @@ class LambdaParser ( Parser ):
     def abstraction(self):
 
         localctx = LambdaParser.AbstractionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 4, self.RULE_abstraction)
+        self.enterRule(localctx, 32, self.RULE_abstraction)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 95
+            self.state = 193
             _la = self._input.LA(1)
             if not(_la==30 or _la==31):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 97 
+            self.state = 195 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 96
+                self.state = 194
                 self.match(LambdaParser.ID)
-                self.state = 99 
+                self.state = 197 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==36):
+                if not (_la==37):
                     break
 
-            self.state = 101
+            self.state = 199
             self.match(LambdaParser.T__31)
-            self.state = 102
-            self.expr(0)
+            self.state = 200
+            self.expr()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1088,13 +1798,13 @@ class LambdaParser ( Parser ):
     def atom(self):
 
         localctx = LambdaParser.AtomContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 6, self.RULE_atom)
+        self.enterRule(localctx, 34, self.RULE_atom)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 104
+            self.state = 202
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 128849018880) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 257698037760) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -1109,41 +1819,5 @@ class LambdaParser ( Parser ):
 
 
 
-    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
-        if self._predicates == None:
-            self._predicates = dict()
-        self._predicates[1] = self.expr_sempred
-        pred = self._predicates.get(ruleIndex, None)
-        if pred is None:
-            raise Exception("No predicate with index:" + str(ruleIndex))
-        else:
-            return pred(localctx, predIndex)
-
-    def expr_sempred(self, localctx:ExprContext, predIndex:int):
-            if predIndex == 0:
-                return self.precpred(self._ctx, 14)
-         
-
-            if predIndex == 1:
-                return self.precpred(self._ctx, 10)
-         
-
-            if predIndex == 2:
-                return self.precpred(self._ctx, 9)
-         
-
-            if predIndex == 3:
-                return self.precpred(self._ctx, 8)
-         
-
-            if predIndex == 4:
-                return self.precpred(self._ctx, 6)
-         
-
-            if predIndex == 5:
-                return self.precpred(self._ctx, 5)
-         
-
-
 
 
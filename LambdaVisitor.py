@@ -14,73 +14,83 @@ class LambdaVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#AndExpr.
-    def visitAndExpr(self, ctx:LambdaParser.AndExprContext):
+    # Visit a parse tree produced by LambdaParser#program.
+    def visitProgram(self, ctx:LambdaParser.ProgramContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#IfExpr.
-    def visitIfExpr(self, ctx:LambdaParser.IfExprContext):
+    # Visit a parse tree produced by LambdaParser#statement.
+    def visitStatement(self, ctx:LambdaParser.StatementContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#ComparisonExpr.
-    def visitComparisonExpr(self, ctx:LambdaParser.ComparisonExprContext):
+    # Visit a parse tree produced by LambdaParser#AbstractionExpr.
+    def visitAbstractionExpr(self, ctx:LambdaParser.AbstractionExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#LetExpr.
-    def visitLetExpr(self, ctx:LambdaParser.LetExprContext):
+    # Visit a parse tree produced by LambdaParser#OperatorExpr.
+    def visitOperatorExpr(self, ctx:LambdaParser.OperatorExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#AtomExpr.
-    def visitAtomExpr(self, ctx:LambdaParser.AtomExprContext):
+    # Visit a parse tree produced by LambdaParser#orExpr.
+    def visitOrExpr(self, ctx:LambdaParser.OrExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#TupleExpr.
-    def visitTupleExpr(self, ctx:LambdaParser.TupleExprContext):
+    # Visit a parse tree produced by LambdaParser#andExpr.
+    def visitAndExpr(self, ctx:LambdaParser.AndExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#OrExpr.
-    def visitOrExpr(self, ctx:LambdaParser.OrExprContext):
+    # Visit a parse tree produced by LambdaParser#unaryExpr.
+    def visitUnaryExpr(self, ctx:LambdaParser.UnaryExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#SimpleRangeExpr.
-    def visitSimpleRangeExpr(self, ctx:LambdaParser.SimpleRangeExprContext):
+    # Visit a parse tree produced by LambdaParser#notExpr.
+    def visitNotExpr(self, ctx:LambdaParser.NotExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#AbstractionExpr.
-    def visitAbstractionExpr(self, ctx:LambdaParser.AbstractionExprContext):
+    # Visit a parse tree produced by LambdaParser#comparisonExpr.
+    def visitComparisonExpr(self, ctx:LambdaParser.ComparisonExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#ApplicationExpr.
-    def visitApplicationExpr(self, ctx:LambdaParser.ApplicationExprContext):
+    # Visit a parse tree produced by LambdaParser#addSubExpr.
+    def visitAddSubExpr(self, ctx:LambdaParser.AddSubExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#MulDivExpr.
+    # Visit a parse tree produced by LambdaParser#mulDivExpr.
     def visitMulDivExpr(self, ctx:LambdaParser.MulDivExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#FullRangeExpr.
-    def visitFullRangeExpr(self, ctx:LambdaParser.FullRangeExprContext):
+    # Visit a parse tree produced by LambdaParser#applicationExpr.
+    def visitApplicationExpr(self, ctx:LambdaParser.ApplicationExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#NotExpr.
-    def visitNotExpr(self, ctx:LambdaParser.NotExprContext):
+    # Visit a parse tree produced by LambdaParser#IfExpr.
+    def visitIfExpr(self, ctx:LambdaParser.IfExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by LambdaParser#LetExpr.
+    def visitLetExpr(self, ctx:LambdaParser.LetExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#ListExpr.
-    def visitListExpr(self, ctx:LambdaParser.ListExprContext):
+    # Visit a parse tree produced by LambdaParser#trailing.
+    def visitTrailing(self, ctx:LambdaParser.TrailingContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by LambdaParser#AtomExpr.
+    def visitAtomExpr(self, ctx:LambdaParser.AtomExprContext):
         return self.visitChildren(ctx)
 
 
@@ -89,8 +99,13 @@ class LambdaVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by LambdaParser#AddSubExpr.
-    def visitAddSubExpr(self, ctx:LambdaParser.AddSubExprContext):
+    # Visit a parse tree produced by LambdaParser#BracketExpr.
+    def visitBracketExpr(self, ctx:LambdaParser.BracketExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by LambdaParser#bracketBody.
+    def visitBracketBody(self, ctx:LambdaParser.BracketBodyContext):
         return self.visitChildren(ctx)
 
 
@@ -0,0 +1,133 @@
+import threading
+from typing import Iterator
+
+from antlr4 import InputStream, CommonTokenStream, PredictionMode, Token
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from LambdaLexer import LambdaLexer
+from LambdaParser import LambdaParser
+from visitor import CustomVisitor
+from ast_tree import ASTNode
+
+
+# Full LL prediction on every decision, with a new parser for each call. Kept
+# to compare against the two-stage default.
+def parse_lambda_expr_ll(expr: str) -> ASTNode:
+    input_stream = InputStream(expr)
+    lexer = LambdaLexer(input_stream)
+    stream = CommonTokenStream(lexer)
+    parser = LambdaParser(stream)
+    tree = parser.prog()
+    return CustomVisitor().visit(tree)
+
+
+_thread_local = threading.local()
+
+
+def _thread_parser() -> tuple[LambdaLexer, CommonTokenStream, LambdaParser]:
+    cached = getattr(_thread_local, "parser", None)
+    if cached is None:
+        lexer = LambdaLexer(InputStream(""))
+        stream = CommonTokenStream(lexer)
+        cached = (lexer, stream, LambdaParser(stream))
+        _thread_local.parser = cached
+    return cached
+
+
+# Parses that SLL could not settle and that were rerun with full LL, in this
+# thread. Only the LL stage makes full-context predictions, so as long as this
+# stays at zero none were made.
+def ll_fallbacks() -> int:
+    return getattr(_thread_local, "fallbacks", 0)
+
+
+def _count_fallback():
+    _thread_local.fallbacks = ll_fallbacks() + 1
+
+
+# Two-stage parse: SLL prediction with a bail-out strategy is enough for
+# almost every input, full LL is only rerun when SLL reports an error.
+def _parse_two_stage(parser: LambdaParser, rule):
+    parser.removeErrorListeners()
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+
+    try:
+        return rule()
+    except ParseCancellationException:
+        _count_fallback()
+        parser.reset()
+        parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = DefaultErrorStrategy()
+        return rule()
+
+
+# The default front-end. The lexer/parser pair is reused per thread so the
+# warmed DFA is kept.
+def parse_lambda_expr(expr: str) -> ASTNode:
+    lexer, stream, parser = _thread_parser()
+    lexer.inputStream = InputStream(expr)
+    stream.setTokenSource(lexer)
+    parser.setTokenStream(stream)
+
+    tree = _parse_two_stage(parser, parser.prog)
+    return CustomVisitor().visit(tree)
+
+
+# Token stream for program files. Tokens of statements that were already
+# handed out are dropped, so the buffer only ever holds the statement being
+# parsed and rewinding the parser (seek(0)) goes back to its first token.
+class StatementTokenStream(CommonTokenStream):
+    def drop_parsed(self):
+        del self.tokens[: self.index]
+        for index, token in enumerate(self.tokens):
+            token.tokenIndex = index
+        self.index = 0
+
+
+# A malformed statement raises SyntaxError instead of being recovered, as
+# recovery would consume the ';' after it and merge it with the next one.
+def _parse_statement(parser: LambdaParser, two_stage: bool):
+    try:
+        if two_stage:
+            parser._interp.predictionMode = PredictionMode.SLL
+            try:
+                return parser.statement()
+            except ParseCancellationException:
+                _count_fallback()
+                parser.reset()
+                parser._interp.predictionMode = PredictionMode.LL
+        return parser.statement()
+    except ParseCancellationException as e:
+        token = e.args[0].offendingToken
+        text = "" if token.type == Token.EOF else token.text
+        raise SyntaxError(
+            f"unexpected {text or 'end of input'!r} at {token.start}"
+        ) from None
+
+
+def _parse_program_antlr(source: str, two_stage: bool) -> Iterator[ASTNode]:
+    stream = StatementTokenStream(LambdaLexer(InputStream(source)))
+    parser = LambdaParser(stream)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    visitor = CustomVisitor()
+
+    while True:
+        while stream.LA(1) == LambdaParser.SEMI:
+            stream.consume()
+        if stream.LA(1) == Token.EOF:
+            return
+
+        stream.drop_parsed()
+        yield visitor.visit(_parse_statement(parser, two_stage))
+
+
+def parse_program(source: str) -> Iterator[ASTNode]:
+    return _parse_program_antlr(source, two_stage=True)
+
+
+def parse_program_ll(source: str) -> Iterator[ASTNode]:
+    return _parse_program_antlr(source, two_stage=False)
@@ -1,5 +1,10 @@
-import copy
-import uuid
+import functools
+import io
+import threading
+import weakref
+from typing import NamedTuple
+
+from tracing import StepEvent
 
 
 def fresh_name(original: str, forbidden: set[str]) -> str:
@@ -12,14 +17,111 @@ def fresh_name(original: str, forbidden: set[str]) -> str:
     return f"{original}{i}"
 
 
+# Variable names are interned: every distinct name in use has one Symbol, so
+# comparing variables is an identity check and hashing one returns the hash
+# cached on its symbol. The name is only looked up again for printing.
+#
+# The table holds symbols weakly: a symbol lives as long as a Variable uses
+# it, so the names fresh_variable invents while renaming go away with the
+# terms of the reduction that needed them, and a long REPL session or server
+# doesn't keep every name it has ever seen. Symbols for the suffixed names
+# tried by fresh_variable are remembered on the symbol they were derived from,
+# weakly too, so renaming doesn't format strings again while they are in use.
+class Symbol:
+    __slots__ = ("name", "hash", "suffixed", "__weakref__")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hash = hash(name)
+        self.suffixed = None
+
+
+class SymbolTable:
+    def __init__(self):
+        self.symbols = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def intern(self, name: str) -> Symbol:
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            with self._lock:
+                symbol = self.symbols.get(name)
+                if symbol is None:
+                    symbol = self.symbols[name] = Symbol(name)
+        return symbol
+
+    def with_suffix(self, symbol: Symbol, suffix: int) -> Symbol:
+        suffixed = symbol.suffixed
+        if suffixed is None:
+            suffixed = symbol.suffixed = weakref.WeakValueDictionary()
+        result = suffixed.get(suffix)
+        if result is None:
+            result = suffixed[suffix] = self.intern(f"{symbol.name}{suffix}")
+        return result
+
+
+symbols = SymbolTable()
+
+
+# Variable counterpart of fresh_name, comparing symbols instead of strings.
+def fresh_variable(var: "Variable", forbidden) -> "Variable":
+    if var not in forbidden:
+        return var
+
+    suffix = 1
+    while True:
+        candidate = Variable.from_symbol(symbols.with_suffix(var.symbol, suffix))
+        if candidate not in forbidden:
+            return candidate
+        suffix += 1
+
+
 class ASTNode:
+    # Nodes are allocated in huge numbers during reduction, so every class in
+    # the hierarchy is slotted. _fields lists all slots of a class, base class
+    # slots first, for code that walks nodes generically. _hash is only set
+    # on nodes interned by hashcons.HashConsStore.
+    #
+    # Nodes are never modified once built: the reducers share unchanged
+    # subterms between steps and only copy the path to a redex. That also
+    # keeps the free variables and the tree size valid, which are computed
+    # once per node and kept in _free and _size.
+    __slots__ = ("_hash", "_size", "_free", "__weakref__")
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__base__._fields + tuple(vars(cls).get("__slots__", ()))
+
+    def __str__(self):
+        return format_ast(self)
+
     def __repr__(self):
         return self.__str__()
 
     def __eq__(self, value):
-        return self.__str__() == value.__str__()
-
-    def free_variables(self):
+        if self is value:
+            return True
+        if not isinstance(value, ASTNode):
+            return NotImplemented
+        return structurally_equal(self, value)
+
+    # Printed form of a composite node: literal strings and child nodes, in
+    # order. Leaves return None and are printed with their own __str__.
+    def _parts(self):
+        return None
+
+    def free_variables(self) -> frozenset:
+        try:
+            return self._free
+        except AttributeError:
+            free = self._free = frozenset(self._free_variables())
+            return free
+
+    def _free_variables(self):
         raise NotImplementedError()
 
     def bound_variables(self):
@@ -33,21 +135,37 @@ class ASTNode:
 
 
 class Variable(ASTNode):
-    def __init__(self, name):
-        self.name = name
+    __slots__ = ("symbol",)
+
+    def __init__(self, name: str):
+        self.symbol = symbols.intern(name)
+
+    @classmethod
+    def from_symbol(cls, symbol: Symbol) -> "Variable":
+        var = object.__new__(cls)
+        var.symbol = symbol
+        return var
+
+    @property
+    def name(self) -> str:
+        return self.symbol.name
+
+    # Symbols are only meaningful within one process.
+    def __reduce__(self):
+        return (Variable, (self.name,))
 
     def __str__(self):
-        return self.name
+        return self.symbol.name
 
     def __hash__(self):
-        return hash((self.name))
+        return self.symbol.hash
 
     def __eq__(self, other):
-        if not isinstance(other, Variable):
-            return False
-        return (self.name) == (other.name)
+        return self is other or (
+            type(other) is Variable and self.symbol is other.symbol
+        )
 
-    def free_variables(self):
+    def _free_variables(self):
         return set([self])
 
     def bound_variables(self):
@@ -67,22 +185,22 @@ class Variable(ASTNode):
 
 
 class Abstraction(ASTNode):
+    __slots__ = ("param", "body")
+
     def __init__(self, param: Variable, body: ASTNode):
         self.param = param
         self.body = body
 
-    def __str__(self):
-        return f"(\{self.param}.{self.body})"
+    def _parts(self):
+        return ("(\\", self.param, ".", self.body, ")")
 
     def __hash__(self):
-        return hash((self.param, self.body))
-
-    def __eq__(self, other):
-        if not isinstance(other, Abstraction):
-            return False
-        return (self.param, self.body) == (other.param, other.body)
+        try:
+            return self._hash
+        except AttributeError:
+            return hash((self.param, self.body))
 
-    def free_variables(self):
+    def _free_variables(self):
         return self.body.free_variables()
 
     def bound_variables(self):
@@ -104,29 +222,29 @@ class Abstraction(ASTNode):
             if self.param not in new_expr.free_variables():
                 return Abstraction(self.param, self.body.reduce(var, new_expr))
 
-            new = Variable(fresh_name(self.param, new_expr.free_variables()))
+            new = fresh_variable(self.param, new_expr.free_variables())
             new_body = self.body.substitute(self.param, new)
 
             return Abstraction(new, new_body.reduce(var, new_expr))
 
 
 class Application(ASTNode):
+    __slots__ = ("func", "arg")
+
     def __init__(self, func: ASTNode, arg: ASTNode):
         self.func = func
         self.arg = arg
 
-    def __str__(self):
-        return f"({self.func} {self.arg})"
+    def _parts(self):
+        return ("(", self.func, " ", self.arg, ")")
 
     def __hash__(self):
-        return hash((self.func, self.arg))
-
-    def __eq__(self, other):
-        if not isinstance(other, Application):
-            return False
-        return (self.func, self.arg) == (other.func, other.arg)
+        try:
+            return self._hash
+        except AttributeError:
+            return hash((self.func, self.arg))
 
-    def free_variables(self):
+    def _free_variables(self):
         return self.func.free_variables() | self.arg.free_variables()
 
     def bound_variables(self):
@@ -146,13 +264,15 @@ class Application(ASTNode):
 
 
 class Value(ASTNode):
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
     def __str__(self):
         return f"{self.value}"
 
-    def free_variables(self):
+    def _free_variables(self):
         return set()
 
     def bound_variables(self):
@@ -166,24 +286,85 @@ class Value(ASTNode):
 
 
 class Number(Value):
-    pass
+    __slots__ = ()
 
 
 class Boolean(Value):
+    __slots__ = ()
+
     def __str__(self):
         return "true" if self.value else "false"
 
 
+NUMBER_OPERATORS = {
+    "+": lambda x, y: x + y,
+    "-": lambda x, y: x - y,
+    "*": lambda x, y: x * y,
+    "/": lambda x, y: x / y,
+    "%": lambda x, y: x % y,
+    "==": lambda x, y: x == y,
+    "!=": lambda x, y: x != y,
+    "<": lambda x, y: x < y,
+    ">": lambda x, y: x > y,
+    "<=": lambda x, y: x <= y,
+    ">=": lambda x, y: x >= y,
+}
+
+COMPARISON_OPERATORS = {"==", "!=", "<", ">", "<=", ">="}
+
+BOOLEAN_OPERATORS = {
+    "&&": lambda x, y: x and y,
+    "||": lambda x, y: x or y,
+}
+
+UNARY_OPERATORS = {
+    "!": lambda x: not x,
+}
+
+
+# Applies an operator to operands that are already reduced. Returns None when
+# the operands aren't values the operator works on, e.g. a free variable.
+def fold_binary(left: ASTNode, op: str, right: ASTNode) -> ASTNode:
+    if isinstance(left, Number) and isinstance(right, Number):
+        if op in NUMBER_OPERATORS:
+            result = NUMBER_OPERATORS[op](left.value, right.value)
+            return (
+                Boolean(bool(result))
+                if op in COMPARISON_OPERATORS
+                else Number(float(result))
+            )
+
+    if isinstance(left, Boolean) and isinstance(right, Boolean):
+        if op in BOOLEAN_OPERATORS:
+            result = BOOLEAN_OPERATORS[op](left.value, right.value)
+            return Boolean(bool(result))
+
+    return None
+
+
+def fold_unary(op: str, value: ASTNode) -> ASTNode:
+    if isinstance(value, Boolean) and op in UNARY_OPERATORS:
+        return Boolean(bool(UNARY_OPERATORS[op](value.value)))
+
+    return None
+
+
 class IfExpression(ASTNode):
+    __slots__ = ("condition", "then_expr", "else_expr")
+
     def __init__(self, condition: ASTNode, then_expr: ASTNode, else_expr: ASTNode):
         self.condition = condition
         self.then_expr = then_expr
         self.else_expr = else_expr
 
-    def __str__(self):
-        return f"(if {self.condition} then {self.then_expr} else {self.else_expr})"
+    def _parts(self):
+        return (
+            "(if ", self.condition,
+            " then ", self.then_expr,
+            " else ", self.else_expr, ")",
+        )
 
-    def free_variables(self):
+    def _free_variables(self):
         return (
             self.condition.free_variables()
             | self.then_expr.free_variables()
@@ -223,15 +404,17 @@ class IfExpression(ASTNode):
 
 
 class BinaryOperation(ASTNode):
+    __slots__ = ("left", "op", "right")
+
     def __init__(self, left: ASTNode, op: str, right: ASTNode):
         self.left = left
         self.op = op
         self.right = right
 
-    def __str__(self):
-        return f"({self.left} {self.op} {self.right})"
+    def _parts(self):
+        return ("(", self.left, f" {self.op} ", self.right, ")")
 
-    def free_variables(self):
+    def _free_variables(self):
         return self.left.free_variables() | self.right.free_variables()
 
     def bound_variables(self):
@@ -248,51 +431,24 @@ class BinaryOperation(ASTNode):
         left_reduced = self.left.reduce(var, new_expr)
         right_reduced = self.right.reduce(var, new_expr)
 
-        if isinstance(left_reduced, Number) and isinstance(right_reduced, Number):
-            ops = {
-                "+": lambda x, y: x + y,
-                "-": lambda x, y: x - y,
-                "*": lambda x, y: x * y,
-                "/": lambda x, y: x / y,
-                "%": lambda x, y: x % y,
-                "==": lambda x, y: x == y,
-                "!=": lambda x, y: x != y,
-                "<": lambda x, y: x < y,
-                ">": lambda x, y: x > y,
-                "<=": lambda x, y: x <= y,
-                ">=": lambda x, y: x >= y,
-            }
-
-            if self.op in ops:
-                result = ops[self.op](left_reduced.value, right_reduced.value)
-                return (
-                    Boolean(bool(result))
-                    if self.op in {"==", "!=", "<", ">", "<=", ">="}
-                    else Number(float(result))
-                )
-
-        if isinstance(left_reduced, Boolean) and isinstance(right_reduced, Boolean):
-            ops = {
-                "&&": lambda x, y: x and y,
-                "||": lambda x, y: x or y,
-            }
-
-            if self.op in ops:
-                result = ops[self.op](left_reduced.value, right_reduced.value)
-                return Boolean(bool(result))
+        result = fold_binary(left_reduced, self.op, right_reduced)
+        if result is not None:
+            return result
 
         return BinaryOperation(left_reduced, self.op, right_reduced)
 
 
 class UnaryOperation(ASTNode):
+    __slots__ = ("op", "value")
+
     def __init__(self, op: str, value: ASTNode):
         self.op = op
         self.value = value
 
-    def __str__(self):
-        return f"({self.op} ({self.value}))"
+    def _parts(self):
+        return (f"({self.op} (", self.value, "))")
 
-    def free_variables(self):
+    def _free_variables(self):
         return self.value.free_variables()
 
     def bound_variables(self):
@@ -304,28 +460,25 @@ class UnaryOperation(ASTNode):
     def reduce(self, var: "Variable", new_expr: "ASTNode"):
         value_reduced = self.value.reduce(var, new_expr)
 
-        if isinstance(value_reduced, Boolean):
-            ops = {
-                "!": lambda x: not x,
-            }
-
-            if self.op in ops:
-                result = ops[self.op](value_reduced.value)
-                return Boolean(bool(result))
+        result = fold_unary(self.op, value_reduced)
+        if result is not None:
+            return result
 
         return UnaryOperation(self.op, value_reduced)
 
 
 class LetExpression(ASTNode):
+    __slots__ = ("var", "bound_expr", "body")
+
     def __init__(self, var: Variable, bound_expr, body):
         self.var = var
         self.bound_expr = bound_expr
         self.body = body
 
-    def __str__(self):
-        return f"let {self.var} = {self.bound_expr} in {self.body}"
+    def _parts(self):
+        return ("let ", self.var, " = ", self.bound_expr, " in ", self.body)
 
-    def free_variables(self):
+    def _free_variables(self):
         bound_fv = self.bound_expr.free_variables()
         body_fv = self.body.free_variables()
         return bound_fv | (body_fv - self.var.free_variables())
@@ -353,18 +506,22 @@ class LetExpression(ASTNode):
 
 
 class String(Value):
+    __slots__ = ()
+
     def __str__(self):
         return f'"{self.value}"'
 
 
 class List(ASTNode):
+    __slots__ = ("elements",)
+
     def __init__(self, elements):
         self.elements = elements
 
-    def __str__(self):
-        return f"[{', '.join(str(e) for e in self.elements)}]"
+    def _parts(self):
+        return ("[", *separated(self.elements), "]")
 
-    def free_variables(self):
+    def _free_variables(self):
         fv = set()
         for e in self.elements:
             fv.update(e.free_variables())
@@ -384,13 +541,15 @@ class List(ASTNode):
 
 
 class Tuple(ASTNode):
+    __slots__ = ("elements",)
+
     def __init__(self, elements):
         self.elements = elements
 
-    def __str__(self):
-        return f"({', '.join(str(e) for e in self.elements)})"
+    def _parts(self):
+        return ("(", *separated(self.elements), ")")
 
-    def free_variables(self):
+    def _free_variables(self):
         fv = set()
         for e in self.elements:
             fv.update(e.free_variables())
@@ -410,18 +569,21 @@ class Tuple(ASTNode):
 
 
 class RangeExpression(ASTNode):
+    __slots__ = ("start", "end", "step")
+
     def __init__(self, start, end, step=None):
         self.start = start
         self.end = end
         self.step = step
 
-    def __str__(self):
-        if self.step:
-            return f"[{self.start}, {self.step}..{self.end}]"
-        return f"[{self.start}..{self.end}]"
+    def _parts(self):
+        if self.step is not None:
+            return ("[", self.start, ", ", self.step, "..", self.end, "]")
+        return ("[", self.start, "..", self.end, "]")
 
-    def free_variables(self):
-        fv = self.start.free_variables().union(self.end.free_variables())
+    def _free_variables(self):
+        fv = set(self.start.free_variables())
+        fv.update(self.end.free_variables())
         if self.step:
             fv.update(self.step.free_variables())
         return fv
@@ -446,6 +608,8 @@ class RangeExpression(ASTNode):
 
 
 class BuiltinFunction(Value):
+    __slots__ = ("id", "name", "func")
+
     def __init__(self, id, name, func):
         self.id = id
         self.name = name
@@ -458,6 +622,204 @@ class BuiltinFunction(Value):
         return f"{self.name}<{self.id}>"
 
 
+def separated(elements):
+    for i, e in enumerate(elements):
+        if i:
+            yield ", "
+        yield e
+
+
+PRINT_CHUNK_SIZE = 64 * 1024
+ELLIPSIS = "..."
+
+
+# Iterative printer: the nodes still to be printed are kept on an explicit
+# stack, so depth is only limited by memory, and text goes to sink.write() in
+# chunks of about PRINT_CHUNK_SIZE characters. Only max_depth levels of
+# composite nodes are printed, deeper ones print as ELLIPSIS, and output
+# stops with ELLIPSIS after max_length characters. Returns whether anything
+# was left out.
+def write_ast(node: ASTNode, sink, max_length: int = None, max_depth: int = None):
+    buffer = []
+    written = 0
+    flushed = 0
+    truncated = False
+    # One iterator over the parts of each node being printed; the depth of a
+    # node is the number of iterators below it.
+    stack = [iter((node,))]
+
+    while stack:
+        for item in stack[-1]:
+            if type(item) is str:
+                text = item
+            else:
+                parts = item._parts()
+                if parts is None:
+                    text = str(item)
+                elif max_depth is not None and len(stack) > max_depth:
+                    text = ELLIPSIS
+                    truncated = True
+                else:
+                    stack.append(iter(parts))
+                    break
+
+            if max_length is not None and written + len(text) > max_length:
+                buffer.append(text[: max_length - written])
+                buffer.append(ELLIPSIS)
+                truncated = True
+                stack.clear()
+                break
+
+            buffer.append(text)
+            written += len(text)
+            if written - flushed >= PRINT_CHUNK_SIZE:
+                sink.write("".join(buffer))
+                buffer.clear()
+                flushed = written
+        else:
+            stack.pop()
+
+    if buffer:
+        sink.write("".join(buffer))
+    return truncated
+
+
+def format_ast(node: ASTNode, max_length: int = None, max_depth: int = None) -> str:
+    sink = io.StringIO()
+    write_ast(node, sink, max_length, max_depth)
+    return sink.getvalue()
+
+
+_MISSING = object()
+
+
+# Slots that were never assigned (e.g. BuiltinFunction.value) are skipped.
+def field_items(node: ASTNode):
+    for name in node._fields:
+        value = getattr(node, name, _MISSING)
+        if value is not _MISSING:
+            yield name, value
+
+
+# Structural equality: same classes, equal scalar fields (of the same type, so
+# 1 and 1.0 differ like their printed forms do) and equal children. Interned
+# nodes with different cached hashes are rejected without descending.
+def structurally_equal(a: ASTNode, b: ASTNode) -> bool:
+    stack = [(a, b)]
+
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+        if type(a) is not type(b):
+            return False
+        hash_a = getattr(a, "_hash", None)
+        hash_b = getattr(b, "_hash", None)
+        if hash_a is not None and hash_b is not None and hash_a != hash_b:
+            return False
+
+        for name in a._fields:
+            x = getattr(a, name, _MISSING)
+            y = getattr(b, name, _MISSING)
+            if isinstance(x, ASTNode):
+                if not isinstance(y, ASTNode):
+                    return False
+                stack.append((x, y))
+            elif isinstance(x, list):
+                if not isinstance(y, list) or len(x) != len(y):
+                    return False
+                stack.extend(zip(x, y))
+            elif x is not y and (type(x) is not type(y) or x != y):
+                return False
+
+    return True
+
+
+# Number of nodes in the tree, counting shared subterms once per use. Sizes
+# are kept in _size, so after a reduction step only the new nodes are
+# counted.
+def term_size(node: ASTNode) -> int:
+    try:
+        return node._size
+    except AttributeError:
+        pass
+
+    stack = [node]
+    while stack:
+        obj = stack[-1]
+        if hasattr(obj, "_size"):
+            stack.pop()
+            continue
+
+        size = 1
+        pending = False
+        for name in obj._fields:
+            value = getattr(obj, name, None)
+            if isinstance(value, ASTNode):
+                children = (value,)
+            elif isinstance(value, list):
+                children = value
+            else:
+                continue
+            for child in children:
+                try:
+                    size += child._size
+                except AttributeError:
+                    stack.append(child)
+                    pending = True
+
+        if not pending:
+            obj._size = size
+            stack.pop()
+
+    return node._size
+
+
+def shallow_copy(node: ASTNode) -> ASTNode:
+    copy = object.__new__(type(node))
+    for name, value in field_items(node):
+        setattr(copy, name, value)
+    return copy
+
+
+# Iterative counterpart of copy.deepcopy for ASTs, so that trees nested far
+# deeper than the recursion limit can still be copied.
+def copy_ast(node: ASTNode) -> ASTNode:
+    copies = {}
+    originals = []
+    stack = [node]
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in copies:
+            continue
+        copies[id(obj)] = object.__new__(type(obj))
+        originals.append(obj)
+
+        for _, value in field_items(obj):
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+
+    def convert(value):
+        if isinstance(value, ASTNode):
+            return copies[id(value)]
+        elif isinstance(value, list):
+            return [copies[id(e)] for e in value]
+        return value
+
+    for obj in originals:
+        copy = copies[id(obj)]
+        for name, value in field_items(obj):
+            setattr(copy, name, convert(value))
+        free = getattr(obj, "_free", None)
+        if free is not None:
+            copy._free = free
+
+    return copies[id(node)]
+
+
 def do_reduce(redex: ASTNode, reduce) -> ASTNode:
     def is_reducible_element(node: ASTNode) -> bool:
         return isinstance(
@@ -486,27 +848,20 @@ def do_reduce(redex: ASTNode, reduce) -> ASTNode:
         if isinstance(right_reduced, Application):
             right_reduced = reduce(right_reduced)
 
-        redex.left = left_reduced
-        redex.right = right_reduced
-
-        return redex.reduce(None, None)
+        return BinaryOperation(left_reduced, redex.op, right_reduced).reduce(None, None)
 
     elif isinstance(redex, (UnaryOperation, IfExpression, LetExpression)):
         return redex.reduce(None, None)
 
     elif isinstance(redex, List):
-        redex.elements = [
-            reduce(e) if is_reducible_element(e) else e for e in redex.elements
-        ]
-
-        return redex
+        return List(
+            [reduce(e) if is_reducible_element(e) else e for e in redex.elements]
+        )
 
     elif isinstance(redex, Tuple):
-        redex.elements = [
-            do_reduce(e) if is_reducible_element(e) else e for e in redex.elements
-        ]
-
-        return redex
+        return Tuple(
+            [do_reduce(e) if is_reducible_element(e) else e for e in redex.elements]
+        )
 
     elif isinstance(redex, RangeExpression):
         return redex
@@ -514,6 +869,23 @@ def do_reduce(redex: ASTNode, reduce) -> ASTNode:
     return redex
 
 
+# Result of one reduction step. `changed` tells the reduction loops whether
+# the step made progress, so they don't have to compare whole terms.
+class Step(NamedTuple):
+    node: ASTNode
+    changed: bool
+
+
+# Beta and builtin steps always make progress. The other redexes can be stuck
+# (e.g. `x + 1` with a free x), which shows as a result equal to the redex.
+def contract(redex: ASTNode, reduce) -> Step:
+    if isinstance(redex, Application):
+        return Step(do_reduce(redex, reduce), True)
+
+    reduced = do_reduce(redex, reduce)
+    return Step(reduced, reduced != redex)
+
+
 def is_redex(node: ASTNode) -> bool:
     return (
         (
@@ -527,67 +899,166 @@ def is_redex(node: ASTNode) -> bool:
     )
 
 
-def nor_step(node):
-    def find_redex(current, parent=None, key=None):
-        if is_redex(current):
-            return (current, parent, key)
+# Children searched for a redex, in leftmost-outermost order.
+REDEX_SEARCH_FIELDS = {
+    Application: ("func", "arg"),
+    Abstraction: ("body",),
+    RangeExpression: ("start", "end", "step"),
+}
 
-        if isinstance(current, Application):
-            result = find_redex(current.func, current, "func")
-            if result[0] is not None:
-                return result
-            return find_redex(current.arg, current, "arg")
 
-        elif isinstance(current, Abstraction):
-            return find_redex(current.body, current, "body")
+# `normalize` reduces builtin arguments and list elements; the reduction
+# loops pass one that reports to their observer.
+def nor_step(node, normalize=None) -> Step:
+    if normalize is None:
+        normalize = normal_order_reduction
 
-        elif isinstance(current, RangeExpression):
-            result = find_redex(current.start, current, "start")
-            if result[0] is not None:
-                return result
+    # (node, field) pairs on the path from the root to the redex.
+    path = []
 
-            result = find_redex(current.end, current, "end")
-            if result[0] is not None:
-                return result
+    def find_redex(current):
+        if is_redex(current):
+            return current
 
-            result = find_redex(current.step, current, "step")
-            if result[0] is not None:
-                return result
+        for key in REDEX_SEARCH_FIELDS.get(type(current), ()):
+            path.append((current, key))
+            redex = find_redex(getattr(current, key))
+            if redex is not None:
+                return redex
+            path.pop()
 
-        return (None, None, None)
+        return None
 
-    redex, parent, key = find_redex(node)
+    redex = find_redex(node)
 
     if redex is None:
         if isinstance(node, (List, Tuple)):
-            for i, elem in enumerate(node.elements):
-                node.elements[i] = normal_order_reduction(elem)
+            elements = [normalize(elem) for elem in node.elements]
+            if any(new is not old for new, old in zip(elements, node.elements)):
+                return Step(type(node)(elements), True)
 
-        return node
+        return Step(node, False)
 
-    reduced = do_reduce(redex, normal_order_reduction)
+    reduced, changed = contract(redex, normalize)
 
-    if parent is None:
-        return reduced
+    if not changed:
+        return Step(node, False)
 
-    if isinstance(key, str):
+    # Path copying: the ancestors of the redex are copied, everything else
+    # is shared with the previous term.
+    for parent, key in reversed(path):
+        parent = shallow_copy(parent)
         setattr(parent, key, reduced)
-    elif isinstance(key, int):
-        parent.elements[key] = reduced
-
-    return node
+        reduced = parent
+
+    return Step(reduced, True)
+
+
+# Performs the same steps as repeated nor_step() calls, but keeps the path
+# from the root to the last contraction site between steps and resumes the
+# search for the next redex there. Everything to the left of that site was
+# already searched and hasn't changed, and the only node above it that can
+# have become a redex is its parent, when the function position of an
+# application now holds an abstraction.
+class NormalOrderZipper:
+    def __init__(self, node: ASTNode, normalize=None):
+        self.normalize = normalize or normal_order_reduction
+        self.reset(node)
+
+    def reset(self, node: ASTNode):
+        self.root = node
+        self.focus = node
+        # [parent, position of the focus in the parent's search fields]
+        self.path = []
+
+    # Moves the focus to the next redex in leftmost-outermost order, starting
+    # at the focus itself. Returns False, with the focus back on the root,
+    # once the rest of the term has been searched.
+    def find_redex(self) -> bool:
+        focus = self.focus
+        path = self.path
+
+        while not is_redex(focus):
+            fields = REDEX_SEARCH_FIELDS.get(type(focus), ())
+            index = 0
+
+            while True:
+                while index < len(fields) and getattr(focus, fields[index]) is None:
+                    index += 1
+
+                if index < len(fields):
+                    path.append([focus, index])
+                    focus = getattr(focus, fields[index])
+                    break
+
+                if not path:
+                    self.focus = focus
+                    return False
+
+                focus, index = path.pop()
+                fields = REDEX_SEARCH_FIELDS[type(focus)]
+                index += 1
+
+        self.focus = focus
+        return True
 
+    # Replaces the focus, copying the path above it.
+    def replace(self, node: ASTNode):
+        self.focus = node
+        for frame in reversed(self.path):
+            parent, index = frame
+            parent = shallow_copy(parent)
+            setattr(parent, REDEX_SEARCH_FIELDS[type(parent)][index], node)
+            frame[0] = node = parent
+        self.root = node
+
+    def step(self) -> Step:
+        if not self.find_redex():
+            if not isinstance(self.root, (List, Tuple)):
+                return Step(self.root, False)
+
+            result = nor_step(self.root, self.normalize)
+            if result.changed:
+                self.reset(result.node)
+            return result
+
+        reduced, changed = contract(self.focus, self.normalize)
+        if not changed:
+            return Step(self.root, False)
+
+        self.replace(reduced)
+
+        if self.path and is_redex(self.path[-1][0]):
+            self.focus = self.path.pop()[0]
+
+        return Step(self.root, True)
+
+
+# The observer, if any, is called with a StepEvent before every step, also
+# for the reductions nested in builtin arguments and list elements.
+def normal_order_reduction(node, max_steps=1000, observer=None, budget=None):
+    normalize = None
+    if observer is not None or budget is not None:
+        normalize = functools.partial(
+            normal_order_reduction,
+            max_steps=max_steps,
+            observer=observer,
+            budget=budget,
+        )
 
-def normal_order_reduction(node, max_steps=1000):
+    zipper = NormalOrderZipper(node, normalize)
     current = node
     steps = 0
 
-    while steps < max_steps:
-        print(f"NOR step {steps}: {current}")
-        next_node = nor_step(copy.deepcopy(current))
+    while max_steps is None or steps < max_steps:
+        if observer is not None:
+            observer(StepEvent("NOR", steps, current))
+        next_node, changed = zipper.step()
 
-        if next_node == current:
+        if not changed:
             break
+        if budget is not None:
+            budget.spend(current, next_node)
 
         current = next_node
         steps += 1
@@ -595,7 +1066,10 @@ def normal_order_reduction(node, max_steps=1000):
     return current
 
 
-def aor_step(node):
+def aor_step(node, normalize=None) -> Step:
+    if normalize is None:
+        normalize = applicative_order_reduction
+
     def is_redex(n):
         if isinstance(n, Application) and isinstance(n.func, Abstraction):
             return True
@@ -643,7 +1117,8 @@ def aor_step(node):
 
     def reduce(current, parent=None, is_left=False):
         if is_redex(current):
-            return do_reduce(current, applicative_order_reduction)
+            reduced, changed = contract(current, normalize)
+            return reduced if changed else current
 
         if isinstance(current, Application):
             new_func = reduce(current.func, current, True)
@@ -718,19 +1193,32 @@ def aor_step(node):
 
         return current
 
-    return reduce(node)
+    reduced = reduce(node)
+    return Step(reduced, reduced is not node)
+
 
+def applicative_order_reduction(node, max_steps=1000, observer=None, budget=None):
+    normalize = None
+    if observer is not None or budget is not None:
+        normalize = functools.partial(
+            applicative_order_reduction,
+            max_steps=max_steps,
+            observer=observer,
+            budget=budget,
+        )
 
-def applicative_order_reduction(node, max_steps=1000):
     current = node
     steps = 0
 
-    while steps < max_steps:
-        print(f"AOR step {steps}: {current}")
-        next_node = aor_step(copy.deepcopy(current))
+    while max_steps is None or steps < max_steps:
+        if observer is not None:
+            observer(StepEvent("AOR", steps, current))
+        next_node, changed = aor_step(current, normalize)
 
-        if next_node == current:
+        if not changed:
             break
+        if budget is not None:
+            budget.spend(current, next_node)
 
         current = next_node
         steps += 1
@@ -0,0 +1,607 @@
+import os
+import pickle
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from antlr4 import InputStream, CommonTokenStream, PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+
+from antlr_parser import ll_fallbacks
+from LambdaLexer import LambdaLexer
+from LambdaParser import LambdaParser
+from ast_tree import (
+    Abstraction,
+    Application,
+    BinaryOperation,
+    IfExpression,
+    List,
+    Number,
+    Variable,
+    copy_ast,
+    format_ast,
+    write_ast,
+)
+from evaluate import (
+    compile_cache,
+    evaluate_lambda_ast,
+    lambda_expr_to_ast,
+    program_to_asts,
+)
+from hashcons import HashConsStore, dag_size, tree_size
+from serialization import dumps, loads
+from tracing import Tracer
+
+
+def measure(func, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def large_program(size):
+    elements = [
+        rf"(\x. \y. if x > y then x * {i} else y + {i}) {i} ({i} - 1)"
+        for i in range(size)
+    ]
+    lets = " in ".join(f"let v{i} = [{i}, {i} + 1..{i} * 3]" for i in range(size))
+    return f"({lets} in [{', '.join(elements)}], (1, \"end\"))"
+
+
+def bench_parsers():
+    print("== parsers ==")
+    for size in (10, 50, 100):
+        source = large_program(size)
+        timings = {
+            parser: measure(lambda_expr_to_ast, source, False, parser, repeat=3)
+            for parser in ("antlr", "ll", "pratt")
+        }
+        print(
+            f"size {size:4d} ({len(source):6d} chars): "
+            + ", ".join(f"{name} {t * 1000:8.2f} ms" for name, t in timings.items())
+            + f", pratt speedup x{timings['antlr'] / timings['pratt']:.1f}"
+        )
+
+
+def builtin_program(size):
+    elements = [
+        rf"fold (\acc.\x. acc + x) {i} (map (\y. y * 2) (filter (\z. z > 1) [1..{i}]))"
+        for i in range(size)
+    ]
+    return f"[{', '.join(elements)}, expand [1..3], print]"
+
+
+def bench_builtins():
+    print("== builtin-heavy parse and build ==")
+    for size in (10, 100, 500):
+        source = builtin_program(size)
+        timings = {
+            parser: measure(lambda_expr_to_ast, source, False, parser, repeat=3)
+            for parser in ("antlr", "pratt")
+        }
+        print(
+            f"size {size:4d}: "
+            + ", ".join(f"{name} {t * 1000:8.2f} ms" for name, t in timings.items())
+        )
+
+
+def church_numeral(n):
+    return rf"\f. \x. {'f (' * n}x{')' * n}"
+
+
+def bench_deep():
+    print("== deeply nested programs (pratt) ==")
+    shapes = {
+        "parens": lambda n: "(" * n + "x" + ")" * n,
+        "lets": lambda n: "let x = 1 in " * n + "x",
+        "lambdas": lambda n: r"\x. " * n + "x",
+        "church": church_numeral,
+    }
+    for name, shape in shapes.items():
+        timings = []
+        for depth in (1000, 10000, 100000):
+            source = shape(depth)
+            timings.append(measure(lambda_expr_to_ast, source, False, "pratt", repeat=1))
+        print(
+            f"{name:8s}: "
+            + ", ".join(
+                f"depth {depth:6d} {t * 1000:8.2f} ms"
+                for depth, t in zip((1000, 10000, 100000), timings)
+            )
+        )
+
+
+def church_mul(m, n):
+    return rf"(\m.\n.\f. m (n f)) ({church_numeral(m)}) ({church_numeral(n)})"
+
+
+def peak_memory(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_memory():
+    print("== memory ==")
+    x = Variable("x")
+    samples = {
+        "Variable": lambda: Variable("x"),
+        "Abstraction": lambda: Abstraction(x, x),
+        "Application": lambda: Application(x, x),
+        "Number": lambda: Number(1.0),
+        "BinaryOperation": lambda: BinaryOperation(x, "+", x),
+        "IfExpression": lambda: IfExpression(x, x, x),
+        "List": lambda: List([]),
+    }
+    count = 10000
+    for name, make in samples.items():
+        size = peak_memory(lambda: [make() for _ in range(count)]) / count
+        print(f"{name:16s}: {size:6.1f} bytes per node")
+
+    source = church_mul(15, 15)
+    workloads = {
+        "parse size 100": lambda: lambda_expr_to_ast(large_program(100), False, "pratt"),
+        "NOR mul 15 15": lambda: evaluate_lambda_ast(
+            lambda_expr_to_ast(source, False, "pratt")
+        ),
+    }
+    for name, work in workloads.items():
+        print(f"{name:16s}: peak {peak_memory(work) / 1024:9.1f} KiB traced")
+
+    code = (
+        "import resource, benchmark; "
+        f"benchmark.evaluate_lambda_ast(benchmark.lambda_expr_to_ast({source!r}, False, 'pratt')); "
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+    )
+    rss = int(run_python(code).stdout.split()[-1])
+    print(f"{'NOR mul 15 15':16s}: peak RSS {rss / 1024:7.1f} MiB")
+
+
+def count_steps(ast, strategy):
+    tracer = Tracer("counts")
+    evaluate_lambda_ast(ast, strategy, observer=tracer)
+    return sum(tracer.counts.values())
+
+
+def unary_program(n):
+    return rf"({church_numeral(n)}) (\x. x + 1) 0"
+
+
+# Unary counting below a long spine of applications of a free variable, so
+# every redex sits deep inside a term whose prefix is already normal.
+def nested_program(depth, n):
+    return "v (" * depth + unary_program(n) + ")" * depth
+
+
+# An expensive argument used four times: substituted and reduced four times
+# by NOR and call by name, evaluated once by call by need.
+def shared_program(n):
+    return rf"(\x. x + x + x + x) ({unary_program(n)})"
+
+
+def bench_reduction():
+    print("== reduction steps/s ==")
+    workloads = {
+        "NOR mul 15 15": (church_mul(15, 15), "nor"),
+        "NOR unary 150": (unary_program(150), "nor"),
+        "NOR dup 8": (dup_program(8), "nor"),
+        "NOR nested 150": (nested_program(150, 100), "nor"),
+        "NOR share 50": (shared_program(50), "nor"),
+        "AOR unary 150": (unary_program(150), "aor"),
+        "AOR dup 8": (dup_program(8), "aor"),
+        "NOR_DB mul 15 15": (church_mul(15, 15), "nor_db"),
+        "NOR_DB unary 150": (unary_program(150), "nor_db"),
+        "NOR_DB dup 8": (dup_program(8), "nor_db"),
+        "AOR_DB unary 150": (unary_program(150), "aor_db"),
+        "AOR_DB dup 8": (dup_program(8), "aor_db"),
+        "CEK mul 15 15": (church_mul(15, 15), "cek"),
+        "CEK unary 150": (unary_program(150), "cek"),
+        "CEK dup 8": (dup_program(8), "cek"),
+        "COMPILED mul 15 15": (church_mul(15, 15), "compiled"),
+        "COMPILED unary 150": (unary_program(150), "compiled"),
+        "COMPILED dup 8": (dup_program(8), "compiled"),
+        "CBN mul 15 15": (church_mul(15, 15), "cbn"),
+        "CBN unary 150": (unary_program(150), "cbn"),
+        "CBN dup 8": (dup_program(8), "cbn"),
+        "CBN nested 150": (nested_program(150, 100), "cbn"),
+        "CBN share 50": (shared_program(50), "cbn"),
+        "NEED mul 15 15": (church_mul(15, 15), "need"),
+        "NEED unary 150": (unary_program(150), "need"),
+        "NEED dup 8": (dup_program(8), "need"),
+        "NEED share 50": (shared_program(50), "need"),
+        "WHNF mul 15 15": (church_mul(15, 15), "cbn_whnf"),
+        "WHNF nested 150": (nested_program(150, 100), "cbn_whnf"),
+    }
+    for name, (source, strategy) in workloads.items():
+        ast = lambda_expr_to_ast(source, False, "pratt")
+        steps = count_steps(ast, strategy)
+        elapsed = measure(evaluate_lambda_ast, ast, strategy, repeat=3)
+        print(
+            f"{name:16s}: {steps:4d} steps, {elapsed * 1000:8.2f} ms, "
+            f"{steps / elapsed:9.0f} steps/s"
+        )
+
+
+def bench_substitution():
+    print("== substitution ==")
+    for binders, size in ((50, 1000), (200, 1000), (200, 5000)):
+        source = " ".join(rf"\x{i}." for i in range(binders)) + " a"
+        body = lambda_expr_to_ast(source, False, "pratt")
+        arg = lambda_expr_to_ast(
+            "(" + ", ".join(f"y{i}" for i in range(size)) + ")", False, "pratt"
+        )
+        elapsed = measure(lambda: body.reduce(Variable("a"), copy_ast(arg)), repeat=3)
+        print(
+            f"{binders:4d} binders, argument with {size:5d} free variables: "
+            f"{elapsed * 1000:8.2f} ms"
+        )
+
+
+# Long names like the generated parameters of builtins, hashed and compared
+# over and over as free-variable sets are built and queried.
+def bench_symbols():
+    print("== variable names ==")
+    names = [f"{i:032x}" for i in range(5000)]
+    variables = [Variable(name) for name in names]
+    others = [Variable(name) for name in names]
+    free = frozenset(variables)
+
+    workloads = {
+        "construct": lambda: [Variable(name) for name in names],
+        "set": lambda: frozenset(others),
+        "membership": lambda: sum(var in free for var in others),
+        "equality": lambda: sum(a == b for a, b in zip(variables, others)),
+    }
+    for name, func in workloads.items():
+        print(f"{name:12s}: {measure(func) * 1000:7.2f} ms")
+
+
+class NullSink:
+    def write(self, text):
+        pass
+
+
+def bench_printer():
+    print("== printer ==")
+    for depth in (400, 100000):
+        node = Variable("x")
+        for _ in range(depth):
+            node = Application(Variable("f"), node)
+        try:
+            elapsed = measure(str, node, repeat=3)
+            print(f"str, {depth:6d} nested applications: {elapsed * 1000:8.2f} ms")
+        except RecursionError:
+            print(f"str, {depth:6d} nested applications: RecursionError")
+
+    wide = List([Number(float(i)) for i in range(100000)])
+    elapsed = measure(str, wide, repeat=3)
+    print(f"str, list of 100000 numbers:      {elapsed * 1000:8.2f} ms")
+
+    if "write_ast" in globals():
+        elapsed = measure(write_ast, node, NullSink(), repeat=3)
+        print(f"write_ast to a null sink:         {elapsed * 1000:8.2f} ms")
+        elapsed = measure(format_ast, node, 80, repeat=3)
+        print(f"format_ast, max_length=80:        {elapsed * 1000:8.2f} ms")
+
+
+# The same reduction under each trace level. "full" writes every step to
+# /dev/null, which is what every run used to pay; the ring buffer keeps the
+# last 100 steps without rendering them.
+def bench_tracing():
+    print("== tracing ==")
+    ast = lambda_expr_to_ast(unary_program(150), False, "pratt")
+    with open(os.devnull, "w") as devnull:
+        observers = {
+            "none": None,
+            "off": Tracer("off"),
+            "counts": Tracer("counts"),
+            "sampled": Tracer("sampled", file=devnull, every=100),
+            "full": Tracer("full", file=devnull),
+            "ring buffer": Tracer("full", capacity=100),
+        }
+        for name, observer in observers.items():
+            elapsed = measure(evaluate_lambda_ast, ast, "nor", observer, repeat=3)
+            print(f"{name:12s}: {elapsed * 1000:8.2f} ms")
+
+
+# The same reductions without limits and under generous ones, which are
+# checked after every step but never trip.
+def bench_budget():
+    print("== budgets ==")
+    limits = {
+        "none": {},
+        "fuel": {"fuel": 10**9},
+        "timeout": {"timeout": 3600},
+        "max_nodes": {"max_nodes": 10**9},
+    }
+    for program, source in (
+        ("NOR unary 150", unary_program(150)),
+        ("NOR dup 8", dup_program(8)),
+    ):
+        ast = lambda_expr_to_ast(source, False, "pratt")
+        timings = [
+            measure(lambda: evaluate_lambda_ast(ast, "nor", **kwargs), repeat=5)
+            for kwargs in limits.values()
+        ]
+        print(
+            f"{program:14s}: "
+            + ", ".join(
+                f"{name} {t * 1000:6.2f} ms" for name, t in zip(limits, timings)
+            )
+        )
+
+
+# Church n applied to 2 is 2 ^ n, and applying that to the identity takes
+# 2 ^ n applications unless the work is shared. The named NOR loses track of
+# the variables on this one, so the de Bruijn NOR stands in for it.
+def power_program(n):
+    return rf"({church_numeral(n)}) ({church_numeral(2)}) (\x. x)"
+
+
+def bench_optimal():
+    print("== optimal reduction ==")
+    for n in (4, 8, 12, 16, 20):
+        ast = lambda_expr_to_ast(power_program(n), False, "pratt")
+        for strategy in ("nor_db", "need", "optimal"):
+            if strategy != "optimal" and n > 12:
+                continue
+            tracer = Tracer("counts")
+            evaluate_lambda_ast(ast, strategy, tracer, fuel=10**8)
+            steps = sum(tracer.counts.values())
+            elapsed = measure(evaluate_lambda_ast, ast, strategy, None, 10**8, repeat=3)
+            name = f"{strategy} 2^{n} id"
+            print(f"{name:16s}: {steps:6d} steps, {elapsed * 1000:8.2f} ms")
+
+
+# Four operators per iteration of a Church numeral.
+def arith_program(n):
+    return rf"({church_numeral(n)}) (\x. x * 3 - x * 2 + 1) 0"
+
+
+def bench_compiled():
+    print("== compiled closures ==")
+    workloads = {
+        "unary 150": unary_program(150),
+        "arith 150": arith_program(150),
+        "mul 15 15": church_mul(15, 15),
+    }
+    for label, source in workloads.items():
+        ast = lambda_expr_to_ast(source, False, "pratt")
+        for strategy in ("aor", "cek", "compiled"):
+            tracer = Tracer("counts")
+            evaluate_lambda_ast(ast, strategy, tracer, fuel=10**6)
+            steps = sum(tracer.counts.values())
+            elapsed = measure(evaluate_lambda_ast, ast, strategy, None, 10**6)
+            name = f"{strategy.upper()} {label}"
+            print(
+                f"{name:20s}: {steps:5d} steps, {elapsed * 1000:8.2f} ms, "
+                f"{steps / elapsed:9.0f} steps/s"
+            )
+
+    # Compiling on every run against reusing the cached program.
+    ast = lambda_expr_to_ast(arith_program(150), False, "pratt")
+
+    def cold():
+        compile_cache.clear()
+        evaluate_lambda_ast(ast, "compiled")
+
+    for name, run in (
+        ("compile + run", cold),
+        ("cached run", lambda: evaluate_lambda_ast(ast, "compiled")),
+    ):
+        elapsed = measure(lambda: [run() for _ in range(100)], repeat=3)
+        print(f"{name:20s}: {elapsed * 10:8.3f} ms per run")
+
+
+def dup_program(depth):
+    return r"let dup = \x. (x, x) in " + "dup (" * depth + "a" + ")" * depth
+
+
+def bench_hashcons():
+    print("== hash-consing ==")
+    for depth in (6, 8, 10):
+        store = HashConsStore()
+        ast = lambda_expr_to_ast(dup_program(depth), False, "pratt")
+        result = evaluate_lambda_ast(ast)
+        other = copy_ast(result)
+        interned = store.intern(result)
+        interned_other = store.intern(other)
+
+        print(
+            f"dup depth {depth:2d}: tree {tree_size(result):5d} nodes, "
+            f"dag {dag_size(interned):3d} nodes, "
+            f"intern {measure(store.intern, other) * 1000:7.2f} ms, "
+            f"str == {measure(lambda: result == other) * 1000:7.3f} ms, "
+            f"interned == {measure(lambda: interned == interned_other) * 1e6:5.2f} us"
+        )
+
+
+class PredictionReport(ErrorListener):
+    def __init__(self):
+        self.ambiguities = 0
+        self.full_context = 0
+
+    def reportAmbiguity(self, *args):
+        self.ambiguities += 1
+
+    def reportAttemptingFullContext(self, *args):
+        self.full_context += 1
+
+
+def parse_with_report(source):
+    report = PredictionReport()
+    parser = LambdaParser(CommonTokenStream(LambdaLexer(InputStream(source))))
+    parser.addErrorListener(report)
+    parser._interp.predictionMode = PredictionMode.LL_EXACT_AMBIG_DETECTION
+    parser.prog()
+    return report
+
+
+def bench_grammar():
+    print("== grammar prediction ==")
+    for size in (10, 50, 100):
+        source = large_program(size)
+        report = parse_with_report(source)
+        before = ll_fallbacks()
+        lambda_expr_to_ast(source, False, "antlr")
+        fallbacks = ll_fallbacks() - before
+        elapsed = measure(
+            lambda: LambdaParser(
+                CommonTokenStream(LambdaLexer(InputStream(source)))
+            ).prog(),
+            repeat=3,
+        )
+        print(
+            f"size {size:4d}: LL {elapsed * 1000:8.2f} ms, "
+            f"{report.full_context} full-context predictions, "
+            f"{report.ambiguities} ambiguities; "
+            f"{fallbacks} LL fallbacks with the default front-end"
+        )
+
+
+small_programs = [
+    r"((\x.\y.(x y)) y)",
+    r"(\x. \y. x * y + 2) 3 4",
+    "if (((2 < 3) || (4 > 5)) && (not false)) then 42 else 0",
+    "let x = 2 + 3 * 4 in let y = x / 2 in y - 1",
+    '[("start", [1..3]), ("end", [4..6])]',
+    r"fold (\acc.\x. acc + x) 0 [1..3]",
+]
+
+
+def bench_parse_throughput(rounds=200):
+    print("== parse throughput ==")
+    for parser in ("antlr", "ll", "pratt"):
+        lambda_expr_to_ast(small_programs[0], False, parser)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for source in small_programs:
+                lambda_expr_to_ast(source, False, parser)
+        elapsed = time.perf_counter() - start
+
+        print(f"{parser:6s}: {rounds * len(small_programs) / elapsed:9.0f} parses/s")
+
+
+def bench_serialization():
+    print("== serialization ==")
+    for size in (10, 50, 100):
+        ast = lambda_expr_to_ast(large_program(size), False, "pratt")
+        data = dumps(ast)
+        pickled = pickle.dumps(ast)
+        print(
+            f"size {size:4d}: binary {len(data):7d} bytes, "
+            f"dump {measure(dumps, ast) * 1000:7.2f} ms, "
+            f"load {measure(loads, data) * 1000:7.2f} ms; "
+            f"pickle {len(pickled):7d} bytes, "
+            f"dump {measure(pickle.dumps, ast) * 1000:7.2f} ms, "
+            f"load {measure(pickle.loads, pickled) * 1000:7.2f} ms"
+        )
+
+
+def bench_program():
+    print("== program files ==")
+    statements = [small_programs[i % len(small_programs)] for i in range(1000)]
+    source = ";\n".join(statements)
+    for parser in ("antlr", "ll", "pratt"):
+        batch = measure(lambda: sum(1 for _ in program_to_asts(source, parser)), repeat=1)
+        single = measure(
+            lambda: [lambda_expr_to_ast(s, False, parser) for s in statements], repeat=1
+        )
+        print(
+            f"{parser:6s}: program {batch * 1000:8.2f} ms, "
+            f"one parse per statement {single * 1000:8.2f} ms"
+        )
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+
+
+def import_times(code):
+    # -X importtime lines look like "import time: self | cumulative | name",
+    # nesting is shown by indenting the name.
+    times = {}
+    for line in run_python(code).stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() not in times:
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def bench_startup():
+    print("== startup ==")
+    data = dumps(lambda_expr_to_ast(small_programs[1], False, "pratt"))
+    scenarios = {
+        "import evaluate": "import evaluate",
+        "serialized ast": (
+            "import sys, evaluate; "
+            f"evaluate.evaluate_serialized({data!r}); "
+            "assert 'antlr4' not in sys.modules"
+        ),
+        "pratt parse": (
+            f"import evaluate; evaluate.lambda_expr_to_ast({small_programs[1]!r}, parser='pratt')"
+        ),
+        "antlr parse": f"import evaluate; evaluate.lambda_expr_to_ast({small_programs[1]!r})",
+    }
+    for name, code in scenarios.items():
+        elapsed = measure(run_python, code, repeat=3)
+        print(f"{name:16s}: {elapsed * 1000:8.2f} ms")
+
+    print("-- import time per module (cumulative) --")
+    modules = {
+        name[: -len(".py")]
+        for name in os.listdir(os.path.dirname(os.path.abspath(__file__)))
+        if name.endswith(".py")
+    }
+    times = import_times("import evaluate, antlr_parser")
+    for name, cumulative in sorted(times.items(), key=lambda item: -item[1]):
+        if name in modules or name == "antlr4":
+            print(f"{name:16s}: {cumulative:8.2f} ms")
+
+
+benchmarks = {
+    "parsers": bench_parsers,
+    "parse_throughput": bench_parse_throughput,
+    "grammar": bench_grammar,
+    "builtins": bench_builtins,
+    "deep": bench_deep,
+    "serialization": bench_serialization,
+    "program": bench_program,
+    "startup": bench_startup,
+    "memory": bench_memory,
+    "hashcons": bench_hashcons,
+    "reduction": bench_reduction,
+    "substitution": bench_substitution,
+    "symbols": bench_symbols,
+    "printer": bench_printer,
+    "tracing": bench_tracing,
+    "budget": bench_budget,
+    "optimal": bench_optimal,
+    "compiled": bench_compiled,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(benchmarks)
+    for name in names:
+        benchmarks[name]()
+
+
+if __name__ == "__main__":
+    main()
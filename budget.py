@@ -0,0 +1,66 @@
+import time
+
+from ast_tree import ASTNode, term_size
+
+
+# Raised by the reduction loops when a Budget runs out. `limit` names the
+# limit that tripped ("fuel", "deadline" or "nodes", or "depth" when compiled
+# code nests deeper than the Python stack allows) and `steps` is the number of
+# steps taken within the budget. `term` is the last term within the budget of
+# the reduction that ran out, which is a builtin argument or a list element
+# when the limit trips in a nested reduction.
+class BudgetExceeded(Exception):
+    def __init__(self, limit: str, steps: int, term: ASTNode):
+        super().__init__(f"Budget exceeded: {limit} after {steps} steps")
+        self.limit = limit
+        self.steps = steps
+        self.term = term
+
+
+# Fuel given to a budget when the caller sets other limits but no fuel, the
+# same cap as the max_steps default of the reduction loops.
+DEFAULT_FUEL = 1000
+
+
+# Limits for one evaluation, shared by the reductions nested in it (builtin
+# arguments, list elements):
+#
+#   fuel       maximum number of reduction steps
+#   timeout    seconds from the creation of the budget
+#   max_nodes  maximum size of a term (see ast_tree.term_size)
+#
+# The strategies that don't rewrite terms measure max_nodes against their own
+# state instead: "cek", "cbn" and "need" against the length of the machine
+# stack, "compiled" against the depth of nested calls and "optimal" against
+# the number of nodes in the net. The same limit therefore trips at different
+# points for different strategies.
+#
+# The reduction loops call spend() after each step. Fuel is an integer
+# comparison and the clock is read only once every CLOCK_INTERVAL steps; the
+# node count costs one visit per newly built node.
+class Budget:
+    CLOCK_INTERVAL = 16
+
+    def __init__(self, fuel: int = None, timeout: float = None, max_nodes: int = None):
+        self.fuel = fuel
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.max_nodes = max_nodes
+        self.steps = 0
+
+    # `term` is the term before the step and `result` the one after it;
+    # `term` is the one reported when a limit trips. Strategies that don't
+    # rewrite terms pass their own state as `result`, with a `size` function
+    # that measures it.
+    def spend(self, term: ASTNode, result, size=term_size):
+        steps = self.steps
+        if self.fuel is not None and steps >= self.fuel:
+            raise BudgetExceeded("fuel", steps, term)
+        if (
+            self.deadline is not None
+            and steps % self.CLOCK_INTERVAL == 0
+            and time.monotonic() > self.deadline
+        ):
+            raise BudgetExceeded("deadline", steps, term)
+        if self.max_nodes is not None and size(result) > self.max_nodes:
+            raise BudgetExceeded("nodes", steps, term)
+        self.steps = steps + 1
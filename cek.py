@@ -0,0 +1,285 @@
+from ast_tree import (
+    ASTNode,
+    Abstraction,
+    Application,
+    Variable,
+    Boolean,
+    IfExpression,
+    BinaryOperation,
+    LetExpression,
+    UnaryOperation,
+    BuiltinFunction,
+    List,
+    Tuple,
+    RangeExpression,
+    Symbol,
+    fold_binary,
+    fold_unary,
+    fresh_variable,
+)
+from machine import Machine
+
+
+# Call-by-value CEK machine: a term under evaluation (C), the environment its
+# free variables are looked up in (E) and the continuation, a stack of frames
+# saying what to do with the value (K). Terms are never substituted into or
+# copied; abstractions evaluate to closures that capture their environment.
+#
+# Values are closures, neutral terms (a free variable, or an operation stuck
+# on one), the Number, Boolean, String and BuiltinFunction nodes themselves,
+# and List, Tuple and RangeExpression nodes holding values. Results are read
+# back into ASTs: a closure is read back by running its body with the
+# parameter bound to a neutral variable, so functions come out in normal
+# form like they do with the rewriting strategies.
+#
+# Environments are linked (symbol, value, rest) cells, shared by every
+# closure created below the binding.
+
+
+class Closure:
+    __slots__ = ("param", "body", "env", "_free")
+
+    def __init__(self, param: Variable, body: ASTNode, env):
+        self.param = param
+        self.body = body
+        self.env = env
+
+
+# A term that can't be evaluated any further, already in read-back form.
+class Neutral:
+    __slots__ = ("term",)
+
+    def __init__(self, term: ASTNode):
+        self.term = term
+
+
+def lookup(env, symbol: Symbol):
+    while env is not None:
+        if env[0] is symbol:
+            return env[1]
+        env = env[2]
+    return None
+
+
+# Free variables of a value, as they will appear in its read-back form.
+def value_free_variables(value) -> frozenset:
+    t = type(value)
+    if t is Neutral:
+        return value.term.free_variables()
+    if t is Closure:
+        try:
+            return value._free
+        except AttributeError:
+            pass
+
+        free = set()
+        for var in value.body.free_variables():
+            if var == value.param:
+                continue
+            bound = lookup(value.env, var.symbol)
+            if bound is None:
+                free.add(var)
+            else:
+                free |= value_free_variables(bound)
+        free = value._free = frozenset(free)
+        return free
+    if t is List or t is Tuple:
+        return frozenset().union(*map(value_free_variables, value.elements))
+    if t is RangeExpression:
+        parts = (value.start, value.end, value.step)
+        return frozenset().union(
+            *(value_free_variables(p) for p in parts if p is not None)
+        )
+    return frozenset()
+
+
+# Continuation frames, tagged by their first element.
+ARG = 0  # (ARG, arg, env): evaluate the argument next
+APPLY = 1  # (APPLY, func): apply func to the value
+RIGHT = 2  # (RIGHT, node, env): evaluate the right operand next
+FOLD = 3  # (FOLD, node, left): apply the binary operator
+UNARY = 4  # (UNARY, node): apply the unary operator
+BRANCH = 5  # (BRANCH, node, env): pick a branch
+LET = 6  # (LET, node, env): bind the value and evaluate the body
+ELEMENT = 7  # (ELEMENT, node, env, children, values): next child, if any
+
+
+def children(node: ASTNode) -> list:
+    if type(node) is RangeExpression:
+        if node.step is None:
+            return [node.start, node.end]
+        return [node.start, node.end, node.step]
+    return node.elements
+
+
+def rebuild(node: ASTNode, values: list) -> ASTNode:
+    if type(node) is RangeExpression:
+        return RangeExpression(*values)
+    return type(node)(values)
+
+
+# A step is one contraction: a closure or builtin call, an operator, a
+# conditional or a let. The size of the state is the depth of the
+# continuation.
+class CEKMachine(Machine):
+    strategy = "CEK"
+
+    def evaluate(self, term: ASTNode):
+        self.term = term
+        return self.read_back(self.run(term, None))
+
+    def run(self, control: ASTNode, env):
+        stack = []
+
+        while True:
+            # Descend into control until it is a value.
+            while True:
+                t = type(control)
+                if t is Variable:
+                    value = lookup(env, control.symbol)
+                    if value is None:
+                        value = Neutral(control)
+                    break
+                elif t is Abstraction:
+                    value = Closure(control.param, control.body, env)
+                    break
+                elif t is Application:
+                    stack.append((ARG, control.arg, env))
+                    control = control.func
+                elif t is BinaryOperation:
+                    stack.append((RIGHT, control, env))
+                    control = control.left
+                elif t is UnaryOperation:
+                    stack.append((UNARY, control))
+                    control = control.value
+                elif t is IfExpression:
+                    stack.append((BRANCH, control, env))
+                    control = control.condition
+                elif t is LetExpression:
+                    stack.append((LET, control, env))
+                    control = control.bound_expr
+                elif t is List or t is Tuple or t is RangeExpression:
+                    nodes = children(control)
+                    if not nodes:
+                        value = control
+                        break
+                    stack.append((ELEMENT, control, env, nodes, []))
+                    control = nodes[0]
+                else:
+                    value = control
+                    break
+
+            # Pass the value to the continuation until a frame has another
+            # term to evaluate.
+            while True:
+                if not stack:
+                    return value
+
+                frame = stack.pop()
+                kind = frame[0]
+
+                if kind == ARG:
+                    stack.append((APPLY, value))
+                    control, env = frame[1], frame[2]
+                    break
+
+                elif kind == APPLY:
+                    func = frame[1]
+                    t = type(func)
+                    if t is Closure:
+                        self.step(func.body, len(stack))
+                        control = func.body
+                        env = (func.param.symbol, value, func.env)
+                        break
+                    elif t is BuiltinFunction and type(value) is Tuple:
+                        self.step(func, len(stack))
+                        args = [self.read_back(e) for e in value.elements]
+                        result = func(*args)
+                        if not isinstance(result, ASTNode):
+                            value = result
+                            continue
+                        control, env = result, None
+                        break
+                    value = Neutral(
+                        Application(self.read_back(func), self.read_back(value))
+                    )
+
+                elif kind == RIGHT:
+                    node = frame[1]
+                    stack.append((FOLD, node, value))
+                    control, env = node.right, frame[2]
+                    break
+
+                elif kind == FOLD:
+                    node, left = frame[1], frame[2]
+                    self.step(node, len(stack))
+                    result = fold_binary(left, node.op, value)
+                    if result is None:
+                        result = Neutral(
+                            BinaryOperation(
+                                self.read_back(left), node.op, self.read_back(value)
+                            )
+                        )
+                    value = result
+
+                elif kind == UNARY:
+                    node = frame[1]
+                    self.step(node, len(stack))
+                    result = fold_unary(node.op, value)
+                    if result is None:
+                        result = Neutral(UnaryOperation(node.op, self.read_back(value)))
+                    value = result
+
+                elif kind == BRANCH:
+                    node, env = frame[1], frame[2]
+                    self.step(node, len(stack))
+                    if type(value) is Boolean:
+                        control = node.then_expr if value.value else node.else_expr
+                        break
+                    # Stuck on the condition: both branches are normalized.
+                    value = Neutral(
+                        IfExpression(
+                            self.read_back(value),
+                            self.read_back(self.run(node.then_expr, env)),
+                            self.read_back(self.run(node.else_expr, env)),
+                        )
+                    )
+
+                elif kind == LET:
+                    node = frame[1]
+                    self.step(node, len(stack))
+                    control = node.body
+                    env = (node.var.symbol, value, frame[2])
+                    break
+
+                else:
+                    _, node, env, nodes, values = frame
+                    values.append(value)
+                    if len(values) < len(nodes):
+                        stack.append(frame)
+                        control = nodes[len(values)]
+                        break
+                    value = rebuild(node, values)
+
+    def read_back(self, value):
+        t = type(value)
+        if t is Neutral:
+            return value.term
+        if t is Closure:
+            var = fresh_variable(value.param, value_free_variables(value))
+            body = self.run(value.body, (value.param.symbol, Neutral(var), value.env))
+            return Abstraction(var, self.read_back(body))
+        if t is List or t is Tuple or t is RangeExpression:
+            nodes = children(value)
+            values = [self.read_back(v) for v in nodes]
+            if all(a is b for a, b in zip(values, nodes)):
+                return value
+            return rebuild(value, values)
+        return value
+
+
+# Runs the machine on a closed or open term and reads the result back. Without
+# a budget, running out of max_steps contractions raises BudgetExceeded, as
+# the machine has no partly reduced term to return.
+def evaluate(term: ASTNode, max_steps=1000, observer=None, budget=None) -> ASTNode:
+    return CEKMachine(max_steps, observer, budget).evaluate(term)
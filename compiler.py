@@ -0,0 +1,434 @@
+import operator
+import threading
+from collections import OrderedDict
+
+from ast_tree import (
+    ASTNode,
+    Application,
+    Variable,
+    Number,
+    Boolean,
+    String,
+    IfExpression,
+    BinaryOperation,
+    UnaryOperation,
+    BuiltinFunction,
+    List,
+    Tuple,
+    RangeExpression,
+    BOOLEAN_OPERATORS,
+    UNARY_OPERATORS,
+)
+from budget import BudgetExceeded
+from cek import children, rebuild
+from debruijn import (
+    BoundVariable,
+    NamelessAbstraction,
+    NamelessLet,
+    convert,
+    from_nameless,
+    to_nameless,
+)
+from machine import (
+    APPLY,
+    BRANCH,
+    FREE,
+    LEVEL,
+    OPERATOR,
+    UNARY,
+    Machine,
+    Neutral,
+)
+
+
+# Compiles a term once into nested Python closures and evaluates it call by
+# value by calling them, like the CEK machine (see cek.py) but without
+# looking at a single node at run time. The term is compiled in locally
+# nameless form (see debruijn.py), so every variable is already resolved to
+# its slot in the environment, a linked (value, rest) cell list, and each
+# operator is bound to the Python function that implements it.
+#
+# Compiled code is a function code(env, runtime) returning a value. Values
+# are Functions, Neutral terms, the Number, Boolean, String and
+# BuiltinFunction nodes themselves, and List, Tuple and RangeExpression
+# nodes holding values. An application in tail position returns a TailCall
+# for the function that called it to make, so loops don't grow the Python
+# stack; other applications call the function directly, and a program that
+# nests them deeper than the Python stack allows raises BudgetExceeded with
+# limit "depth".
+#
+# Results are read back like with the Krivine machine (see krivine.py): a
+# Function by running its body on a Neutral standing for its parameter.
+
+
+class Function:
+    __slots__ = ("node", "body", "env")
+
+    def __init__(self, node: NamelessAbstraction, body, env):
+        self.node = node
+        self.body = body
+        self.env = env
+
+
+class TailCall:
+    __slots__ = ("func", "arg")
+
+    def __init__(self, func, arg):
+        self.func = func
+        self.arg = arg
+
+
+NUMBER_FUNCTIONS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+}
+
+COMPARISON_FUNCTIONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+def apply(func, arg, runtime):
+    while True:
+        t = type(func)
+        if t is Function:
+            runtime.step(func.node, runtime.depth)
+            runtime.depth += 1
+            result = func.body((arg, func.env), runtime)
+            runtime.depth -= 1
+            if type(result) is not TailCall:
+                return result
+            func, arg = result.func, result.arg
+        elif t is BuiltinFunction and type(arg) is Tuple:
+            runtime.step(func, runtime.depth)
+            return runtime.call(func, arg)
+        else:
+            return Neutral(APPLY, func, arg)
+
+
+def compile_variable(index: int):
+    if index == 0:
+        return lambda env, runtime: env[0]
+    if index == 1:
+        return lambda env, runtime: env[1][0]
+
+    def code(env, runtime):
+        for _ in range(index):
+            env = env[1]
+        return env[0]
+
+    return code
+
+
+def compile_abstraction(node: NamelessAbstraction, body):
+    return lambda env, runtime: Function(node, body, env)
+
+
+def compile_application(func, arg, tail: bool):
+    if tail:
+        return lambda env, runtime: TailCall(func(env, runtime), arg(env, runtime))
+    return lambda env, runtime: apply(func(env, runtime), arg(env, runtime), runtime)
+
+
+def compile_let(node: NamelessLet, bound, body):
+    def code(env, runtime):
+        value = bound(env, runtime)
+        runtime.step(node, runtime.depth)
+        return body((value, env), runtime)
+
+    return code
+
+
+def compile_binary(node: BinaryOperation, left, right):
+    op = node.op
+
+    if op in NUMBER_FUNCTIONS:
+        function = NUMBER_FUNCTIONS[op]
+
+        def code(env, runtime):
+            a, b = left(env, runtime), right(env, runtime)
+            runtime.step(node, runtime.depth)
+            if type(a) is Number and type(b) is Number:
+                return Number(float(function(a.value, b.value)))
+            return Neutral(OPERATOR, op, a, b)
+
+    elif op in COMPARISON_FUNCTIONS:
+        function = COMPARISON_FUNCTIONS[op]
+
+        def code(env, runtime):
+            a, b = left(env, runtime), right(env, runtime)
+            runtime.step(node, runtime.depth)
+            if type(a) is Number and type(b) is Number:
+                return Boolean(bool(function(a.value, b.value)))
+            return Neutral(OPERATOR, op, a, b)
+
+    else:
+        function = BOOLEAN_OPERATORS.get(op)
+
+        def code(env, runtime):
+            a, b = left(env, runtime), right(env, runtime)
+            runtime.step(node, runtime.depth)
+            if function is not None and type(a) is Boolean and type(b) is Boolean:
+                return Boolean(bool(function(a.value, b.value)))
+            return Neutral(OPERATOR, op, a, b)
+
+    return code
+
+
+def compile_unary(node: UnaryOperation, value):
+    op = node.op
+    function = UNARY_OPERATORS.get(op)
+
+    def code(env, runtime):
+        a = value(env, runtime)
+        runtime.step(node, runtime.depth)
+        if function is not None and type(a) is Boolean:
+            return Boolean(bool(function(a.value)))
+        return Neutral(UNARY, op, a)
+
+    return code
+
+
+def compile_if(node: IfExpression, condition, then_code, else_code):
+    def code(env, runtime):
+        value = condition(env, runtime)
+        runtime.step(node, runtime.depth)
+        if type(value) is Boolean:
+            return (then_code if value.value else else_code)(env, runtime)
+        # Stuck on the condition: both branches are normalized when read back.
+        return Neutral(BRANCH, value, then_code, else_code, env)
+
+    return code
+
+
+def compile_elements(node: ASTNode, codes: list):
+    if not codes:
+        return lambda env, runtime: node
+    return lambda env, runtime: rebuild(node, [c(env, runtime) for c in codes])
+
+
+def compile_constant(node: ASTNode):
+    value = Neutral(FREE, node) if type(node) is Variable else node
+    return lambda env, runtime: value
+
+
+# Bottom-up with an explicit stack (see debruijn.convert); `tail` tells
+# whether the node's value is the value of the enclosing function body.
+def compile_term(term: ASTNode, tail: bool = False):
+    def visit(node, tail):
+        t = type(node)
+        if t is NamelessAbstraction:
+            return (
+                lambda codes: compile_abstraction(node, codes[0]),
+                [(node.body, True)],
+            )
+        if t is Application:
+            return (
+                lambda codes: compile_application(*codes, tail),
+                [(node.func, False), (node.arg, False)],
+            )
+        if t is BoundVariable:
+            return lambda _: compile_variable(node.index), []
+        if t is NamelessLet:
+            return (
+                lambda codes: compile_let(node, *codes),
+                [(node.bound_expr, False), (node.body, tail)],
+            )
+        if t is BinaryOperation:
+            return (
+                lambda codes: compile_binary(node, *codes),
+                [(node.left, False), (node.right, False)],
+            )
+        if t is UnaryOperation:
+            return lambda codes: compile_unary(node, *codes), [(node.value, False)]
+        if t is IfExpression:
+            return (
+                lambda codes: compile_if(node, *codes),
+                [
+                    (node.condition, False),
+                    (node.then_expr, tail),
+                    (node.else_expr, tail),
+                ],
+            )
+        if t is List or t is Tuple or t is RangeExpression:
+            return (
+                lambda codes: compile_elements(node, codes),
+                [(child, False) for child in children(node)],
+            )
+        if t in (Variable, Number, Boolean, String, BuiltinFunction):
+            return lambda _: compile_constant(node), []
+        raise TypeError(f"cannot compile {t.__name__}")
+
+    return convert(term, tail, visit)
+
+
+# The state of one run of a Program. A step is one contraction: a function or
+# builtin call, an operator, a conditional or a let, reported with the
+# compiled node, in nameless form. There is no term to measure; the size of
+# the state is the number of applications in progress.
+class Runtime(Machine):
+    strategy = "COMPILED"
+
+    def __init__(self, term: ASTNode, max_steps=1000, observer=None, budget=None):
+        super().__init__(max_steps, observer, budget)
+        self.term = term
+        self.depth = 0
+        # The binders the read-back is under, innermost last; builtins need
+        # them to name the variables bound there.
+        self.names = ()
+        # Whether a function was read back; without one the result has no
+        # bound variables to name.
+        self.binders = False
+
+    def run(self, code, env):
+        value = code(env, self)
+        if type(value) is TailCall:
+            value = apply(value.func, value.arg, self)
+        return value
+
+    # Builtins get the normal forms of their arguments in named form, like
+    # with the rewriting strategies, and their result is compiled in turn.
+    def call(self, builtin: BuiltinFunction, arg: Tuple):
+        names = self.names
+        result = builtin(
+            *(from_nameless(self.read_back(e), names) for e in arg.elements)
+        )
+        if not isinstance(result, ASTNode):
+            return result
+        env = None
+        for level in range(len(names)):
+            env = (Neutral(LEVEL, level), env)
+        return self.run(compile_term(to_nameless(result, names)), env)
+
+    def read_back(self, value) -> ASTNode:
+        names = self.names
+        try:
+            return convert(value, names, self.visit)
+        finally:
+            self.names = names
+
+    def visit(self, value, names: tuple):
+        t = type(value)
+        if t is Function:
+            self.binders = True
+            node = value.node
+            inner = names + (node.hint,)
+            self.names = inner
+            body = self.run(value.body, (Neutral(LEVEL, len(names)), value.env))
+            return (
+                lambda converted: NamelessAbstraction(node.hint, converted[0]),
+                [(body, inner)],
+            )
+
+        if t is Neutral:
+            kind, parts = value.kind, value.parts
+            if kind == LEVEL:
+                index = len(names) - parts[0] - 1
+                return lambda _: BoundVariable(index), []
+            if kind == FREE:
+                return lambda _: parts[0], []
+            if kind == APPLY:
+                return (
+                    lambda converted: Application(*converted),
+                    [(parts[0], names), (parts[1], names)],
+                )
+            if kind == OPERATOR:
+                op, left, right = parts
+                return (
+                    lambda converted: BinaryOperation(converted[0], op, converted[1]),
+                    [(left, names), (right, names)],
+                )
+            if kind == UNARY:
+                op, operand = parts
+                return (
+                    lambda converted: UnaryOperation(op, converted[0]),
+                    [(operand, names)],
+                )
+            condition, then_code, else_code, env = parts
+            self.names = names
+            branches = [self.run(then_code, env), self.run(else_code, env)]
+            return (
+                lambda converted: IfExpression(*converted),
+                [(condition, names)] + [(b, names) for b in branches],
+            )
+
+        if t is List or t is Tuple or t is RangeExpression:
+            nodes = children(value)
+            if nodes:
+                return (
+                    lambda converted: rebuild(value, converted),
+                    [(v, names) for v in nodes],
+                )
+
+        return lambda _: value, []
+
+
+# A compiled term. The code holds no state of its own, so a Program can be
+# run any number of times, from any thread.
+class Program:
+    __slots__ = ("term", "code")
+
+    def __init__(self, term: ASTNode):
+        self.term = term
+        self.code = compile_term(to_nameless(term))
+
+    def run(self, max_steps=1000, observer=None, budget=None) -> ASTNode:
+        runtime = Runtime(self.term, max_steps, observer, budget)
+        try:
+            result = runtime.read_back(runtime.run(self.code, None))
+            return from_nameless(result) if runtime.binders else result
+        except RecursionError:
+            raise BudgetExceeded("depth", runtime.steps, self.term) from None
+
+
+# LRU cache of Programs keyed by the tree they were compiled from. Trees are
+# never modified, and the parse cache hands out the same tree for the same
+# source, so entries are looked up by identity; each entry keeps its tree
+# alive, so an identity is never reused while it is cached.
+class CompileCache:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, Program] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compile(self, term: ASTNode) -> Program:
+        key = id(term)
+        with self._lock:
+            program = self._entries.get(key)
+            if program is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return program
+            self._misses += 1
+
+        program = Program(term)
+        with self._lock:
+            self._entries[key] = program
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return program
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> tuple[int, int]:
+        with self._lock:
+            return self._hits, self._misses
+
+
+def evaluate(term: ASTNode, max_steps=1000, observer=None, budget=None) -> ASTNode:
+    return Program(term).run(max_steps, observer, budget)
@@ -0,0 +1,554 @@
+import functools
+
+from ast_tree import (
+    ASTNode,
+    Abstraction,
+    Application,
+    Variable,
+    Boolean,
+    IfExpression,
+    BinaryOperation,
+    LetExpression,
+    UnaryOperation,
+    BuiltinFunction,
+    List,
+    Tuple,
+    RangeExpression,
+    REDEX_SEARCH_FIELDS,
+    Step,
+    field_items,
+    fold_binary,
+    fold_unary,
+    fresh_name,
+    shallow_copy,
+)
+from budget import BudgetExceeded
+from tracing import StepEvent
+
+
+# Locally nameless core for the reduction engines. Bound variables are de
+# Bruijn indices (0 is the nearest enclosing binder), free variables keep
+# their names, and the other node classes of ast_tree are reused as they are.
+# Binders remember the name they were written with, but only to print terms.
+#
+# Terms are converted with to_nameless() before reduction and back with
+# from_nameless() for printing and for builtins, which work on named trees.
+# Beta reduction in between only shifts indices and never renames. Nameless
+# terms are never mutated, so reduction steps share unchanged subterms, and
+# the free_variables() cache never goes stale. For a nameless term it holds
+# the free Variables and the indices that point outside of the term.
+
+
+class BoundVariable(ASTNode):
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __str__(self):
+        return f"#{self.index}"
+
+    def _free_variables(self):
+        return {self.index}
+
+
+class NamelessAbstraction(ASTNode):
+    __slots__ = ("hint", "body")
+
+    def __init__(self, hint: str, body: ASTNode):
+        self.hint = hint
+        self.body = body
+
+    def _parts(self):
+        return ("(\\.", self.body, ")")
+
+    def _free_variables(self):
+        return unbind(self.body.free_variables())
+
+
+class NamelessLet(ASTNode):
+    __slots__ = ("hint", "bound_expr", "body")
+
+    def __init__(self, hint: str, bound_expr: ASTNode, body: ASTNode):
+        self.hint = hint
+        self.bound_expr = bound_expr
+        self.body = body
+
+    def _parts(self):
+        return ("let _ = ", self.bound_expr, " in ", self.body)
+
+    def _free_variables(self):
+        return self.bound_expr.free_variables() | unbind(self.body.free_variables())
+
+
+# Free variables of the body of a binder, seen from outside of it.
+def unbind(free: frozenset) -> set:
+    return {
+        v - 1 if type(v) is int else v
+        for v in free
+        if type(v) is not int or v > 0
+    }
+
+
+def children(node: ASTNode) -> list:
+    result = []
+    for _, value in field_items(node):
+        if isinstance(value, ASTNode):
+            result.append(value)
+        elif isinstance(value, list):
+            result.extend(value)
+    return result
+
+
+# Copy of node with its children, in the order children() lists them,
+# replaced by converted.
+def assemble(node: ASTNode, converted: list) -> ASTNode:
+    copy = object.__new__(type(node))
+    remaining = iter(converted)
+    for name, value in field_items(node):
+        if isinstance(value, ASTNode):
+            value = next(remaining)
+        elif isinstance(value, list):
+            value = [next(remaining) for _ in value]
+        setattr(copy, name, value)
+    return copy
+
+
+# Bottom-up conversion with an explicit stack, so that terms nested deeper
+# than the recursion limit can cross the edges. visit(node, names) returns
+# (make, [(child, names), ...]); make receives the converted children. On the
+# stack, a pending make sits below its children with their count as node.
+def convert(term: ASTNode, names: tuple, visit) -> ASTNode:
+    results = []
+    stack = [(term, names, None)]
+
+    while stack:
+        node, names, make = stack.pop()
+
+        if make is not None:
+            count = node
+            converted = results[len(results) - count :]
+            del results[len(results) - count :]
+            results.append(make(converted))
+            continue
+
+        make, pending = visit(node, names)
+        stack.append((len(pending), None, make))
+        stack.extend((child, scope, None) for child, scope in reversed(pending))
+
+    return results[0]
+
+
+def copy_children(node: ASTNode, names: tuple):
+    return (
+        lambda converted: assemble(node, converted),
+        [(child, names) for child in children(node)],
+    )
+
+
+# Like assemble, but returns node itself when convert leaves every child as
+# is.
+def map_children(node: ASTNode, convert) -> ASTNode:
+    changes = {}
+    for name, value in field_items(node):
+        if isinstance(value, ASTNode):
+            new = convert(value)
+            if new is not value:
+                changes[name] = new
+        elif isinstance(value, list):
+            new = [convert(e) for e in value]
+            if any(a is not b for a, b in zip(new, value)):
+                changes[name] = new
+
+    if not changes:
+        return node
+
+    copy = shallow_copy(node)
+    for name, value in changes.items():
+        setattr(copy, name, value)
+    return copy
+
+
+def is_closed(term: ASTNode) -> bool:
+    return not any(type(v) is int for v in term.free_variables())
+
+
+# names holds the binders around term, innermost last.
+def to_nameless(term: ASTNode, names: tuple = ()) -> ASTNode:
+    def visit(node, names):
+        t = type(node)
+
+        if t is Variable:
+            for index, name in enumerate(reversed(names)):
+                if name == node.name:
+                    return lambda _: BoundVariable(index), []
+            return lambda _: Variable(node.name), []
+
+        elif t is Abstraction:
+            name = node.param.name
+            return (
+                lambda converted: NamelessAbstraction(name, converted[0]),
+                [(node.body, names + (name,))],
+            )
+
+        elif t is LetExpression:
+            name = node.var.name
+            return (
+                lambda converted: NamelessLet(name, *converted),
+                [(node.bound_expr, names), (node.body, names + (name,))],
+            )
+
+        return copy_children(node, names)
+
+    return convert(term, names, visit)
+
+
+# Names a binder must not take: the free variables of its body and the outer
+# binders its body refers to, since either would be captured.
+def captured_names(body: ASTNode, names: tuple) -> set:
+    return {
+        v.name if type(v) is Variable else names[-v]
+        for v in body.free_variables()
+        if type(v) is not int or v > 0
+    }
+
+
+# Binders get back the name they were written with unless that would capture
+# a variable, in which case fresh_name picks a new one. This is the only place
+# where names are invented.
+def from_nameless(term: ASTNode, names: tuple = ()) -> ASTNode:
+    def visit(node, names):
+        t = type(node)
+
+        if not isinstance(node, ASTNode):
+            # A builtin result that isn't a tree (see machine.py)
+            return lambda _: node, []
+
+        elif t is BoundVariable:
+            if node.index >= len(names):
+                raise ValueError(f"unbound de Bruijn index {node.index}")
+            return lambda _: Variable(names[-1 - node.index]), []
+
+        elif t is NamelessAbstraction:
+            name = fresh_name(node.hint, captured_names(node.body, names))
+            return (
+                lambda converted: Abstraction(Variable(name), converted[0]),
+                [(node.body, names + (name,))],
+            )
+
+        elif t is NamelessLet:
+            name = fresh_name(node.hint, captured_names(node.body, names))
+            return (
+                lambda converted: LetExpression(Variable(name), *converted),
+                [(node.bound_expr, names), (node.body, names + (name,))],
+            )
+
+        return copy_children(node, names)
+
+    return convert(term, names, visit)
+
+
+# Adds amount to every index of term that points above cutoff binders.
+def shift(term: ASTNode, amount: int, cutoff: int = 0) -> ASTNode:
+    t = type(term)
+
+    if t is BoundVariable:
+        if term.index >= cutoff:
+            return BoundVariable(term.index + amount)
+        return term
+
+    elif t is NamelessAbstraction:
+        body = shift(term.body, amount, cutoff + 1)
+        return term if body is term.body else NamelessAbstraction(term.hint, body)
+
+    elif t is NamelessLet:
+        bound_expr = shift(term.bound_expr, amount, cutoff)
+        body = shift(term.body, amount, cutoff + 1)
+        if bound_expr is term.bound_expr and body is term.body:
+            return term
+        return NamelessLet(term.hint, bound_expr, body)
+
+    return map_children(term, lambda child: shift(child, amount, cutoff))
+
+
+def substitute(term: ASTNode, arg: ASTNode, depth: int, closed: bool) -> ASTNode:
+    t = type(term)
+
+    if t is BoundVariable:
+        if term.index == depth:
+            return arg if closed or depth == 0 else shift(arg, depth)
+        if term.index > depth:
+            return BoundVariable(term.index - 1)
+        return term
+
+    elif t is NamelessAbstraction:
+        body = substitute(term.body, arg, depth + 1, closed)
+        return term if body is term.body else NamelessAbstraction(term.hint, body)
+
+    elif t is NamelessLet:
+        bound_expr = substitute(term.bound_expr, arg, depth, closed)
+        body = substitute(term.body, arg, depth + 1, closed)
+        if bound_expr is term.bound_expr and body is term.body:
+            return term
+        return NamelessLet(term.hint, bound_expr, body)
+
+    return map_children(term, lambda child: substitute(child, arg, depth, closed))
+
+
+# Replaces index 0 in the body of a binder by arg and removes the binder. A
+# closed argument is shared by all of its occurrences.
+def instantiate(body: ASTNode, arg: ASTNode) -> ASTNode:
+    return substitute(body, arg, 0, is_closed(arg))
+
+
+# Nameless counterpart of ASTNode.reduce(var, new_expr). The named beta step
+# evaluates operators, conditionals and lets while it substitutes, and so
+# does this one. Without arg it is reduce(None, None): nothing is substituted
+# and abstractions are left alone.
+def evaluate(term: ASTNode, arg: ASTNode, depth: int, closed: bool) -> ASTNode:
+    t = type(term)
+
+    if t is BoundVariable:
+        return term if arg is None else substitute(term, arg, depth, closed)
+
+    elif t is NamelessAbstraction:
+        if arg is None:
+            return term
+        body = evaluate(term.body, arg, depth + 1, closed)
+        return NamelessAbstraction(term.hint, body)
+
+    elif t is IfExpression:
+        condition = term.condition
+        if type(condition) is Application and type(condition.func) is NamelessAbstraction:
+            if arg is not None:
+                condition = substitute(condition, arg, depth, closed)
+            condition = beta(condition.func.body, condition.arg)
+        else:
+            condition = evaluate(condition, arg, depth, closed)
+
+        then_expr = evaluate(term.then_expr, arg, depth, closed)
+        else_expr = evaluate(term.else_expr, arg, depth, closed)
+
+        if isinstance(condition, Boolean):
+            return then_expr if condition.value else else_expr
+        return IfExpression(condition, then_expr, else_expr)
+
+    elif t is BinaryOperation:
+        left = evaluate(term.left, arg, depth, closed)
+        right = evaluate(term.right, arg, depth, closed)
+        result = fold_binary(left, term.op, right)
+        return result if result is not None else BinaryOperation(left, term.op, right)
+
+    elif t is UnaryOperation:
+        value = evaluate(term.value, arg, depth, closed)
+        result = fold_unary(term.op, value)
+        return result if result is not None else UnaryOperation(term.op, value)
+
+    elif t is NamelessLet:
+        bound_expr = evaluate(term.bound_expr, arg, depth, closed)
+        body = term.body
+        if arg is not None:
+            body = substitute(body, arg, depth + 1, closed)
+        return instantiate(body, bound_expr)
+
+    return map_children(term, lambda child: evaluate(child, arg, depth, closed))
+
+
+def beta(body: ASTNode, arg: ASTNode) -> ASTNode:
+    return evaluate(body, arg, 0, is_closed(arg))
+
+
+def fold(term: ASTNode) -> ASTNode:
+    return evaluate(term, None, 0, True)
+
+
+def is_redex(node: ASTNode) -> bool:
+    return (
+        isinstance(node, Application)
+        and isinstance(node.func, (NamelessAbstraction, BuiltinFunction))
+    ) or isinstance(
+        node, (BinaryOperation, UnaryOperation, IfExpression, NamelessLet)
+    )
+
+
+# Same contractions as ast_tree.do_reduce. Builtins get the named form of
+# their arguments, and their result is converted back.
+def contract(redex: ASTNode, names: tuple, reduce) -> Step:
+    if isinstance(redex, Application):
+        if isinstance(redex.func, BuiltinFunction):
+            args = reduce(redex.arg, names=names).elements
+            result = redex.func(*(from_nameless(arg, names) for arg in args))
+            if isinstance(result, ASTNode):
+                result = to_nameless(result, names)
+            return Step(result, True)
+
+        return Step(beta(redex.func.body, redex.arg), True)
+
+    if isinstance(redex, BinaryOperation):
+        left = redex.left
+        if isinstance(left, Application):
+            left = reduce(left, names=names)
+
+        right = redex.right
+        if isinstance(right, Application):
+            right = reduce(right, names=names)
+
+        reduced = fold(BinaryOperation(left, redex.op, right))
+    else:
+        reduced = fold(redex)
+
+    return Step(reduced, reduced != redex)
+
+
+# Contracts the leftmost-outermost redex, searching the same positions as
+# ast_tree.nor_step. Only the nodes on the path to the redex are rebuilt.
+def nor_step(term: ASTNode, names: tuple = (), normalize=None) -> Step:
+    if normalize is None:
+        normalize = normal_order_reduction
+
+    # Entries carry the path to their node as a linked list of
+    # (rest, parent, field) cells.
+    stack = [(term, names, None)]
+
+    while stack:
+        current, scope, path = stack.pop()
+
+        if is_redex(current):
+            reduced, changed = contract(current, scope, normalize)
+            if not changed:
+                return Step(term, False)
+
+            while path is not None:
+                path, parent, key = path
+                parent = shallow_copy(parent)
+                setattr(parent, key, reduced)
+                reduced = parent
+            return Step(reduced, True)
+
+        t = type(current)
+        if t is NamelessAbstraction:
+            stack.append((current.body, scope + (current.hint,), (path, current, "body")))
+        else:
+            for key in reversed(REDEX_SEARCH_FIELDS.get(t, ())):
+                child = getattr(current, key)
+                if child is not None:
+                    stack.append((child, scope, (path, current, key)))
+
+    if isinstance(term, (List, Tuple)):
+        elements = [normalize(e, names=names) for e in term.elements]
+        changed = any(a is not b for a, b in zip(elements, term.elements))
+        return Step(type(term)(elements), changed)
+
+    return Step(term, False)
+
+
+def normal_order_reduction(
+    term: ASTNode, max_steps=1000, names: tuple = (), observer=None, budget=None
+):
+    def render(current):
+        return str(from_nameless(current, names))
+
+    normalize = None
+    if observer is not None or budget is not None:
+        normalize = functools.partial(
+            normal_order_reduction,
+            max_steps=max_steps,
+            observer=observer,
+            budget=budget,
+        )
+
+    current = term
+    steps = 0
+
+    while max_steps is None or steps < max_steps:
+        if observer is not None:
+            observer(StepEvent("NOR", steps, current, render))
+        next_term, changed = nor_step(current, names, normalize)
+
+        if not changed:
+            break
+        if budget is not None:
+            try:
+                budget.spend(current, next_term)
+            except BudgetExceeded as e:
+                e.term = from_nameless(current, names)
+                raise
+
+        current = next_term
+        steps += 1
+
+    return current
+
+
+# Mirrors ast_tree.aor_step, whose all_reduced() check holds for every term,
+# so operators, conditionals and lets are always contracted where they stand.
+def aor_step(term: ASTNode, names: tuple = (), normalize=None) -> Step:
+    if normalize is None:
+        normalize = applicative_order_reduction
+
+    def reduce(current, names):
+        if is_redex(current):
+            reduced, changed = contract(current, names, normalize)
+            return reduced if changed else current
+
+        t = type(current)
+
+        if t is Application:
+            func = reduce(current.func, names)
+            if func is not current.func:
+                return Application(func, current.arg)
+
+            arg = reduce(current.arg, names)
+            if arg is not current.arg:
+                return Application(current.func, arg)
+
+        elif t is NamelessAbstraction:
+            body = reduce(current.body, names + (current.hint,))
+            if body is not current.body:
+                return NamelessAbstraction(current.hint, body)
+
+        elif t is List or t is Tuple or t is RangeExpression:
+            return map_children(current, lambda child: reduce(child, names))
+
+        return current
+
+    reduced = reduce(term, names)
+    return Step(reduced, reduced is not term)
+
+
+def applicative_order_reduction(
+    term: ASTNode, max_steps=1000, names: tuple = (), observer=None, budget=None
+):
+    def render(current):
+        return str(from_nameless(current, names))
+
+    normalize = None
+    if observer is not None or budget is not None:
+        normalize = functools.partial(
+            applicative_order_reduction,
+            max_steps=max_steps,
+            observer=observer,
+            budget=budget,
+        )
+
+    current = term
+    steps = 0
+
+    while max_steps is None or steps < max_steps:
+        if observer is not None:
+            observer(StepEvent("AOR", steps, current, render))
+        next_term, changed = aor_step(current, names, normalize)
+
+        if not changed:
+            break
+        if budget is not None:
+            try:
+                budget.spend(current, next_term)
+            except BudgetExceeded as e:
+                e.term = from_nameless(current, names)
+                raise
+
+        current = next_term
+        steps += 1
+
+    return current
@@ -1,4 +1,4 @@
-from LambdaVisitor import LambdaVisitor
+import inspect
 from ast_tree import (
     Abstraction,
     Application,
@@ -12,6 +12,7 @@ from ast_tree import (
     UnaryOperation,
     BuiltinFunction,
     String,
+    shallow_copy,
     List,
     Tuple,
     RangeExpression,
@@ -57,6 +58,7 @@ def func_fold(func, start, x):
     for el in expanded:
         step_result_accum = func.body.reduce(func.param, accumulator)
         step_result = step_result_accum.body.reduce(step_result_accum.param, el)
+        accumulator = shallow_copy(accumulator)
         accumulator.value = step_result.value
 
     return accumulator
@@ -82,3 +84,35 @@ initial_environment = {
     "fold": func_fold,
     "filter": func_filter,
 }
+
+
+builtin_arities = {
+    name: len(inspect.signature(func).parameters)
+    for name, func in initial_environment.items()
+}
+
+
+# Every occurrence of a builtin uses the same generated names, so parsing
+# doesn't intern new symbols; the reducers rename bound variables where they
+# would clash. The names can never be written in source, since IDs don't
+# contain '#', and the trailing '#' keeps the numeric suffixes appended by
+# fresh_name from turning one generated name into another.
+def _builtin_template(name: str) -> Abstraction:
+    func = initial_environment[name]
+
+    params = [Variable(f"#{name}{i}#") for i in range(1, builtin_arities[name] + 1)]
+    body = Application(BuiltinFunction(f"#{name}#", name, func), Tuple(params))
+
+    for param in reversed(params):
+        body = Abstraction(param, body)
+
+    return body
+
+
+# Nodes are never modified once built, so every occurrence of a builtin
+# shares the one tree built here at import time.
+builtin_templates = {name: _builtin_template(name) for name in initial_environment}
+
+
+def make_builtin(name: str) -> Abstraction:
+    return builtin_templates[name]
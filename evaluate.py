@@ -1,26 +1,242 @@
-from antlr4 import InputStream, CommonTokenStream
-from LambdaLexer import LambdaLexer
-from LambdaParser import LambdaParser
-from visitor import CustomVisitor
+import io
+import re
+import threading
+from typing import Iterator
+
 from ast_tree import ASTNode, normal_order_reduction, applicative_order_reduction
+from budget import DEFAULT_FUEL, Budget
+from parse_cache import ParseCache
+from serialization import ASTDecoder, MAGIC, loads
+import pratt_parser
+
+
+parse_cache = ParseCache()
+
+
+# Importing the ANTLR front-end loads the antlr4 runtime and deserializes the
+# lexer and parser ATNs, which dominates startup. It is only imported the
+# first time one of its parsers is actually used.
+def _antlr():
+    import antlr_parser
+
+    return antlr_parser
+
+
+# The evaluation engines other than nor and aor are imported by the branch of
+# evaluate_lambda_ast that uses them, for the same reason. The compile cache
+# is created with the first compiled evaluation, and evaluate.compile_cache
+# reaches it through the module __getattr__. The lock makes sure concurrent
+# first evaluations share one cache.
+_compile_cache_lock = threading.Lock()
+
+
+def _compile_cache():
+    global compile_cache
+    try:
+        return compile_cache
+    except NameError:
+        pass
+    with _compile_cache_lock:
+        try:
+            return compile_cache
+        except NameError:
+            from compiler import CompileCache
+
+            compile_cache = CompileCache()
+            return compile_cache
+
+
+def __getattr__(name):
+    if name == "compile_cache":
+        return _compile_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def parse_lambda_expr(expr: str) -> ASTNode:
+    return _antlr().parse_lambda_expr(expr)
+
+
+def parse_lambda_expr_ll(expr: str) -> ASTNode:
+    return _antlr().parse_lambda_expr_ll(expr)
+
+
+def parse_program(source: str) -> Iterator[ASTNode]:
+    return _antlr().parse_program(source)
+
+
+def parse_program_ll(source: str) -> Iterator[ASTNode]:
+    return _antlr().parse_program_ll(source)
+
 
+parsers = {
+    "antlr": parse_lambda_expr,
+    "ll": parse_lambda_expr_ll,
+    "pratt": pratt_parser.parse,
+}
 
-def lambda_expr_to_ast(expr: str) -> ASTNode:
-    input_stream = InputStream(expr)
-    lexer = LambdaLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = LambdaParser(stream)
-    tree = parser.prog()
-    return CustomVisitor().visit(tree)
+program_parsers = {
+    "antlr": parse_program,
+    "ll": parse_program_ll,
+    "pratt": pratt_parser.parse_program,
+}
 
+# The front-end used unless another is asked for. The Pratt parser is
+# iterative, so unlike the ANTLR ones it handles nesting of any depth; it
+# raises SyntaxError on malformed input where ANTLR reports and recovers.
+DEFAULT_PARSER = "pratt"
+
+
+# Entries are keyed by front-end as well as by source: on malformed input the
+# ANTLR front-ends recover while the Pratt one raises, so a tree cached by one
+# must not answer for another.
+def lambda_expr_to_ast(
+    expr: str, use_cache=True, parser=DEFAULT_PARSER
+) -> ASTNode:
+    parse = parsers[parser]
+    if use_cache:
+        return parse_cache.get_or_parse(expr, parse, key=(parser, expr))
+    return parse(expr)
+
+
+# Expressions are parsed one statement at a time as the generator is
+# consumed, so evaluation can start before the whole program is parsed.
+def program_to_asts(source: str, parser=DEFAULT_PARSER) -> Iterator[ASTNode]:
+    return program_parsers[parser](source)
+
+
+# A ';' that ends a statement, skipping string literals; a lone '"' is a
+# string that isn't complete yet.
+STATEMENT_END = re.compile(r'"(?:[^"\\]|\\["\\])*"|"|;')
+
+READ_SIZE = 1 << 16
+
+
+# Splits text read from a file into blocks of whole statements, cut after the
+# last ';' read so far, so only one block and the statement it cuts through
+# are ever held in memory.
+def statement_blocks(file) -> Iterator[str]:
+    pending = ""
+    while True:
+        chunk = file.read(READ_SIZE)
+        if not chunk:
+            if pending:
+                yield pending
+            return
+        pending += chunk
+        cut = 0
+        for match in STATEMENT_END.finditer(pending):
+            if match.group() == '"':
+                break
+            if match.group() == ";":
+                cut = match.end()
+        if cut:
+            yield pending[:cut]
+            pending = pending[cut:]
+
+
+# Files written with serialization.dump are loaded directly, without parsing.
+# Both kinds are read as the generator is consumed, binary ones a tree at a
+# time and source files a block at a time (see statement_blocks); positions
+# in syntax errors count from the start of the block.
+def program_file_to_asts(path: str, parser=DEFAULT_PARSER) -> Iterator[ASTNode]:
+    with open(path, "rb") as file:
+        if file.peek(len(MAGIC)).startswith(MAGIC):
+            yield from ASTDecoder(file)
+            return
+        for block in statement_blocks(io.TextIOWrapper(file, encoding="utf-8")):
+            yield from program_to_asts(block, parser=parser)
+
+
+# The *_db strategies reduce a de Bruijn copy of the tree (see debruijn.py)
+# and convert only the result back to named form. "cek" evaluates call by
+# value on an abstract machine (see cek.py) and reads the result back. "cbn"
+# evaluates call by name on a Krivine machine (see krivine.py), and
+# "cbn_whnf" stops it at weak head normal form. "need" and "need_whnf" run
+# the same machine call by need, evaluating each argument at most once.
+# "optimal" is the experimental interaction net reducer in optimal.py, for
+# pure lambda terms only. "compiled" evaluates call by value, like "cek", by
+# compiling the tree into Python closures (see compiler.py); the program is
+# kept in compile_cache and reused whenever the same tree is evaluated again.
+#
+# Reduction steps are not reported unless an observer is given: any callable
+# taking a tracing.StepEvent, such as a tracing.Tracer.
+#
+# Without limits a reduction stops quietly after 1000 steps (the machines
+# raise BudgetExceeded instead, having no partly reduced term). With any of
+# fuel (steps), timeout (seconds) or max_nodes (term size, or what stands in
+# for it on the machines, see budget.Budget) the reduction runs until it is
+# done or raises budget.BudgetExceeded, which tells the limit that tripped.
+# Only an explicit fuel lifts the step cap: without one the budget gets
+# budget.DEFAULT_FUEL, so a term that neither grows nor ends still stops.
+def evaluate_lambda_ast(
+    ast: ASTNode,
+    strategy="nor",
+    observer=None,
+    fuel: int = None,
+    timeout: float = None,
+    max_nodes: int = None,
+) -> str:
+    limits = {}
+    if fuel is not None or timeout is not None or max_nodes is not None:
+        if fuel is None:
+            fuel = DEFAULT_FUEL
+        limits = {"max_steps": None, "budget": Budget(fuel, timeout, max_nodes)}
 
-def evaluate_lambda_ast(ast: ASTNode, strategy="nor") -> str:
     if strategy == "nor":
-        return normal_order_reduction(ast)
+        return normal_order_reduction(ast, observer=observer, **limits)
     elif strategy == "aor":
-        return applicative_order_reduction(ast)
+        return applicative_order_reduction(ast, observer=observer, **limits)
+    elif strategy == "nor_db":
+        import debruijn
+
+        term = debruijn.to_nameless(ast)
+        return debruijn.from_nameless(
+            debruijn.normal_order_reduction(term, observer=observer, **limits)
+        )
+    elif strategy == "aor_db":
+        import debruijn
+
+        term = debruijn.to_nameless(ast)
+        return debruijn.from_nameless(
+            debruijn.applicative_order_reduction(term, observer=observer, **limits)
+        )
+    elif strategy == "cek":
+        import cek
+
+        return cek.evaluate(ast, observer=observer, **limits)
+    elif strategy in ("cbn", "cbn_whnf", "need", "need_whnf"):
+        import krivine
+
+        return krivine.evaluate(
+            ast,
+            whnf=strategy.endswith("_whnf"),
+            need=strategy.startswith("need"),
+            observer=observer,
+            **limits,
+        )
+    elif strategy == "optimal":
+        import optimal
+
+        return optimal.evaluate(ast, observer=observer, **limits)
+    elif strategy == "compiled":
+        program = _compile_cache().get_or_compile(ast)
+        return program.run(observer=observer, **limits)
+
+
+def evaluate_serialized(data: bytes, strategy="nor", **options) -> str:
+    return evaluate_lambda_ast(loads(data), strategy=strategy, **options)
+
+
+def evaluate_lambda_expr(
+    expr: str, strategy="nor", parser=DEFAULT_PARSER, **options
+) -> str:
+    ast = lambda_expr_to_ast(expr, parser=parser)
+    return evaluate_lambda_ast(ast, strategy=strategy, **options)
 
 
-def evaluate_lambda_expr(expr: str, strategy="nor") -> str:
-    ast = lambda_expr_to_ast(expr)
-    return evaluate_lambda_ast(ast, strategy=strategy)
+# Limits apply to each expression on its own.
+def evaluate_program(
+    source: str, strategy="nor", parser=DEFAULT_PARSER, **options
+) -> Iterator[str]:
+    for ast in program_to_asts(source, parser=parser):
+        yield evaluate_lambda_ast(ast, strategy=strategy, **options)
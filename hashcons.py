@@ -0,0 +1,142 @@
+import weakref
+
+from ast_tree import ASTNode, Variable, Abstraction, Application, field_items
+
+
+# Hash-consing for ASTs: interning a tree returns a DAG in which structurally
+# equal subterms are one shared object, so two nodes of the same store are
+# equal exactly when they are identical. Interned nodes carry a precomputed
+# hash (_hash) and tree size (_size).
+#
+# The table holds its nodes weakly, so entries disappear as soon as nothing
+# else uses them. Nodes are keyed by their class, their scalar fields and the
+# ids of their (already canonical) children; a canonical node keeps its
+# children alive, so those ids can't be reused while the entry exists.
+#
+# The reducers in ast_tree never modify nodes, so interned trees can be
+# reduced directly. Nothing in parsing or reduction interns on its own;
+# callers intern the trees they want to share or compare.
+class HashConsStore:
+    def __init__(self):
+        self._table = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def clear(self):
+        self._table.clear()
+
+    def intern(self, node: ASTNode) -> ASTNode:
+        canonical = {}
+        stack = [(node, False)]
+
+        while stack:
+            obj, ready = stack.pop()
+            if id(obj) in canonical:
+                continue
+
+            if not ready:
+                stack.append((obj, True))
+                for _, value in field_items(obj):
+                    if isinstance(value, ASTNode):
+                        stack.append((value, False))
+                    elif isinstance(value, list):
+                        stack.extend((e, False) for e in value)
+                continue
+
+            canonical[id(obj)] = self._intern_node(obj, canonical)
+
+        return canonical[id(node)]
+
+    def _intern_node(self, obj: ASTNode, canonical: dict) -> ASTNode:
+        cls = type(obj)
+        fields = []
+        key = [cls]
+
+        for name, value in field_items(obj):
+            if isinstance(value, ASTNode):
+                value = canonical[id(value)]
+                key.append(id(value))
+            elif isinstance(value, list):
+                value = [canonical[id(e)] for e in value]
+                key.append(tuple(id(e) for e in value))
+            elif isinstance(value, float):
+                # 1 == 1.0 and 0.0 == -0.0 but they print differently.
+                key.append((float, value.hex()))
+            else:
+                key.append((type(value), value))
+            fields.append((name, value))
+
+        key = tuple(key)
+        node = self._table.get(key)
+        if node is not None:
+            self.hits += 1
+            return node
+
+        self.misses += 1
+        node = object.__new__(cls)
+        for name, value in fields:
+            setattr(node, name, value)
+        node._hash, node._size = _hash_and_size(node, fields)
+        self._table[key] = node
+        return node
+
+
+def _hash_and_size(node: ASTNode, fields: list) -> tuple[int, int]:
+    size = 1
+    parts = [type(node).__name__]
+
+    for _, value in fields:
+        if isinstance(value, ASTNode):
+            parts.append(value._hash)
+            size += value._size
+        elif isinstance(value, list):
+            parts.append(tuple(e._hash for e in value))
+            size += sum(e._size for e in value)
+        else:
+            parts.append(value)
+
+    # Keep the hashes of the classes that define __hash__ unchanged; their
+    # children are canonical already, so this doesn't recurse. Below
+    # unhashable nodes (lists, numbers, ...) the generic hash is used.
+    if type(node) in (Variable, Abstraction, Application):
+        try:
+            return hash(node), size
+        except TypeError:
+            pass
+    return hash(tuple(parts)), size
+
+
+def tree_size(node: ASTNode) -> int:
+    if hasattr(node, "_size"):
+        return node._size
+
+    size = 0
+    stack = [node]
+    while stack:
+        obj = stack.pop()
+        size += 1
+        for _, value in field_items(obj):
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+    return size
+
+
+def dag_size(node: ASTNode) -> int:
+    seen = set()
+    stack = [node]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        for _, value in field_items(obj):
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+    return len(seen)
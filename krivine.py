@@ -0,0 +1,347 @@
+from ast_tree import (
+    ASTNode,
+    Application,
+    Variable,
+    Boolean,
+    IfExpression,
+    BinaryOperation,
+    UnaryOperation,
+    BuiltinFunction,
+    List,
+    Tuple,
+    RangeExpression,
+    fold_binary,
+    fold_unary,
+)
+from cek import children, rebuild
+from debruijn import (
+    BoundVariable,
+    NamelessAbstraction,
+    NamelessLet,
+    convert,
+    from_nameless,
+    substitute,
+    to_nameless,
+)
+from machine import (
+    APPLY,
+    BRANCH,
+    FREE,
+    LEVEL,
+    OPERATOR,
+    UNARY,
+    Machine,
+    Neutral,
+)
+
+
+# Call-by-name Krivine machine on locally nameless terms (see debruijn.py).
+# The state is a term, its environment and a stack. Applications push their
+# argument, unevaluated, as a closure over the current environment, and an
+# abstraction pops one and binds it, so arguments are only evaluated where a
+# variable is used, and again each time it is used.
+#
+# The machine stops at weak head normal form: a function, a constant, a
+# list, tuple or range whose elements are not evaluated yet, or a neutral
+# term. Operators and conditionals need the value of their operands, which
+# are evaluated to weak head normal form through frames on the same stack.
+#
+# Environments are linked (entry, rest) cells indexed by de Bruijn index. An
+# entry is a Closure to evaluate, or a Neutral that stands for a binder the
+# read-back is going under.
+#
+# With need=True the machine evaluates call by need instead: the closures of
+# arguments and let bindings are thunks, shared by every environment they
+# are bound in. The first lookup of a thunk pushes an update frame below its
+# evaluation, and the weak head normal form that reaches the frame is stored
+# in the thunk, so later lookups reuse it and no argument is evaluated twice.
+
+
+# `value` is set once a thunk has been evaluated; it is never set with
+# need=False.
+class Closure:
+    __slots__ = ("term", "env", "value")
+
+    def __init__(self, term: ASTNode, env):
+        self.term = term
+        self.env = env
+        self.value = None
+
+
+# Frames on the stack, next to argument closures.
+RIGHT_FRAME = 0  # (RIGHT_FRAME, node, env): evaluate the right operand next
+FOLD_FRAME = 1  # (FOLD_FRAME, node, left): apply the binary operator
+UNARY_FRAME = 2  # (UNARY_FRAME, node): apply the unary operator
+BRANCH_FRAME = 3  # (BRANCH_FRAME, node, env): pick a branch
+UPDATE_FRAME = 4  # (UPDATE_FRAME, thunk): store the value in the thunk
+
+
+def lookup(env, index: int):
+    for _ in range(index):
+        env = env[1]
+    return env[0]
+
+
+# A step is one contraction: a beta step, a let, an operator, a conditional or
+# a builtin call. The size of the state is the length of the stack.
+class KrivineMachine(Machine):
+    def __init__(self, max_steps=1000, observer=None, budget=None, need=False):
+        super().__init__(max_steps, observer, budget)
+        self.need = need
+        self.strategy = "NEED" if need else "CBN"
+
+    # Strong evaluation reads functions back by evaluating their bodies, so
+    # the result is the normal form NOR would reach; whnf=True stops at the
+    # weak head normal form and reads the rest back as it is.
+    def evaluate(self, term: ASTNode, whnf=False) -> ASTNode:
+        self.term = term
+        value = self.run(to_nameless(term), None, ())
+        return from_nameless(self.quote(value) if whnf else self.read_back(value, ()))
+
+    def force(self, entry, names: tuple):
+        if type(entry) is not Closure:
+            return entry
+        if entry.value is not None:
+            return entry.value
+        value = self.run(entry.term, entry.env, names)
+        if self.need:
+            entry.value, entry.env = value, None
+        return value
+
+    # names holds the binders the read-back is under, innermost last; builtins
+    # need them to name the variables bound there.
+    def run(self, control: ASTNode, env, names: tuple):
+        stack = []
+
+        while True:
+            # Evaluate control until it is in weak head normal form.
+            while True:
+                t = type(control)
+                if t is Application:
+                    stack.append(Closure(control.arg, env))
+                    control = control.func
+                elif t is BoundVariable:
+                    entry = lookup(env, control.index)
+                    if type(entry) is not Closure:
+                        value = entry
+                        break
+                    if entry.value is not None:
+                        value = entry.value
+                        break
+                    if self.need:
+                        stack.append((UPDATE_FRAME, entry))
+                    control, env = entry.term, entry.env
+                elif t is NamelessAbstraction:
+                    if not stack or type(stack[-1]) is not Closure:
+                        value = Closure(control, env)
+                        break
+                    self.step(control, len(stack))
+                    env = (stack.pop(), env)
+                    control = control.body
+                elif t is NamelessLet:
+                    self.step(control, len(stack))
+                    env = (Closure(control.bound_expr, env), env)
+                    control = control.body
+                elif t is BinaryOperation:
+                    stack.append((RIGHT_FRAME, control, env))
+                    control = control.left
+                elif t is UnaryOperation:
+                    stack.append((UNARY_FRAME, control))
+                    control = control.value
+                elif t is IfExpression:
+                    stack.append((BRANCH_FRAME, control, env))
+                    control = control.condition
+                elif t is BuiltinFunction and stack and type(stack[-1]) is Closure:
+                    self.step(control, len(stack))
+                    result = self.call(control, self.force(stack.pop(), names), names)
+                    if not isinstance(result, ASTNode):
+                        value = result
+                        break
+                    # Indices in the result point at the binders being read
+                    # back.
+                    control = to_nameless(result, names)
+                    env = None
+                    for level in range(len(names)):
+                        env = (Neutral(LEVEL, level), env)
+                elif t is Variable:
+                    value = Neutral(FREE, control)
+                    break
+                elif t is List or t is Tuple or t is RangeExpression:
+                    value = Closure(control, env)
+                    break
+                else:
+                    value = control
+                    break
+
+            # Hand the value to the frames on the stack until one of them has
+            # another term to evaluate.
+            while True:
+                if not stack:
+                    return value
+
+                frame = stack.pop()
+                if type(frame) is Closure:
+                    # A function only gets here from a thunk update; anything
+                    # else is a neutral term or a constant.
+                    t = type(value)
+                    if t is Closure and type(value.term) is NamelessAbstraction:
+                        control, env = value.term, value.env
+                    elif t is BuiltinFunction:
+                        control = value
+                    else:
+                        value = Neutral(APPLY, value, frame)
+                        continue
+                    stack.append(frame)
+                    break
+
+                kind = frame[0]
+                if kind == UPDATE_FRAME:
+                    thunk = frame[1]
+                    # The environment is only needed until the value is known.
+                    thunk.value, thunk.env = value, None
+
+                elif kind == RIGHT_FRAME:
+                    node = frame[1]
+                    stack.append((FOLD_FRAME, node, value))
+                    control, env = node.right, frame[2]
+                    break
+
+                elif kind == FOLD_FRAME:
+                    node, left = frame[1], frame[2]
+                    self.step(node, len(stack))
+                    result = fold_binary(left, node.op, value)
+                    if result is None:
+                        result = Neutral(OPERATOR, node, left, value)
+                    value = result
+
+                elif kind == UNARY_FRAME:
+                    node = frame[1]
+                    self.step(node, len(stack))
+                    result = fold_unary(node.op, value)
+                    if result is None:
+                        result = Neutral(UNARY, node, value)
+                    value = result
+
+                else:
+                    node, env = frame[1], frame[2]
+                    self.step(node, len(stack))
+                    if type(value) is Boolean:
+                        control = node.then_expr if value.value else node.else_expr
+                        break
+                    value = Neutral(BRANCH, node, value, env)
+
+    # Builtins get the normal forms of their arguments in named form, like
+    # with the rewriting strategies.
+    def call(self, builtin: BuiltinFunction, arg, names: tuple):
+        if type(arg) is Closure and type(arg.term) is Tuple:
+            elements = [self.run(e, arg.env, names) for e in arg.term.elements]
+        else:
+            elements = [arg]
+        return builtin(
+            *(from_nameless(self.read_back(e, names), names) for e in elements)
+        )
+
+    # Strong read-back, with an explicit stack (see debruijn.convert) so that
+    # a result can be nested deeper than the recursion limit. The values of
+    # the children are computed as their parent is visited.
+    def read_back(self, value, names: tuple) -> ASTNode:
+        return convert(value, names, self.visit)
+
+    def visit(self, value, names: tuple):
+        t = type(value)
+        if t is Closure:
+            term, env = value.term, value.env
+            if type(term) is NamelessAbstraction:
+                inner = names + (term.hint,)
+                body = self.run(term.body, (Neutral(LEVEL, len(names)), env), inner)
+                return (
+                    lambda converted: NamelessAbstraction(term.hint, converted[0]),
+                    [(body, inner)],
+                )
+            return (
+                lambda converted: rebuild(term, converted),
+                [(self.run(n, env, names), names) for n in children(term)],
+            )
+
+        if t is Neutral:
+            kind, parts = value.kind, value.parts
+            if kind == LEVEL:
+                index = len(names) - parts[0] - 1
+                return lambda _: BoundVariable(index), []
+            if kind == FREE:
+                return lambda _: parts[0], []
+            if kind == APPLY:
+                head, arg = parts
+                return (
+                    lambda converted: Application(*converted),
+                    [(head, names), (self.force(arg, names), names)],
+                )
+            if kind == OPERATOR:
+                node, left, right = parts
+                op = node.op
+                return (
+                    lambda converted: BinaryOperation(converted[0], op, converted[1]),
+                    [(left, names), (right, names)],
+                )
+            if kind == UNARY:
+                node, operand = parts
+                return (
+                    lambda converted: UnaryOperation(node.op, converted[0]),
+                    [(operand, names)],
+                )
+            node, condition, env = parts
+            return (
+                lambda converted: IfExpression(*converted),
+                [
+                    (condition, names),
+                    (self.run(node.then_expr, env, names), names),
+                    (self.run(node.else_expr, env, names), names),
+                ],
+            )
+
+        return lambda _: value, []
+
+    # Weak read-back: closures are turned back into terms by substituting
+    # their environment, without evaluating anything.
+    def quote(self, value) -> ASTNode:
+        t = type(value)
+        if t is Closure:
+            if value.value is not None:
+                return self.quote(value.value)
+            return self.quote_term(value.term, value.env)
+
+        if t is Neutral:
+            kind, parts = value.kind, value.parts
+            if kind == FREE:
+                return parts[0]
+            if kind == APPLY:
+                return Application(self.quote(parts[0]), self.quote(parts[1]))
+            if kind == OPERATOR:
+                node, left, right = parts
+                return BinaryOperation(self.quote(left), node.op, self.quote(right))
+            if kind == UNARY:
+                node, operand = parts
+                return UnaryOperation(node.op, self.quote(operand))
+            if kind == BRANCH:
+                node, condition, env = parts
+                return IfExpression(
+                    self.quote(condition),
+                    self.quote_term(node.then_expr, env),
+                    self.quote_term(node.else_expr, env),
+                )
+
+        return value
+
+    def quote_term(self, term: ASTNode, env) -> ASTNode:
+        free = [v for v in term.free_variables() if type(v) is int]
+        for _ in range(max(free, default=-1) + 1):
+            # Quoted entries are closed, so they need no shifting.
+            term = substitute(term, self.quote(env[0]), 0, True)
+            env = env[1]
+        return term
+
+
+def evaluate(
+    term: ASTNode, whnf=False, max_steps=1000, observer=None, budget=None, need=False
+) -> ASTNode:
+    return KrivineMachine(max_steps, observer, budget, need).evaluate(term, whnf)
@@ -0,0 +1,54 @@
+from budget import BudgetExceeded
+from tracing import StepEvent
+
+
+# What the abstract machines (cek.py, krivine.py, compiler.py, optimal.py)
+# have in common.
+#
+# Builtins may return a value that is not a tree, e.g. the iterator returned
+# by expand. The machines hand it back as the result of the evaluation as it
+# is, without reading it back.
+
+
+# A value that is stuck: a variable, or an application, operator or
+# conditional whose head is one. `parts` depend on the kind, and are closures
+# on the Krivine machine and compiled code in compiler.py.
+class Neutral:
+    __slots__ = ("kind", "parts")
+
+    def __init__(self, kind: int, *parts):
+        self.kind = kind
+        self.parts = parts
+
+
+LEVEL = 0  # (level,): the binder at that de Bruijn level of the read-back
+FREE = 1  # (variable,)
+APPLY = 2  # (head, argument)
+OPERATOR = 3  # (node or op, left, right)
+UNARY = 4  # (node or op, value)
+BRANCH = 5  # (node, condition, env) or (condition, then code, else code, env)
+
+
+# Step accounting. Each machine calls step() once for every step it counts,
+# with the node to report (None for steps that aren't reported) and the size
+# of its state, which is what max_nodes is measured against (see
+# budget.Budget). Without a budget the machines raise BudgetExceeded after
+# max_steps steps, having no partly reduced term to return.
+class Machine:
+    strategy = None
+
+    def __init__(self, max_steps=1000, observer=None, budget=None):
+        self.max_steps = max_steps
+        self.observer = observer
+        self.budget = budget
+        self.steps = 0
+        self.term = None
+
+    def step(self, node, size: int, render=str):
+        if self.observer is not None and node is not None:
+            self.observer(StepEvent(self.strategy, self.steps, node, render))
+        if self.budget is not None:
+            self.budget.spend(self.term, size, int)
+        elif self.max_steps is not None and self.steps >= self.max_steps:
+            raise BudgetExceeded("fuel", self.steps, self.term)
+        self.steps += 1
@@ -1,7 +1,43 @@
-from evaluate import evaluate_lambda_expr
+import argparse
+
+from evaluate import (
+    DEFAULT_PARSER,
+    evaluate_lambda_ast,
+    evaluate_lambda_expr,
+    parsers,
+    program_file_to_asts,
+)
+from tracing import TRACE_LEVELS, Tracer
+
+
+def run_files(paths, observer=None, parser=DEFAULT_PARSER):
+    for path in paths:
+        for ast in program_file_to_asts(path, parser=parser):
+            print(evaluate_lambda_ast(ast, observer=observer))
+
+
+# `--trace LEVEL` (off, counts, sampled or full) prints reduction steps.
+# `--parser NAME` (pratt, the default, antlr or ll) picks the front-end; only
+# pratt handles nesting deeper than the recursion limit. Unknown values are
+# usage errors.
+def parse_args(args):
+    arguments = argparse.ArgumentParser(description="Lambda calculus evaluator")
+    arguments.add_argument("paths", nargs="*", help="program files to run")
+    arguments.add_argument("--trace", choices=TRACE_LEVELS, help="trace level")
+    arguments.add_argument(
+        "--parser", choices=sorted(parsers), default=DEFAULT_PARSER, help="front-end"
+    )
+    options = arguments.parse_args(args)
+    observer = Tracer(options.trace) if options.trace is not None else None
+    return options.paths, observer, options.parser
 
 
 def main():
+    paths, observer, parser = parse_args(None)
+    if paths:
+        run_files(paths, observer, parser)
+        return
+
     print("Lambda Calculus REPL")
     print("Enter 'exit' to quit\n")
 
@@ -11,8 +47,14 @@ def main():
             if text.lower() in ("exit", "quit"):
                 break
 
-            print(f"NOR: {evaluate_lambda_expr(text, strategy='nor')}")
-            print(f"AOR: {evaluate_lambda_expr(text, strategy='aor')}")
+            nor = evaluate_lambda_expr(
+                text, strategy="nor", parser=parser, observer=observer
+            )
+            print(f"NOR: {nor}")
+            aor = evaluate_lambda_expr(
+                text, strategy="aor", parser=parser, observer=observer
+            )
+            print(f"AOR: {aor}")
 
         except Exception as e:
             print(f"Error: {e}")
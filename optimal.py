@@ -0,0 +1,256 @@
+from ast_tree import ASTNode, Application, Variable
+from debruijn import (
+    BoundVariable,
+    NamelessAbstraction,
+    NamelessLet,
+    convert,
+    from_nameless,
+    to_nameless,
+)
+from machine import Machine
+
+
+# Experimental optimal reduction of pure lambda terms (variables, abstractions,
+# applications and lets) with interaction nets: Lamping's abstract algorithm,
+# as symmetric interaction combinators.
+#
+# A term is compiled into a graph of nodes with one principal port and up to
+# two auxiliary ones. Abstractions and applications are both CON nodes:
+#
+#   abstraction  0: the abstraction  1: its variable  2: its body
+#   application  0: the function     1: the argument  2: the application
+#
+# A variable used more than once is shared through a tree of FAN nodes
+# (0: the shared term, 1 and 2: the two copies), and an unused one is
+# plugged with an ERA node. Reduction rewrites two nodes whose principal
+# ports are connected: two nodes of the same kind annihilate (for CON nodes
+# that is a beta step), two of different kinds copy each other, and an ERA
+# deletes what it meets. Every fan has its own kind (its label), so a
+# function body is never copied more than once however often it is shared,
+# and the work done inside it is not repeated for each copy.
+#
+# Only the pairs on the path from the root are reduced, so unused arguments
+# are never evaluated, and the normal form is read back from the root by
+# following the wires. Whenever the read-back enters a fan at a copy and
+# leaves it at the shared term, it pushes the copy's port; leaving a fan the
+# other way pops it.
+#
+# Without Lamping's brackets and croissants this is only correct for terms
+# that type in elementary affine logic. Church numerals and their arithmetic
+# do. For others the read-back may fail, which raises ValueError, or may even
+# give a wrong result.
+
+
+class Node:
+    __slots__ = ("kind", "data", "ports")
+
+    def __init__(self, kind: int, data=None):
+        self.kind = kind
+        # The variable hint of an abstraction, or the node of a free variable.
+        self.data = data
+        self.ports = [None, None, None]
+
+
+ROOT = 0  # port 1 holds the term
+FREE = 1  # a free variable
+ERA = 2
+CON = 3
+FAN = 4  # and every label above it
+
+# Only these kinds interact.
+ACTIVE = ERA
+
+
+def link(a: tuple, b: tuple):
+    a[0].ports[a[1]] = b
+    b[0].ports[b[1]] = a
+
+
+# A step is one interaction, or one wire followed by the read-back: a term
+# the algorithm can't handle may read back as an infinite term, which has to
+# run out of steps too. Only interactions are reported to the observer. The
+# size of the state is the number of nodes built so far.
+class InteractionNet(Machine):
+    strategy = "OPT"
+
+    def __init__(self, max_steps=1000, observer=None, budget=None):
+        super().__init__(max_steps, observer, budget)
+        self.nodes = 0
+        self.label = FAN
+        self.depths = {}
+
+    def node(self, kind: int, data=None) -> Node:
+        self.nodes += 1
+        return Node(kind, data)
+
+    def evaluate(self, term: ASTNode) -> ASTNode:
+        self.term = term
+        root = self.compile(to_nameless(term))
+        return from_nameless(self.read_back(root))
+
+    # Wires the terms to the ports that use them top-down with an explicit
+    # stack, and shares the variables once every use is known.
+    def compile(self, term: ASTNode) -> Node:
+        root = self.node(ROOT)
+        binders = []
+        stack = [(term, (root, 1), None)]
+
+        while stack:
+            term, port, scope = stack.pop()
+            t = type(term)
+            if t is NamelessAbstraction:
+                lam = self.node(CON, term.hint)
+                link((lam, 0), port)
+                uses = []
+                binders.append((lam, uses))
+                stack.append((term.body, (lam, 2), (uses, scope)))
+            elif t is Application:
+                app = self.node(CON)
+                link((app, 2), port)
+                stack.append((term.arg, (app, 1), scope))
+                stack.append((term.func, (app, 0), scope))
+            elif t is NamelessLet:
+                # let x = e in b is (\x. b) e
+                app, lam = self.node(CON), self.node(CON, term.hint)
+                link((app, 2), port)
+                link((app, 0), (lam, 0))
+                uses = []
+                binders.append((lam, uses))
+                stack.append((term.bound_expr, (app, 1), scope))
+                stack.append((term.body, (lam, 2), (uses, scope)))
+            elif t is BoundVariable:
+                for _ in range(term.index):
+                    scope = scope[1]
+                scope[0].append(port)
+            elif t is Variable:
+                link((self.node(FREE, term), 0), port)
+            else:
+                raise TypeError(f"cannot compile {t.__name__} to an interaction net")
+
+        for lam, uses in binders:
+            if not uses:
+                link((self.node(ERA), 0), (lam, 1))
+                continue
+            source = (lam, 1)
+            for use in uses[:-1]:
+                fan = self.node(self.label)
+                self.label += 1
+                link((fan, 0), source)
+                link((fan, 1), use)
+                source = (fan, 2)
+            link(source, uses[-1])
+        return root
+
+    def interact(self, a: Node, b: Node):
+        self.step((a.kind, b.kind), self.nodes, describe)
+        if a.kind == b.kind:
+            if a.kind != ERA:
+                # The ports are read again after each link, in case a and b
+                # were wired to each other.
+                link(a.ports[1], b.ports[1])
+                link(a.ports[2], b.ports[2])
+        elif a.kind == ERA:
+            self.erase(b)
+        elif b.kind == ERA:
+            self.erase(a)
+        else:
+            a1, a2 = self.node(a.kind, a.data), self.node(a.kind, a.data)
+            b1, b2 = self.node(b.kind, b.data), self.node(b.kind, b.data)
+            link((b1, 0), a.ports[1])
+            link((b2, 0), a.ports[2])
+            link((a1, 0), b.ports[1])
+            link((a2, 0), b.ports[2])
+            link((a1, 1), (b1, 1))
+            link((a1, 2), (b2, 1))
+            link((a2, 1), (b1, 2))
+            link((a2, 2), (b2, 2))
+
+    def erase(self, node: Node):
+        link((self.node(ERA), 0), node.ports[1])
+        link((self.node(ERA), 0), node.ports[2])
+
+    # Follows the wire from an auxiliary port until it ends at a principal
+    # port or at the variable of an abstraction, reducing the pairs found on
+    # the way. Passing through a node from an auxiliary port pushes the port,
+    # so that after a rewrite the wire is followed again from where it led
+    # into the node. A path longer than the net goes round a cycle, which
+    # only the terms the algorithm can't handle leave behind.
+    def reduce(self, node: Node, slot: int):
+        stack = []
+        while True:
+            target, target_slot = node.ports[slot]
+            if target_slot == 0:
+                if slot != 0 or target.kind < ACTIVE:
+                    return
+                self.interact(node, target)
+                node, slot = stack.pop()
+            elif target.kind == CON and target_slot == 1:
+                return
+            elif len(stack) > self.nodes:
+                raise ValueError("cycle in the interaction net")
+            else:
+                stack.append((node, slot))
+                node, slot = target, 0
+
+    # Read-back with an explicit stack (see debruijn.convert). A value is the
+    # port a wire is followed from and the stack of fan ports, as linked
+    # (port, rest) cells; names is the number of abstractions above it.
+    def read_back(self, root: Node) -> ASTNode:
+        return convert((root, 1, None), 0, self.visit)
+
+    def visit(self, value, depth: int):
+        node, slot, exits = value
+        while True:
+            self.step(None, self.nodes)
+            # A wire followed from a principal port was reduced along with
+            # the one that led to the node.
+            if slot != 0:
+                self.reduce(node, slot)
+            target, target_slot = node.ports[slot]
+            kind = target.kind
+
+            if kind == FREE:
+                return lambda _: target.data, []
+            if kind == CON:
+                if target_slot == 0:
+                    self.depths[target] = depth
+                    hint = target.data
+                    return (
+                        lambda converted: NamelessAbstraction(hint, converted[0]),
+                        [((target, 2, exits), depth + 1)],
+                    )
+                if target_slot == 1:
+                    if target not in self.depths:
+                        raise ValueError("variable read back outside its abstraction")
+                    index = depth - self.depths[target] - 1
+                    return lambda _: BoundVariable(index), []
+                return (
+                    lambda converted: Application(*converted),
+                    [((target, 0, exits), depth), ((target, 1, exits), depth)],
+                )
+            if kind < FAN:
+                raise ValueError("malformed interaction net")
+
+            if target_slot != 0:
+                node, slot, exits = target, 0, (target_slot, exits)
+            elif exits is None:
+                raise ValueError("fan left without a matching entry")
+            else:
+                node, slot, exits = target, exits[0], exits[1]
+
+
+def describe(kinds: tuple) -> str:
+    a, b = kinds
+    if a == b:
+        return "beta" if a == CON else f"annihilate fan {a}"
+    if ERA in kinds:
+        return "erase"
+    if CON in kinds:
+        return f"copy abstraction or application with fan {max(kinds)}"
+    return f"commute fans {a} and {b}"
+
+
+# Raises TypeError for terms that are not pure, and BudgetExceeded after
+# max_steps interactions and read-back wires without a budget.
+def evaluate(term: ASTNode, max_steps=1000, observer=None, budget=None) -> ASTNode:
+    return InteractionNet(max_steps, observer, budget).evaluate(term)
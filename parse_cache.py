@@ -0,0 +1,126 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional
+
+from ast_tree import ASTNode, field_items
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    memory: int
+
+
+def estimate_memory(node: ASTNode) -> int:
+    total = 0
+    seen = set()
+    stack = [node]
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, ASTNode):
+            stack.extend(value for _, value in field_items(obj))
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+
+    return total
+
+
+# LRU cache of parsed ASTs keyed by source text, or by a key the caller derives
+# from it, bounded by entry count and by estimated memory. ASTs are never
+# modified after parsing, so lookups hand out the cached tree itself.
+class ParseCache:
+    def __init__(self, max_entries: int = 256, max_memory: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self._entries: OrderedDict[Hashable, tuple[ASTNode, int]] = OrderedDict()
+        self._memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[ASTNode]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        return entry[0]
+
+    def put(self, key: Hashable, ast: ASTNode):
+        size = estimate_memory(ast)
+
+        with self._lock:
+            if key in self._entries:
+                self._memory -= self._entries.pop(key)[1]
+
+            if size > self.max_memory or self.max_entries <= 0:
+                return
+
+            self._entries[key] = (ast, size)
+            self._memory += size
+            self._evict()
+
+    def get_or_parse(
+        self, expr: str, parse: Callable[[str], ASTNode], key: Hashable = None
+    ) -> ASTNode:
+        if key is None:
+            key = expr
+
+        ast = self.get(key)
+        if ast is not None:
+            return ast
+
+        ast = parse(expr)
+        self.put(key, ast)
+        return ast
+
+    def resize(self, max_entries: int = None, max_memory: int = None):
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_memory is not None:
+                self.max_memory = max_memory
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._memory,
+            )
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._memory > self.max_memory
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._memory -= size
+            self._evictions += 1
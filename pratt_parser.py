@@ -0,0 +1,358 @@
+import re
+from typing import Iterator, NamedTuple
+
+from environment import initial_environment, make_builtin
+from ast_tree import (
+    ASTNode,
+    Abstraction,
+    Application,
+    Variable,
+    Number,
+    Boolean,
+    IfExpression,
+    BinaryOperation,
+    LetExpression,
+    UnaryOperation,
+    String,
+    List,
+    Tuple,
+    RangeExpression,
+)
+
+
+# Hand-written front-end for Lambda.g4. It mirrors the precedence layers of
+# the grammar, so it accepts the same language and builds the same trees as
+# CustomVisitor without touching the antlr4 runtime.
+
+KEYWORDS = {"if", "then", "else", "let", "in", "not", "and", "or"}
+BOOLEANS = {"true", "false"}
+OPERATORS = [
+    "<=", ">=", "==", "!=", "&&", "||", "..",
+    "(", ")", "[", "]", ",", ".", "=", "\\", "λ", ";",
+    "*", "/", "%", "+", "-", "<", ">", "!",
+]
+
+ID_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+TOKEN_RE = re.compile(
+    "|".join(
+        [
+            r"(?P<WS>[ \t\n\r]+)",
+            r'(?P<STRING>"(?:[^"\\]|\\["\\])*")',
+            r"(?P<NUMBER>-?[0-9_]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?)",
+            r"(?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)",
+            "(?P<OP>" + "|".join(re.escape(op) for op in OPERATORS) + ")",
+        ]
+    )
+)
+
+
+class Token(NamedTuple):
+    type: str
+    text: str
+    pos: int
+
+
+def tokenize(expr: str) -> Iterator[Token]:
+    pos = 0
+    length = len(expr)
+    match = TOKEN_RE.match
+
+    while pos < length:
+        m = match(expr, pos)
+        if m is None:
+            raise SyntaxError(f"unexpected character {expr[pos]!r} at {pos}")
+
+        kind = m.lastgroup
+        text = m.group()
+
+        if kind == "NUMBER" and text[0] == "_":
+            # ANTLR takes the longest match, so `_x1` is an ID while `_1`
+            # stays a NUMBER because NUMBER is declared first.
+            word = ID_RE.match(expr, pos)
+            if word.end() > m.end():
+                kind = "ID"
+                text = word.group()
+
+        pos += len(text)
+
+        if kind == "WS":
+            continue
+        elif kind == "ID":
+            if text in KEYWORDS:
+                kind = text
+            elif text in BOOLEANS:
+                kind = "BOOLEAN"
+        elif kind == "OP":
+            kind = text
+
+        yield Token(kind, text, pos - len(text))
+
+    yield Token("EOF", "", length)
+
+
+BINARY_OPERATORS = {
+    "*": ("*", 10),
+    "/": ("/", 10),
+    "%": ("%", 10),
+    "+": ("+", 9),
+    "-": ("-", 9),
+    "<": ("<", 8),
+    ">": (">", 8),
+    "<=": ("<=", 8),
+    ">=": (">=", 8),
+    "==": ("==", 8),
+    "!=": ("!=", 8),
+    "and": ("&&", 6),
+    "&&": ("&&", 6),
+    "or": ("||", 5),
+    "||": ("||", 5),
+}
+
+APPLICATION_PRECEDENCE = 14
+IF_PRECEDENCE = 12
+LET_PRECEDENCE = 11
+NOT_PRECEDENCE = 7
+
+# An application chain may end in an if, let, lambda or not, whose last
+# operand extends as far to the right as its precedence allows.
+APPLICATION_START = {
+    "(", "[", "if", "let", "λ", "\\", "not", "!", "ID", "NUMBER", "BOOLEAN", "STRING"
+}
+
+
+# Frames of the explicit parse stack. Every nested construct pushes a frame
+# instead of recursing, so nesting depth is only limited by memory.
+EXPR = 0
+BINARY = 1
+APPLY = 2
+LAMBDA = 3
+PAREN = 4
+BRACKET = 5
+IF = 6
+LET = 7
+NOT = 8
+
+
+class PrattParser:
+    def __init__(self, tokens: Iterator[Token]):
+        self.tokens = tokens
+        self.current = next(tokens)
+
+    def advance(self) -> Token:
+        token = self.current
+        self.current = next(self.tokens, token)
+        return token
+
+    def expect(self, type: str) -> Token:
+        if self.current.type != type:
+            raise SyntaxError(
+                f"expected {type!r} at {self.current.pos}, got {self.current.text!r}"
+            )
+        return self.advance()
+
+    def accept(self, type: str) -> bool:
+        if self.current.type == type:
+            self.advance()
+            return True
+        return False
+
+    def prog(self) -> ASTNode:
+        expr = self.expr()
+        self.expect("EOF")
+        return expr
+
+    def statements(self) -> Iterator[ASTNode]:
+        while True:
+            while self.accept(";"):
+                pass
+            if self.current.type == "EOF":
+                return
+
+            expr = self.expr()
+            if not self.accept(";"):
+                self.expect("EOF")
+            yield expr
+
+    def expr(self, precedence: int = 0) -> ASTNode:
+        stack = [[EXPR, precedence]]
+
+        while True:
+            value = self.prefix(stack)
+            if value is None:
+                continue
+
+            # Hand the finished value to the frames waiting for it until one
+            # of them asks for another sub-expression.
+            while True:
+                frame = stack[-1]
+                kind = frame[0]
+
+                if kind == EXPR:
+                    value = self.infix(stack, frame[1], value)
+                    if value is None:
+                        break
+                    stack.pop()
+                    if not stack:
+                        return value
+                    continue
+
+                stack.pop()
+
+                if kind == BINARY:
+                    value = BinaryOperation(frame[1], frame[2], value)
+
+                elif kind == APPLY:
+                    value = Application(frame[1], value)
+
+                elif kind == LAMBDA:
+                    for param in reversed(frame[1]):
+                        value = Abstraction(param, value)
+
+                elif kind == PAREN:
+                    elements = frame[1]
+                    elements.append(value)
+                    if self.accept(","):
+                        stack.append(frame)
+                        stack.append([EXPR, 0])
+                        break
+                    self.expect(")")
+                    value = elements[0] if len(elements) == 1 else Tuple(elements)
+
+                elif kind == BRACKET:
+                    elements, is_range = frame[1], frame[2]
+                    if is_range:
+                        self.expect("]")
+                        if len(elements) == 1:
+                            value = RangeExpression(elements[0], value)
+                        else:
+                            value = RangeExpression(elements[0], value, elements[1])
+                    else:
+                        elements.append(value)
+                        if len(elements) <= 2 and self.accept(".."):
+                            frame[2] = True
+                        elif not self.accept(","):
+                            self.expect("]")
+                            value = List(elements)
+                            continue
+                        stack.append(frame)
+                        stack.append([EXPR, 0])
+                        break
+
+                elif kind == IF:
+                    frame.append(value)
+                    if len(frame) == 2:
+                        self.expect("then")
+                        precedence = 0
+                    elif len(frame) == 3:
+                        self.expect("else")
+                        precedence = IF_PRECEDENCE
+                    else:
+                        value = IfExpression(frame[1], frame[2], frame[3])
+                        continue
+                    stack.append(frame)
+                    stack.append([EXPR, precedence])
+                    break
+
+                elif kind == LET:
+                    if len(frame) == 2:
+                        frame.append(value)
+                        self.expect("in")
+                        stack.append(frame)
+                        stack.append([EXPR, LET_PRECEDENCE])
+                        break
+                    value = LetExpression(frame[1], frame[2], value)
+
+                elif kind == NOT:
+                    value = UnaryOperation("!", value)
+
+    def infix(self, stack: list, precedence: int, left: ASTNode):
+        type = self.current.type
+
+        if type in BINARY_OPERATORS:
+            op, op_precedence = BINARY_OPERATORS[type]
+            if op_precedence >= precedence:
+                self.advance()
+                stack.append([BINARY, left, op])
+                stack.append([EXPR, op_precedence + 1])
+                return None
+
+        elif type in APPLICATION_START and APPLICATION_PRECEDENCE >= precedence:
+            stack.append([APPLY, left])
+            stack.append([EXPR, APPLICATION_PRECEDENCE + 1])
+            return None
+
+        return left
+
+    # Parses the start of the expression on top of the stack. Atoms are
+    # returned directly; compound forms push a frame plus an EXPR frame for
+    # their first sub-expression and return None.
+    def prefix(self, stack: list) -> ASTNode:
+        token = self.advance()
+        type = token.type
+
+        if type == "ID":
+            if token.text in initial_environment:
+                return make_builtin(token.text)
+            return Variable(token.text)
+
+        elif type == "NUMBER":
+            return Number(float(token.text))
+
+        elif type == "BOOLEAN":
+            return Boolean(token.text.lower() == "true")
+
+        elif type == "STRING":
+            text = token.text[1:-1]
+            text = text.replace('\\"', '"').replace("\\\\", "\\")
+            return String(text)
+
+        elif type in ("λ", "\\"):
+            params = [Variable(self.expect("ID").text)]
+            while self.current.type == "ID":
+                params.append(Variable(self.advance().text))
+            self.expect(".")
+            frame = [LAMBDA, params]
+            sub_precedence = 0
+
+        elif type == "(":
+            if self.accept(")"):
+                return Tuple([])
+            frame = [PAREN, []]
+            sub_precedence = 0
+
+        elif type == "[":
+            if self.accept("]"):
+                return List([])
+            frame = [BRACKET, [], False]
+            sub_precedence = 0
+
+        elif type == "if":
+            frame = [IF]
+            sub_precedence = 0
+
+        elif type == "let":
+            var = Variable(self.expect("ID").text)
+            self.expect("=")
+            frame = [LET, var]
+            sub_precedence = 0
+
+        elif type in ("not", "!"):
+            frame = [NOT]
+            sub_precedence = NOT_PRECEDENCE
+
+        else:
+            raise SyntaxError(
+                f"unexpected {token.text or 'end of input'!r} at {token.pos}"
+            )
+
+        stack.append(frame)
+        stack.append([EXPR, sub_precedence])
+        return None
+
+
+def parse(expr: str) -> ASTNode:
+    return PrattParser(tokenize(expr)).prog()
+
+
+def parse_program(source: str) -> Iterator[ASTNode]:
+    return PrattParser(tokenize(source)).statements()
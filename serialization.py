@@ -0,0 +1,352 @@
+import io
+import struct
+
+from environment import initial_environment
+from ast_tree import (
+    ASTNode,
+    Abstraction,
+    Application,
+    Variable,
+    Number,
+    Boolean,
+    IfExpression,
+    BinaryOperation,
+    LetExpression,
+    UnaryOperation,
+    BuiltinFunction,
+    String,
+    List,
+    Tuple,
+    RangeExpression,
+)
+
+
+# Binary AST format: a header followed by nodes in prefix order. Every node
+# starts with a one-byte tag, followed by its scalar fields and then its
+# children. Names, string literals and operators go through a string table
+# that is built on the fly: a reference equal to the current table size
+# introduces a new entry (length-prefixed UTF-8), so both sides can stream.
+# All integers are unsigned LEB128 varints. The table is shared by every
+# tree written to the same stream.
+
+MAGIC = b"LAST"
+VERSION = 1
+
+VARIABLE = 1
+ABSTRACTION = 2
+APPLICATION = 3
+NUMBER = 4
+INTEGER = 5
+TRUE = 6
+FALSE = 7
+STRING = 8
+IF = 9
+BINARY = 10
+UNARY = 11
+LET = 12
+LIST = 13
+TUPLE = 14
+RANGE = 15
+RANGE_STEP = 16
+BUILTIN = 17
+
+FLOAT = struct.Struct("<d")
+CHUNK_SIZE = 64 * 1024
+
+
+class ASTEncoder:
+    def __init__(self, stream):
+        self.stream = stream
+        self.strings = {}
+        self.buffer = bytearray(MAGIC)
+        self.buffer.append(VERSION)
+
+    def write(self, node: ASTNode):
+        out = self.buffer
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            t = type(node)
+
+            if t is Variable:
+                out.append(VARIABLE)
+                self._string(node.name)
+
+            elif t is Abstraction:
+                out.append(ABSTRACTION)
+                stack.append(node.body)
+                stack.append(node.param)
+
+            elif t is Application:
+                out.append(APPLICATION)
+                stack.append(node.arg)
+                stack.append(node.func)
+
+            elif t is Number:
+                value = node.value
+                if isinstance(value, int) and not isinstance(value, bool):
+                    out.append(INTEGER)
+                    self._varint(value << 1 if value >= 0 else ((-value - 1) << 1) | 1)
+                else:
+                    out.append(NUMBER)
+                    out += FLOAT.pack(value)
+
+            elif t is Boolean:
+                out.append(TRUE if node.value else FALSE)
+
+            elif t is String:
+                out.append(STRING)
+                self._string(node.value)
+
+            elif t is IfExpression:
+                out.append(IF)
+                stack.append(node.else_expr)
+                stack.append(node.then_expr)
+                stack.append(node.condition)
+
+            elif t is BinaryOperation:
+                out.append(BINARY)
+                self._string(node.op)
+                stack.append(node.right)
+                stack.append(node.left)
+
+            elif t is UnaryOperation:
+                out.append(UNARY)
+                self._string(node.op)
+                stack.append(node.value)
+
+            elif t is LetExpression:
+                out.append(LET)
+                stack.append(node.body)
+                stack.append(node.bound_expr)
+                stack.append(node.var)
+
+            elif t is List or t is Tuple:
+                out.append(LIST if t is List else TUPLE)
+                self._varint(len(node.elements))
+                stack.extend(reversed(node.elements))
+
+            elif t is RangeExpression:
+                if node.step is not None:
+                    out.append(RANGE_STEP)
+                    stack.append(node.step)
+                else:
+                    out.append(RANGE)
+                stack.append(node.end)
+                stack.append(node.start)
+
+            elif t is BuiltinFunction:
+                out.append(BUILTIN)
+                self._string(str(node.id))
+                self._string(node.name)
+
+            else:
+                raise TypeError(f"cannot serialize {t.__name__}")
+
+            if len(out) >= CHUNK_SIZE:
+                self.flush()
+
+        self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.stream.write(bytes(self.buffer))
+            self.buffer.clear()
+
+    def _varint(self, value: int):
+        out = self.buffer
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def _string(self, value: str):
+        index = self.strings.get(value)
+        if index is not None:
+            self._varint(index)
+            return
+
+        index = len(self.strings)
+        self.strings[value] = index
+        data = value.encode("utf-8")
+        self._varint(index)
+        self._varint(len(data))
+        self.buffer += data
+
+
+# Number of children each tag waits for before the node can be built.
+ARITY = {
+    ABSTRACTION: 2,
+    APPLICATION: 2,
+    IF: 3,
+    BINARY: 2,
+    UNARY: 1,
+    LET: 3,
+    RANGE: 2,
+    RANGE_STEP: 3,
+}
+
+
+class ASTDecoder:
+    def __init__(self, stream):
+        self.stream = stream
+        self.strings = []
+        self.buffer = b""
+        self.pos = 0
+
+        header = self._bytes(len(MAGIC) + 1)
+        if header[:-1] != MAGIC:
+            raise ValueError("not a serialized AST stream")
+        if header[-1] != VERSION:
+            raise ValueError(f"unsupported AST format version {header[-1]}")
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.read()
+            except EOFError:
+                return
+
+    def read(self) -> ASTNode:
+        if self.pos >= len(self.buffer) and not self._fill(1):
+            raise EOFError("no more ASTs in stream")
+
+        # Each frame is [tag, scalar, children, expected number of children].
+        stack = []
+
+        while True:
+            tag = self._byte()
+            node = None
+
+            if tag == VARIABLE:
+                node = Variable(self._string())
+            elif tag == NUMBER:
+                node = Number(FLOAT.unpack(self._bytes(8))[0])
+            elif tag == INTEGER:
+                value = self._varint()
+                node = Number(-(value >> 1) - 1 if value & 1 else value >> 1)
+            elif tag == TRUE:
+                node = Boolean(True)
+            elif tag == FALSE:
+                node = Boolean(False)
+            elif tag == STRING:
+                node = String(self._string())
+            elif tag == BUILTIN:
+                id = self._string()
+                name = self._string()
+                if name not in initial_environment:
+                    raise ValueError(f"unknown builtin {name!r}")
+                node = BuiltinFunction(id, name, initial_environment[name])
+            elif tag == LIST or tag == TUPLE:
+                count = self._varint()
+                if count == 0:
+                    node = List([]) if tag == LIST else Tuple([])
+                else:
+                    stack.append([tag, None, [], count])
+            elif tag == BINARY or tag == UNARY:
+                stack.append([tag, self._string(), [], ARITY[tag]])
+            elif tag in ARITY:
+                stack.append([tag, None, [], ARITY[tag]])
+            else:
+                raise ValueError(f"unknown AST tag {tag}")
+
+            if node is None:
+                continue
+
+            while stack:
+                frame = stack[-1]
+                children = frame[2]
+                children.append(node)
+                if len(children) < frame[3]:
+                    break
+                stack.pop()
+                node = self._build(frame[0], frame[1], children)
+            else:
+                return node
+
+    def _build(self, tag, scalar, children) -> ASTNode:
+        if tag == ABSTRACTION:
+            return Abstraction(*children)
+        elif tag == APPLICATION:
+            return Application(*children)
+        elif tag == IF:
+            return IfExpression(*children)
+        elif tag == BINARY:
+            return BinaryOperation(children[0], scalar, children[1])
+        elif tag == UNARY:
+            return UnaryOperation(scalar, children[0])
+        elif tag == LET:
+            return LetExpression(*children)
+        elif tag == LIST:
+            return List(children)
+        elif tag == TUPLE:
+            return Tuple(children)
+        elif tag == RANGE:
+            return RangeExpression(children[0], children[1])
+        elif tag == RANGE_STEP:
+            return RangeExpression(children[0], children[1], children[2])
+
+    def _fill(self, size: int) -> bool:
+        buffer = self.buffer[self.pos :]
+        while len(buffer) < size:
+            chunk = self.stream.read(max(CHUNK_SIZE, size - len(buffer)))
+            if not chunk:
+                self.buffer, self.pos = buffer, 0
+                return False
+            buffer += chunk
+        self.buffer, self.pos = buffer, 0
+        return True
+
+    def _byte(self) -> int:
+        if self.pos >= len(self.buffer) and not self._fill(1):
+            raise ValueError("truncated AST stream")
+        value = self.buffer[self.pos]
+        self.pos += 1
+        return value
+
+    def _bytes(self, size: int) -> bytes:
+        if self.pos + size > len(self.buffer) and not self._fill(size):
+            raise ValueError("truncated AST stream")
+        value = self.buffer[self.pos : self.pos + size]
+        self.pos += size
+        return value
+
+    def _varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self._byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def _string(self) -> str:
+        index = self._varint()
+        if index < len(self.strings):
+            return self.strings[index]
+        if index != len(self.strings):
+            raise ValueError(f"invalid string table reference {index}")
+
+        value = self._bytes(self._varint()).decode("utf-8")
+        self.strings.append(value)
+        return value
+
+
+def dump(node: ASTNode, stream):
+    ASTEncoder(stream).write(node)
+
+
+def dumps(node: ASTNode) -> bytes:
+    stream = io.BytesIO()
+    dump(node, stream)
+    return stream.getvalue()
+
+
+def load(stream) -> ASTNode:
+    return ASTDecoder(stream).read()
+
+
+def loads(data: bytes) -> ASTNode:
+    return load(io.BytesIO(data))
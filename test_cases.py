@@ -1,4 +1,18 @@
-from evaluate import evaluate_lambda_expr
+import io
+
+from evaluate import (
+    compile_cache,
+    evaluate_lambda_expr,
+    evaluate_program,
+    lambda_expr_to_ast,
+    program_to_asts,
+)
+from parse_cache import ParseCache, estimate_memory
+from serialization import dumps, loads
+from hashcons import HashConsStore, tree_size
+from ast_tree import ASTNode, Application, Variable, copy_ast, format_ast, write_ast
+from budget import BudgetExceeded
+from tracing import Tracer
 
 
 def run_tests(test_cases):
@@ -23,6 +37,711 @@ def run_tests(test_cases):
     )
 
 
+def run_parser_parity(test_cases, parsers=("ll", "pratt")):
+    passed = 0
+    total = len(test_cases) * len(parsers)
+    for test in test_cases:
+        for parser in parsers:
+            try:
+                expected = lambda_expr_to_ast(
+                    test["expression"], use_cache=False, parser="antlr"
+                )
+                result = lambda_expr_to_ast(
+                    test["expression"], use_cache=False, parser=parser
+                )
+                if str(result) == str(expected):
+                    print(f"✅ {test['name']} - {parser} PARSER PARITY")
+                    passed += 1
+                else:
+                    print(f"❌ {test['name']} - {parser} PARSER MISMATCH")
+                    print(f"   Expression: {test['expression']}")
+                    print(f"   antlr:      {expected}")
+                    print(f"   {parser + ':':<12}{result}")
+            except Exception as e:
+                print(f"💥 {test['name']} - CRASHED with exception: {str(e)}")
+                print(f"   Expression: {test['expression']}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+def run_serialization_round_trip(test_cases):
+    passed = 0
+    total = len(test_cases)
+    for test in test_cases:
+        try:
+            ast = lambda_expr_to_ast(test["expression"], use_cache=False)
+            data = dumps(ast)
+            result = loads(data)
+            if str(result) == str(ast) and dumps(result) == data:
+                print(f"✅ {test['name']} - ROUND TRIP ({len(data)} bytes)")
+                passed += 1
+            else:
+                print(f"❌ {test['name']} - ROUND TRIP MISMATCH")
+                print(f"   Expression: {test['expression']}")
+                print(f"   Before:     {ast}")
+                print(f"   After:      {result}")
+        except Exception as e:
+            print(f"💥 {test['name']} - CRASHED with exception: {str(e)}")
+            print(f"   Expression: {test['expression']}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+def run_program_parsing(test_cases, parsers=("antlr", "ll", "pratt")):
+    source = ";\n".join(test["expression"] for test in test_cases) + ";"
+    expected = [
+        str(lambda_expr_to_ast(test["expression"], False))
+        for test in test_cases
+    ]
+    passed = 0
+    for parser in parsers:
+        try:
+            result = [str(ast) for ast in program_to_asts(source, parser=parser)]
+            if result == expected:
+                print(f"✅ {len(result)} statements - {parser} PROGRAM")
+                passed += 1
+            else:
+                print(f"❌ {parser} PROGRAM MISMATCH")
+                for test, want, got in zip(test_cases, expected, result):
+                    if want != got:
+                        print(f"   Expression: {test['expression']}")
+                        print(f"   Expected:   {want}")
+                        print(f"   Got:        {got}")
+                        break
+                else:
+                    print(f"   Expected {len(expected)} statements, got {len(result)}")
+        except Exception as e:
+            print(f"💥 {parser} PROGRAM - CRASHED with exception: {str(e)}")
+
+    # A malformed statement must fail on its own instead of swallowing the
+    # ';' and merging with the next statement.
+    malformed = "1 + ; 2 3; 5"
+    for parser in parsers:
+        try:
+            result = [str(ast) for ast in program_to_asts(malformed, parser=parser)]
+            print(f"❌ {parser} MALFORMED PROGRAM - parsed as {result}")
+        except SyntaxError:
+            print(f"✅ {parser} MALFORMED PROGRAM - SyntaxError")
+            passed += 1
+        except Exception as e:
+            print(f"💥 {parser} MALFORMED PROGRAM - CRASHED with exception: {str(e)}")
+
+    total = 2 * len(parsers)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# Program files are read a block at a time; a tiny block size makes the cuts
+# fall inside statements and string literals.
+def run_program_files(test_cases):
+    import os
+    import tempfile
+    import evaluate
+    from serialization import ASTEncoder
+
+    source = ";\n".join(test["expression"] for test in test_cases) + ";"
+    expected = [str(ast) for ast in program_to_asts(source)]
+    directory = tempfile.mkdtemp()
+    text_path = os.path.join(directory, "program.lam")
+    binary_path = os.path.join(directory, "program.bin")
+    with open(text_path, "w", encoding="utf-8") as file:
+        file.write(source)
+    with open(binary_path, "wb") as file:
+        encoder = ASTEncoder(file)
+        for ast in program_to_asts(source):
+            encoder.write(ast)
+
+    read_size = evaluate.READ_SIZE
+    checks = [
+        ("Text file, blocks of 7", text_path, 7),
+        ("Text file", text_path, read_size),
+        ("Binary file", binary_path, read_size),
+    ]
+    passed = 0
+    for name, path, size in checks:
+        evaluate.READ_SIZE = size
+        try:
+            result = [str(ast) for ast in evaluate.program_file_to_asts(path)]
+            if result == expected:
+                print(f"✅ {name} - {len(result)} STATEMENTS")
+                passed += 1
+            else:
+                print(f"❌ {name} - MISMATCH")
+        except Exception as e:
+            print(f"💥 {name} - CRASHED with exception: {str(e)}")
+        finally:
+            evaluate.READ_SIZE = read_size
+
+    for path in (text_path, binary_path):
+        os.remove(path)
+    os.rmdir(directory)
+    total = len(checks)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# The default ANTLR front-end predicts with SLL and only reruns full LL, the
+# stage that makes full-context predictions, when SLL fails. Valid input never
+# needs it.
+def run_sll_prediction(test_cases):
+    from antlr_parser import ll_fallbacks
+
+    source = ";\n".join(test["expression"] for test in test_cases) + ";"
+    checks = [
+        (
+            "Expressions",
+            lambda: [
+                lambda_expr_to_ast(test["expression"], use_cache=False)
+                for test in test_cases
+            ],
+        ),
+        ("Program", lambda: list(program_to_asts(source))),
+    ]
+    passed = 0
+    for name, parse in checks:
+        try:
+            before = ll_fallbacks()
+            parse()
+            fallbacks = ll_fallbacks() - before
+            if fallbacks == 0:
+                print(f"✅ {name} - NO FULL-CONTEXT PREDICTIONS")
+                passed += 1
+            else:
+                print(f"❌ {name} - {fallbacks} LL FALLBACKS")
+        except Exception as e:
+            print(f"💥 {name} - CRASHED with exception: {str(e)}")
+
+    total = len(checks)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+def run_parse_cache():
+    def parse(expr):
+        return lambda_expr_to_ast(expr, use_cache=False, parser="pratt")
+
+    checks = []
+    cache = ParseCache(max_entries=2)
+    first = cache.get_or_parse("a b", parse)
+    checks.append(("Repeated lookup hits", cache.get_or_parse("a b", parse) is first))
+    checks.append(("Hits and misses counted", cache.stats()[:2] == (1, 1)))
+
+    # "a b" is used again before "c" comes in, so "x" is the least recent.
+    cache.get_or_parse("x", parse)
+    cache.get("a b")
+    cache.get_or_parse("c", parse)
+    checks.append(
+        (
+            "Least recently used evicted",
+            "x" not in cache and "a b" in cache and cache.stats().evictions == 1,
+        )
+    )
+
+    cache.resize(max_entries=1)
+    checks.append(("Resize evicts to the bound", "c" in cache and len(cache) == 1))
+
+    stats = cache.stats()
+    checks.append(
+        (
+            "Memory is the estimate of the entries",
+            stats.entries == 1 and stats.memory == estimate_memory(parse("c")),
+        )
+    )
+
+    cache.resize(max_entries=10, max_memory=stats.memory - 1)
+    checks.append(
+        ("Memory bound evicts", cache.stats()[2:] == (stats.evictions + 1, 0, 0))
+    )
+
+    cache.put("too big", parse(r"\x. x x x x"))
+    checks.append(("Tree over the memory bound not kept", len(cache) == 0))
+
+    passed = 0
+    for name, ok in checks:
+        if ok:
+            print(f"✅ {name} - PARSE CACHE")
+            passed += 1
+        else:
+            print(f"❌ {name} - PARSE CACHE MISMATCH")
+            print(f"   Stats:      {cache.stats()}")
+
+    print(f"\nTotal: {len(checks)}, Passed: {passed}, Failed: {len(checks) - passed}")
+
+
+# ANTLR recovers from this input (reporting the errors) while Pratt raises;
+# a cached ANTLR tree must not answer for the Pratt front-end.
+def run_cache_per_parser(expression="(1 + ) 2"):
+    passed = 0
+    try:
+        lambda_expr_to_ast(expression)
+        result = lambda_expr_to_ast(expression, parser="pratt")
+        print(f"❌ {expression} - pratt got the cached tree {result}")
+    except SyntaxError:
+        print(f"✅ {expression} - pratt RAISED AFTER CACHED antlr PARSE")
+        passed += 1
+    except Exception as e:
+        print(f"💥 {expression} - CRASHED with exception: {str(e)}")
+
+    print(f"\nTotal: 1, Passed: {passed}, Failed: {1 - passed}")
+
+
+# Nesting deeper than the recursion limit, evaluated through the Pratt
+# front-end.
+# Through the default entry points, the ones the REPL and program files use.
+def run_deep_nesting(depth=5000):
+    from main import parse_args
+
+    expression = "(" * depth + r"(\x. x) 1" + ")" * depth
+    _, _, parser = parse_args([])
+    checks = [
+        ("Expression", lambda: evaluate_lambda_expr(expression)),
+        ("Program", lambda: next(evaluate_program(expression + ";"))),
+        ("REPL", lambda: evaluate_lambda_expr(expression, parser=parser)),
+    ]
+    passed = 0
+    for name, evaluate in checks:
+        try:
+            result = evaluate()
+            if str(result) == "1.0":
+                print(f"✅ {name}, {depth} nested parentheses - EVALUATED")
+                passed += 1
+            else:
+                print(f"❌ {name}, {depth} nested parentheses - got {result}")
+        except Exception as e:
+            print(
+                f"💥 {name}, {depth} nested parentheses - CRASHED with exception: "
+                f"{str(e)}"
+            )
+
+    total = len(checks)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# Bad option values are usage errors (exit status 2), not tracebacks.
+def run_command_line():
+    import contextlib
+    from main import parse_args
+
+    checks = [
+        ("Unknown trace level", ["--trace", "loud"]),
+        ("Unknown parser", ["--parser", "yacc"]),
+    ]
+    passed = 0
+    for name, args in checks:
+        try:
+            with contextlib.redirect_stderr(io.StringIO()) as err:
+                parse_args(args)
+            print(f"❌ {name} - ACCEPTED")
+        except SystemExit as e:
+            if e.code == 2 and "invalid choice" in err.getvalue():
+                print(f"✅ {name} - USAGE ERROR")
+                passed += 1
+            else:
+                print(f"❌ {name} - exited with {e.code}")
+        except Exception as e:
+            print(f"💥 {name} - CRASHED with exception: {str(e)}")
+
+    _, observer, parser = parse_args(["--trace", "counts", "--parser", "antlr"])
+    if isinstance(observer, Tracer) and parser == "antlr":
+        print("✅ Valid options - ACCEPTED")
+        passed += 1
+    else:
+        print(f"❌ Valid options - got {observer!r}, {parser!r}")
+
+    total = len(checks) + 1
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# Names invented while renaming leave the symbol table with the last term that
+# uses them.
+def run_symbol_lifetime():
+    import gc
+    from ast_tree import symbols
+
+    passed = 0
+    try:
+        result = evaluate_lambda_expr(r"(\zq. \wq. zq) wq")
+        if str(result) == "(\\wq1.wq)" and "wq1" in symbols.symbols:
+            print("✅ Renamed binder - INTERNED")
+            passed += 1
+        else:
+            print(f"❌ Renamed binder - got {result}")
+        del result
+        gc.collect()
+        if "wq1" not in symbols.symbols:
+            print("✅ Renamed binder - DROPPED")
+            passed += 1
+        else:
+            print("❌ Renamed binder - still interned")
+    except Exception as e:
+        print(f"💥 Renamed binder - CRASHED with exception: {str(e)}")
+
+    print(f"\nTotal: 2, Passed: {passed}, Failed: {2 - passed}")
+
+
+def run_hash_consing(test_cases):
+    store = HashConsStore()
+    passed = 0
+    total = len(test_cases)
+    for test in test_cases:
+        try:
+            ast = lambda_expr_to_ast(test["expression"], use_cache=False)
+            interned = store.intern(ast)
+            if (
+                store.intern(copy_ast(ast)) is interned
+                and str(interned) == str(ast)
+                and interned._size == tree_size(ast)
+            ):
+                print(f"✅ {test['name']} - HASH CONSED")
+                passed += 1
+            else:
+                print(f"❌ {test['name']} - HASH CONSING MISMATCH")
+                print(f"   Expression: {test['expression']}")
+                print(f"   Before:     {ast}")
+                print(f"   After:      {interned}")
+        except Exception as e:
+            print(f"💥 {test['name']} - CRASHED with exception: {str(e)}")
+            print(f"   Expression: {test['expression']}")
+
+    # The table holds its nodes weakly, so dropping the last reference to an
+    # interned tree evicts it.
+    total += 1
+    store = HashConsStore()
+    interned = store.intern(lambda_expr_to_ast(r"\x. x (x y)", use_cache=False))
+    held = len(store)
+    del interned
+    if held == 5 and len(store) == 0:
+        print("✅ Dropped tree - EVICTED")
+        passed += 1
+    else:
+        print(f"❌ Dropped tree - {held} entries held, {len(store)} left")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+class ChunkSink:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+
+
+def run_printing(test_cases, max_length=20):
+    passed = 0
+    total = len(test_cases) + 1
+    for test in test_cases:
+        try:
+            ast = lambda_expr_to_ast(test["expression"], use_cache=False)
+            full = str(ast)
+            sink = ChunkSink()
+            write_ast(ast, sink)
+            short = format_ast(ast, max_length=max_length)
+            if "".join(sink.chunks) == full and (
+                short == full
+                if len(full) <= max_length
+                else short == full[:max_length] + "..."
+            ):
+                print(f"✅ {test['name']} - PRINTED")
+                passed += 1
+            else:
+                print(f"❌ {test['name']} - PRINTING MISMATCH")
+                print(f"   Expression: {test['expression']}")
+                print(f"   str:        {full}")
+                print(f"   Truncated:  {short}")
+        except Exception as e:
+            print(f"💥 {test['name']} - CRASHED with exception: {str(e)}")
+            print(f"   Expression: {test['expression']}")
+
+    # Far deeper than the recursion limit.
+    depth = 100000
+    deep = Variable("x")
+    for _ in range(depth):
+        deep = Application(Variable("f"), deep)
+    try:
+        text = str(deep)
+        if len(text) == 4 * depth + 1 and format_ast(deep, max_depth=2) == "(f (f ...))":
+            print(f"✅ {depth} nested applications - PRINTED")
+            passed += 1
+        else:
+            print(f"❌ {depth} nested applications - PRINTING MISMATCH")
+    except Exception as e:
+        print(f"💥 {depth} nested applications - CRASHED with exception: {str(e)}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# A crash counts as an outcome, so strategies that fail the same way still
+# agree.
+def reduction_outcome(expression, strategy):
+    try:
+        result = evaluate_lambda_expr(expression, strategy=strategy)
+    except Exception as e:
+        return f"{type(e).__name__} raised"
+    if not isinstance(result, ASTNode):
+        # Builtin results that aren't trees are compared by their items
+        return f"{type(result).__name__}({', '.join(map(str, result))})"
+    return str(result)
+
+
+# The abstract machines can't stop halfway like the rewriting strategies do
+# after 1000 steps, so these run out of steps instead. Call by value also
+# evaluates the arguments the other strategies discard or unfold lazily.
+MACHINE_DIVERGENT = {
+    "cek": {"Y-combinator", "Normal order reduction", "factorial"},
+    "cbn": {"Y-combinator"},
+    "need": {"Y-combinator"},
+    "optimal": {"Y-combinator"},
+    "compiled": {"Y-combinator", "Normal order reduction", "factorial"},
+}
+
+
+def run_strategy_parity(
+    test_cases,
+    pairs=(
+        ("nor", "nor_db"),
+        ("aor", "aor_db"),
+        ("aor", "cek"),
+        ("nor", "cbn"),
+        ("nor", "need"),
+        ("aor", "compiled"),
+    ),
+):
+    passed = 0
+    total = len(test_cases) * len(pairs)
+    for test in test_cases:
+        for reference, strategy in pairs:
+            if test["name"] in MACHINE_DIVERGENT.get(strategy, ()):
+                expected = "BudgetExceeded raised"
+            else:
+                expected = reduction_outcome(test["expression"], reference)
+            result = reduction_outcome(test["expression"], strategy)
+            if result == expected:
+                print(f"✅ {test['name']} - {strategy} STRATEGY PARITY")
+                passed += 1
+            else:
+                print(f"❌ {test['name']} - {strategy} STRATEGY MISMATCH")
+                print(f"   Expression: {test['expression']}")
+                print(f"   {reference + ':':<12}{expected}")
+                print(f"   {strategy + ':':<12}{result}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# The same reduction traced three ways: every step written to a file, only
+# counted, and the last few kept unrendered in a ring buffer.
+def run_tracing(test_cases, capacity=3):
+    passed = 0
+    total = len(test_cases)
+    for test in test_cases:
+        try:
+            file = io.StringIO()
+            counts = Tracer("counts")
+            ring = Tracer("full", capacity=capacity)
+            for observer in (Tracer("full", file=file), counts, ring):
+                evaluate_lambda_expr(test["expression"], observer=observer)
+
+            lines = file.getvalue().splitlines()
+            unrendered = all(event._text is None for event in ring.events)
+            if (
+                lines
+                and sum(counts.counts.values()) == len(lines)
+                and unrendered
+                and ring.lines() == lines[-capacity:]
+            ):
+                print(f"✅ {test['name']} - TRACED")
+                passed += 1
+            else:
+                print(f"❌ {test['name']} - TRACE MISMATCH")
+                print(f"   Expression: {test['expression']}")
+        except Exception as e:
+            print(f"💥 {test['name']} - CRASHED with exception: {str(e)}")
+            print(f"   Expression: {test['expression']}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+def run_weak_head(strategy="cbn_whnf"):
+    weak_head_cases = [
+        {
+            "name": "Y-combinator unfolds once",
+            "expression": r"(\f. (\x. f (x x)) (\x. f (x x))) g",
+            "expected": r"(g ((\x.(g (x x))) (\x.(g (x x)))))",
+        },
+        {
+            "name": "List elements are left alone",
+            "expression": "[1 + 1, 2]",
+            "expected": "[(1.0 + 1.0), 2.0]",
+        },
+        {
+            "name": "No reduction under a lambda",
+            "expression": r"(\x. \y. x) ((\z. z) 1)",
+            "expected": r"(\y.((\z.z) 1.0))",
+        },
+        {
+            "name": "Unused argument is never evaluated",
+            "expression": r"(\x. 1) ((\x. x x) (\x. x x))",
+            "expected": "1.0",
+        },
+    ]
+    passed = 0
+    for test in weak_head_cases:
+        result = reduction_outcome(test["expression"], strategy)
+        if result == test["expected"]:
+            print(f"✅ {test['name']} - WEAK HEAD NORMAL FORM")
+            passed += 1
+        else:
+            print(f"❌ {test['name']} - FAILED")
+            print(f"   Expected:   {test['expected']}")
+            print(f"   Got:        {result}")
+
+    total = len(weak_head_cases)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# Call by need gives the results of call by name, but evaluates a shared
+# argument or let binding only once, so it takes fewer steps.
+def run_sharing(reference="cbn", strategy="need"):
+    sharing_cases = [
+        ("Argument used three times", r"(\x. x + x + x) ((\y. y * 2) 21)"),
+        ("Let binding used twice", r"let x = (\y. y * 3) 2 in (x + x)"),
+        ("Shared argument under a lambda", r"(\x. \z. x + x) ((\y. y) 1)"),
+    ]
+    passed = 0
+    for name, expression in sharing_cases:
+        outcomes = []
+        for s in (reference, strategy):
+            tracer = Tracer("counts")
+            result = str(evaluate_lambda_expr(expression, strategy=s, observer=tracer))
+            outcomes.append((result, sum(tracer.counts.values())))
+        (expected, steps), (result, shared_steps) = outcomes
+        if result == expected and shared_steps < steps:
+            print(f"✅ {name} - SHARED ({shared_steps} steps, {steps} without)")
+            passed += 1
+        else:
+            print(f"❌ {name} - NOT SHARED")
+            print(f"   {reference + ':':<12}{expected} in {steps} steps")
+            print(f"   {strategy + ':':<12}{result} in {shared_steps} steps")
+
+    total = len(sharing_cases)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# Evaluating the same source again finds its tree in the parse cache and the
+# program compiled from it in the compile cache.
+def run_compile_cache(strategy="compiled"):
+    cached_cases = [
+        ("Arithmetic", r"(\x. x * x + 1) 6"),
+        ("Recursion through a let", r"let f = \n. if n == 0 then 0 else n in f 3"),
+        ("Open term", r"\y. (\x. x y) (\z. z)"),
+    ]
+    passed = 0
+    for name, expression in cached_cases:
+        first = reduction_outcome(expression, strategy)
+        hits = compile_cache.stats()[0]
+        second = reduction_outcome(expression, strategy)
+        reused = compile_cache.stats()[0] == hits + 1
+        if first == second and reused:
+            print(f"✅ {name} - PROGRAM REUSED")
+            passed += 1
+        else:
+            print(f"❌ {name} - PROGRAM NOT REUSED")
+            print(f"   {'first:':<12}{first}")
+            print(f"   {'second:':<12}{second} ({'hit' if reused else 'miss'})")
+
+    total = len(cached_cases)
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+def church_numeral(n):
+    return r"(\f. \x. " + "f (" * n + "x" + ")" * n + ")"
+
+
+# The interaction net reducer only takes pure lambda terms, which it should
+# reduce like NOR; the others are skipped.
+def run_optimal(test_cases, reference="nor_db", strategy="optimal"):
+    two, three, four = church_numeral(2), church_numeral(3), church_numeral(4)
+    church_cases = [
+        {"name": "Church 2 ^ 3", "expression": f"{three} {two}"},
+        {"name": "Church 2 ^ 2 ^ 2", "expression": f"{two} {two} {two}"},
+        {
+            "name": "Church 3 * 4",
+            "expression": rf"(\m. \n. \f. m (n f)) {three} {four}",
+        },
+        {
+            "name": "Church predecessor of 3",
+            "expression": rf"(\n. \f. \x. n (\g. \h. h (g f)) (\u. x) (\u. u)) {three}",
+        },
+        {
+            "name": "Church 2 ^ 16 applied to identity",
+            "expression": rf"{four} {two} (\x. x) a",
+        },
+    ]
+    passed = 0
+    total = 0
+    for test in test_cases + church_cases:
+        result = reduction_outcome(test["expression"], strategy)
+        if result == "TypeError raised":
+            continue
+        total += 1
+        if test["name"] in MACHINE_DIVERGENT[strategy]:
+            expected = "BudgetExceeded raised"
+        else:
+            expected = reduction_outcome(test["expression"], reference)
+        if result == expected:
+            print(f"✅ {test['name']} - OPTIMAL REDUCTION")
+            passed += 1
+        else:
+            print(f"❌ {test['name']} - OPTIMAL REDUCTION MISMATCH")
+            print(f"   Expression: {test['expression']}")
+            print(f"   {reference + ':':<12}{expected}")
+            print(f"   {strategy + ':':<12}{result}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
+# Programs that never finish, with the limit each one should run into.
+def run_budgets(
+    strategies=("nor", "aor", "nor_db", "aor_db", "cek", "cbn", "need", "compiled"),
+):
+    # "compiled" counts max_nodes as call depth (see budget.py), and growing
+    # omega runs out of Python stack before it is 500 calls deep.
+    growing = r"(\x. x x x) (\x. x x x)"
+    compiled = tuple(s for s in strategies if s == "compiled")
+    uncompiled = tuple(s for s in strategies if s != "compiled")
+    budgets = [
+        ("Omega", r"(\x. x x) (\x. x x)", {"fuel": 50}, "fuel"),
+        ("Omega", r"(\x. x x) (\x. x x)", {"fuel": 10**6, "timeout": 0.05}, "deadline"),
+        ("Omega, only nodes", r"(\x. x x) (\x. x x)", {"max_nodes": 500}, "fuel"),
+        ("Omega, only timeout", r"(\x. x x) (\x. x x)", {"timeout": 60}, "fuel"),
+        ("Growing omega", growing, {"max_nodes": 500}, "nodes", uncompiled),
+        ("Growing omega", growing, {"max_nodes": 200}, "nodes", compiled),
+        ("Omega in a list", r"map (\y. (\x. x x) (\x. x x)) [1]", {"fuel": 50}, "fuel"),
+        ("Within budget", r"(\x. x + 1) 2", {"fuel": 2, "max_nodes": 5}, None),
+    ]
+    passed = 0
+    total = 0
+    for name, expression, limits, expected, *only in budgets:
+        for strategy in only[0] if only else strategies:
+            total += 1
+            try:
+                result = evaluate_lambda_expr(expression, strategy=strategy, **limits)
+                outcome = None
+            except BudgetExceeded as e:
+                result = e.term
+                outcome = e.limit
+            except Exception as e:
+                print(f"💥 {name} - {strategy} CRASHED with exception: {str(e)}")
+                continue
+
+            if outcome == expected:
+                print(f"✅ {name} - {strategy} STOPPED BY {outcome or 'NOTHING'}")
+                passed += 1
+            else:
+                print(f"❌ {name} - {strategy} BUDGET MISMATCH")
+                print(f"   Expected:   {expected}")
+                print(f"   Got:        {outcome} at {result}")
+
+    print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
+
+
 def main():
     test_cases = [
         {"name": "Identity function", "expression": r"((\x.x) a)", "expected": "a"},
@@ -480,6 +1199,76 @@ def main():
 
     run_tests(real_cases)
 
+    trailing_operand_test_cases = [
+        {
+            "name": "Lambda as last argument",
+            "expression": r"f \x. x",
+            "expected": r"(f (\x.x))",
+        },
+        {
+            "name": "Lambda as right operand",
+            "expression": r"1 + \x. x",
+            "expected": r"(1.0 + (\x.x))",
+        },
+        {
+            "name": "Not as right operand",
+            "expression": "a == not b",
+            "expected": "(a == (! (b)))",
+        },
+        {
+            "name": "Lambda applied to a list",
+            "expression": r"[] \x y. 2.5",
+            "expected": r"([] (\x.(\y.2.5)))",
+        },
+        {
+            "name": "Lambda argument with operator body",
+            "expression": r"(\f. f 1) \x. x + 1",
+            "expected": "2.0",
+        },
+    ]
+
+    run_tests(trailing_operand_test_cases)
+
+    all_test_cases = (
+        test_cases
+        + math_test_cases
+        + if_test_cases
+        + let_test_cases
+        + string_test_cases
+        + list_test_cases
+        + tuple_test_cases
+        + range_test_cases
+        + list_tuple_range_mix_test_cases
+        + map_fold_filter_tests
+        + real_cases
+        + trailing_operand_test_cases
+    )
+
+    run_parser_parity(all_test_cases)
+    run_serialization_round_trip(all_test_cases)
+    run_program_parsing(all_test_cases)
+    run_program_files(all_test_cases)
+    run_sll_prediction(all_test_cases)
+    run_parse_cache()
+    run_cache_per_parser()
+    run_deep_nesting()
+    run_command_line()
+    run_hash_consing(all_test_cases)
+    run_symbol_lifetime()
+    # Builtins may return plain Python values instead of terms.
+    builtin_result_cases = [
+        {"name": "Expand to an iterator", "expression": "expand [1..3]"},
+    ]
+
+    run_strategy_parity(all_test_cases + builtin_result_cases)
+    run_printing(all_test_cases)
+    run_tracing(all_test_cases)
+    run_budgets()
+    run_weak_head()
+    run_sharing()
+    run_optimal(all_test_cases)
+    run_compile_cache()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,80 @@
+import collections
+import sys
+
+
+# One reduction step as seen by an observer. The term is only rendered when
+# something reads .text (or prints the event), and the text is kept once it
+# has been built. Terms are never modified, so an event can be rendered long
+# after the reduction has moved on.
+class StepEvent:
+    __slots__ = ("strategy", "step", "term", "_render", "_text")
+
+    def __init__(self, strategy: str, step: int, term, render=str):
+        self.strategy = strategy
+        self.step = step
+        self.term = term
+        self._render = render
+        self._text = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._render(self.term)
+        return self._text
+
+    def __str__(self):
+        return f"{self.strategy} step {self.step}: {self.text}"
+
+    def __repr__(self):
+        return f"StepEvent({self.strategy!r}, {self.step})"
+
+
+TRACE_LEVELS = ("off", "counts", "sampled", "full")
+
+
+# A ready-made observer. The reduction loops accept any callable taking a
+# StepEvent; this one covers the usual cases:
+#
+#   off      ignore every step
+#   counts   only count steps per strategy (see .counts), nothing is rendered
+#   sampled  record every `every`-th step seen, counting the steps of
+#            nested reductions (builtin arguments, list elements) too
+#   full     record every step
+#
+# Recorded steps go to `file` as "NOR step 3: ..." lines, or, given a
+# `capacity`, into a ring buffer (.events) holding the last `capacity`
+# events, still unrendered. Without either they are printed to stdout.
+class Tracer:
+    def __init__(self, level="full", file=None, capacity=None, every=100):
+        if level not in TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level: {level}")
+        if every < 1:
+            raise ValueError("every must be positive")
+
+        self.level = level
+        self.file = file
+        self.every = every
+        self.counts = collections.Counter()
+        self.total = 0
+        self.events = collections.deque(maxlen=capacity) if capacity else None
+
+    def __call__(self, event: StepEvent):
+        level = self.level
+        if level == "off":
+            return
+
+        self.counts[event.strategy] += 1
+        self.total += 1
+        if level == "counts":
+            return
+        if level == "sampled" and (self.total - 1) % self.every:
+            return
+
+        if self.events is not None:
+            self.events.append(event)
+        else:
+            file = self.file if self.file is not None else sys.stdout
+            file.write(f"{event}\n")
+
+    def lines(self) -> list[str]:
+        return [str(event) for event in self.events or ()]
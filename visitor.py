@@ -1,7 +1,7 @@
-import inspect
-import uuid
+from antlr4 import ParserRuleContext
+
 from LambdaVisitor import LambdaVisitor
-from environment import initial_environment
+from environment import initial_environment, make_builtin
 from ast_tree import (
     Abstraction,
     Application,
@@ -12,7 +12,6 @@ from ast_tree import (
     BinaryOperation,
     LetExpression,
     UnaryOperation,
-    BuiltinFunction,
     String,
     List,
     Tuple,
@@ -24,13 +23,68 @@ class CustomVisitor(LambdaVisitor):
     def visitProg(self, ctx):
         return self.visit(ctx.expr())
 
+    def visitProgram(self, ctx):
+        return [self.visit(statement) for statement in ctx.statement()]
+
+    def visitStatement(self, ctx):
+        return self.visit(ctx.expr())
+
+    def visitOperatorExpr(self, ctx):
+        return self.visit(ctx.orExpr())
+
+    def visitOrExpr(self, ctx):
+        operands = self._operands(ctx)
+        return self._fold_left(operands, ["||"] * (len(operands) - 1))
+
+    def visitAndExpr(self, ctx):
+        operands = self._operands(ctx)
+        return self._fold_left(operands, ["&&"] * (len(operands) - 1))
+
+    def visitUnaryExpr(self, ctx):
+        return self.visit(ctx.getChild(0))
+
+    def visitNotExpr(self, ctx):
+        return UnaryOperation("!", self.visit(ctx.getChild(1)))
+
+    def visitComparisonExpr(self, ctx):
+        return self._fold_left(self._operands(ctx), [op.text for op in ctx.ops])
+
+    def visitAddSubExpr(self, ctx):
+        return self._fold_left(self._operands(ctx), [op.text for op in ctx.ops])
+
+    def visitMulDivExpr(self, ctx):
+        return self._fold_left(self._operands(ctx), [op.text for op in ctx.ops])
+
+    # Operands of a layer in order; the last one may be a trailing operand.
+    def _operands(self, ctx):
+        operands = []
+        for child in ctx.getChildren():
+            if isinstance(child, ParserRuleContext):
+                operands.append(self.visit(child))
+        return operands
+
+    def _fold_left(self, operands, ops):
+        result = operands[0]
+        for op, right in zip(ops, operands[1:]):
+            result = BinaryOperation(result, op, right)
+        return result
+
     def visitApplicationExpr(self, ctx):
-        return Application(self.visit(ctx.expr(0)), self.visit(ctx.expr(1)))
+        result = None
+        for child in ctx.getChildren():
+            operand = self.visit(child)
+            result = operand if result is None else Application(result, operand)
+        return result
 
     def visitAbstractionExpr(self, ctx):
-        abstraction_ctx = ctx.abstraction()
-        params = [Variable(id.getText()) for id in abstraction_ctx.ID()]
-        body = self.visit(abstraction_ctx.expr())
+        return self.visitAbstraction(ctx.abstraction())
+
+    def visitTrailing(self, ctx):
+        return self.visit(ctx.getChild(0))
+
+    def visitAbstraction(self, ctx):
+        params = [Variable(id.getText()) for id in ctx.ID()]
+        body = self.visit(ctx.expr())
 
         for param in reversed(params):
             body = Abstraction(param, body)
@@ -38,7 +92,10 @@ class CustomVisitor(LambdaVisitor):
         return body
 
     def visitParenExpr(self, ctx):
-        return self.visit(ctx.expr())
+        elements = [self.visit(expr) for expr in ctx.expr()]
+        if len(elements) == 1:
+            return elements[0]
+        return Tuple(elements)
 
     def visitAtomExpr(self, ctx):
         atom_ctx = ctx.atom()
@@ -46,21 +103,7 @@ class CustomVisitor(LambdaVisitor):
             id = atom_ctx.ID().getText()
 
             if id in initial_environment:
-                func = initial_environment[id]
-
-                sig = inspect.signature(func)
-
-                params = [
-                    Variable(uuid.uuid4().hex) for _ in range(0, len(sig.parameters))
-                ]
-                body = Application(
-                    BuiltinFunction(uuid.uuid4().hex, id, func), Tuple(params)
-                )
-
-                for param in reversed(params):
-                    body = Abstraction(param, body)
-
-                return body
+                return make_builtin(id)
 
             return Variable(id)
         elif atom_ctx.NUMBER():
@@ -75,62 +118,30 @@ class CustomVisitor(LambdaVisitor):
     def visitIfExpr(self, ctx):
         condition = self.visit(ctx.expr(0))
         then_expr = self.visit(ctx.expr(1))
-        else_expr = self.visit(ctx.expr(2))
+        else_expr = self.visit(ctx.getChild(5))
         return IfExpression(condition, then_expr, else_expr)
 
-    def visitMulDivExpr(self, ctx):
-        left = self.visit(ctx.expr(0))
-        op = ctx.op.text
-        right = self.visit(ctx.expr(1))
-        return BinaryOperation(left, op, right)
-
-    def visitAddSubExpr(self, ctx):
-        left = self.visit(ctx.expr(0))
-        op = ctx.op.text
-        right = self.visit(ctx.expr(1))
-        return BinaryOperation(left, op, right)
-
-    def visitNotExpr(self, ctx):
-        expr = self.visit(ctx.expr())
-        return UnaryOperation("!", expr)
-
-    def visitAndExpr(self, ctx):
-        left = self.visit(ctx.expr(0))
-        right = self.visit(ctx.expr(1))
-        return BinaryOperation(left, "&&", right)
-
-    def visitOrExpr(self, ctx):
-        left = self.visit(ctx.expr(0))
-        right = self.visit(ctx.expr(1))
-        return BinaryOperation(left, "||", right)
-
-    def visitComparisonExpr(self, ctx):
-        left = self.visit(ctx.expr(0))
-        op = ctx.op.text
-        right = self.visit(ctx.expr(1))
-        return BinaryOperation(left, op, right)
-
     def visitLetExpr(self, ctx):
         var = Variable(ctx.ID().getText())
-        bound_expr = self.visit(ctx.expr(0))
-        body = self.visit(ctx.expr(1))
+        bound_expr = self.visit(ctx.expr())
+        body = self.visit(ctx.getChild(5))
         return LetExpression(var, bound_expr, body)
 
-    def visitListExpr(self, ctx):
-        elements = [self.visit(expr) for expr in ctx.expr()] if ctx.expr() else []
-        return List(elements)
+    def visitBracketExpr(self, ctx):
+        body_ctx = ctx.bracketBody()
+        if body_ctx is None:
+            return List([])
+        return self.visit(body_ctx)
 
-    def visitTupleExpr(self, ctx):
-        elements = [self.visit(expr) for expr in ctx.expr()] if ctx.expr() else []
-        return Tuple(elements)
+    def visitBracketBody(self, ctx):
+        elements = [self.visit(expr) for expr in ctx.expr()]
 
-    def visitFullRangeExpr(self, ctx):
-        start = self.visit(ctx.expr(0))
-        step = self.visit(ctx.expr(1))
-        end = self.visit(ctx.expr(2))
-        return RangeExpression(start, end, step)
+        if ctx.dots is None:
+            return List(elements)
 
-    def visitSimpleRangeExpr(self, ctx):
-        start = self.visit(ctx.expr(0))
-        end = self.visit(ctx.expr(1))
-        return RangeExpression(start, end)
+        if len(elements) == 2:
+            start, end = elements
+            return RangeExpression(start, end)
+
+        start, step, end = elements
+        return RangeExpression(start, end, step)